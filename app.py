@@ -5,22 +5,40 @@ A Flask web application that displays live sports scores and fantasy team perfor
 in a retro arcade style interface.
 """
 
-from flask import Flask, render_template, jsonify
-from espn_api.football import League
-from espn_api.basketball import League as BasketballLeague
-from espn_api.baseball import League as BaseballLeague
+from flask import Flask, Blueprint, render_template, jsonify, request, Response, abort, g
+import hashlib
+import importlib
 import json
 import os
 from datetime import datetime
 import time
 import threading
-from dotenv import load_dotenv
-from config import Config
+from config import load_config
+from espn_api.requests.espn_requests import ESPNAccessDenied, ESPNInvalidLeague
+from fetcher import LeagueFetcher, league_config_key
+from transport import EspnTransport, build_pooled_league
+from league_registry import LeagueRegistry, LeagueEntry, fetch_scoreboard
+from snapshot import SnapshotPublisher, save_snapshot, load_snapshot
+from views import ViewQuery, league_token
+from records import FantasyTeam, encode_json, team_record_id
+from lookup_cache import LookupCache
+from broadcaster import Broadcaster
+from scheduler import RefreshScheduler
+from league_cache import LeagueResultCache
+from history import FantasyHistory
+from players import PlayerBoxScores, matchup_document_name
+from standings import StandingsBook, compute_standings, standings_document_name, team_signature
+from metrics import MetricsRegistry
+from providers import (ScoresPipeline, SampleScoresProvider, FixtureScoresProvider,
+                       ESPNScoreboardProvider)
 
-# Load environment variables
-load_dotenv()
+routes = Blueprint('arcade', __name__)
 
-app = Flask(__name__)
+# Development-only pages, registered only when DEBUG is on
+dev_routes = Blueprint('arcade_dev', __name__)
+
+# Read-only configuration, parsed once by create_app()
+config = None
 
 # Global data storage
 sports_data = {
@@ -33,6 +51,56 @@ sports_data = {
     "fantasy_teams": []
 }
 
+# Encoded snapshot of sports_data served by the API, replaced on every update
+snapshot_publisher = None
+
+# Wakes /api/stream clients whenever a new snapshot is published
+broadcaster = Broadcaster()
+
+# Score movement of every fantasy team, recorded on each refresh
+fantasy_history = None
+
+# Named screens, each showing its own league set from the shared snapshot
+display_profiles = {}
+
+# Process metrics served at /metrics; hot paths only touch per-metric locks
+metrics_registry = MetricsRegistry()
+league_fetch_seconds = metrics_registry.histogram(
+    'arcade_league_fetch_seconds', 'Time to refresh one fantasy league, including failures',
+    ('league_id', 'sport'))
+league_fetch_errors = metrics_registry.counter(
+    'arcade_league_fetch_errors_total', 'Fantasy league refreshes that failed or timed out',
+    ('league_id', 'sport'))
+refresh_cycle_seconds = metrics_registry.histogram(
+    'arcade_refresh_cycle_seconds', 'Duration of one full data refresh cycle')
+snapshot_bytes = metrics_registry.gauge(
+    'arcade_snapshot_bytes', 'Size of the current snapshot body', ('encoding',))
+metrics_registry.callback(
+    'arcade_snapshot_version', 'Version of the snapshot being served',
+    lambda: snapshot_publisher.current().version if snapshot_publisher else 0)
+http_requests = metrics_registry.counter(
+    'arcade_http_requests_total', 'HTTP requests served', ('route', 'method', 'status'))
+http_request_seconds = metrics_registry.histogram(
+    'arcade_http_request_seconds', 'Time to build an HTTP response (streams: until the first byte)',
+    ('route',))
+metrics_registry.callback(
+    'arcade_stream_clients', 'Connected /api/stream clients', lambda: broadcaster.client_count)
+metrics_registry.callback(
+    'arcade_espn_http_total', 'ESPN HTTP requests, retries and failed requests',
+    lambda: {(kind,): espn_transport.snapshot_stats()[kind] for kind in ('requests', 'retries', 'errors')}
+    if espn_transport else {}, ('kind',), metric_type='counter')
+metrics_registry.callback(
+    'arcade_espn_received_bytes_total', 'Response bytes received from ESPN',
+    lambda: espn_transport.snapshot_stats()['bytes'] if espn_transport else 0, metric_type='counter')
+
+def record_snapshot_metrics(snapshot):
+    snapshot_bytes.set(len(snapshot.body), 'identity')
+    snapshot_bytes.set(len(snapshot.gzip_body), 'gzip')
+
+# Multi-process mode: one elected fetcher shares snapshots with every worker
+shared_store = None
+fetcher_lock = None
+
 def get_sample_sports_data():
     """Generate sample sports data for demonstration"""
     return {
@@ -41,6 +109,7 @@ def get_sample_sports_data():
             "football": {
                 "games": [
                     {
+                        "id": "football-sample-1",
                         "home_team": "Kansas City Chiefs",
                         "away_team": "Buffalo Bills",
                         "home_score": 24,
@@ -50,6 +119,7 @@ def get_sample_sports_data():
                         "status": "Final"
                     },
                     {
+                        "id": "football-sample-2",
                         "home_team": "San Francisco 49ers",
                         "away_team": "Dallas Cowboys",
                         "home_score": 17,
@@ -59,6 +129,7 @@ def get_sample_sports_data():
                         "status": "Live"
                     },
                     {
+                        "id": "football-sample-3",
                         "home_team": "Green Bay Packers",
                         "away_team": "Chicago Bears",
                         "home_score": 28,
@@ -72,6 +143,7 @@ def get_sample_sports_data():
             "basketball": {
                 "games": [
                     {
+                        "id": "basketball-sample-1",
                         "home_team": "Los Angeles Lakers",
                         "away_team": "Golden State Warriors",
                         "home_score": 108,
@@ -81,6 +153,7 @@ def get_sample_sports_data():
                         "status": "Live"
                     },
                     {
+                        "id": "basketball-sample-2",
                         "home_team": "Boston Celtics",
                         "away_team": "Miami Heat",
                         "home_score": 95,
@@ -94,6 +167,7 @@ def get_sample_sports_data():
             "baseball": {
                 "games": [
                     {
+                        "id": "baseball-sample-1",
                         "home_team": "New York Yankees",
                         "away_team": "Boston Red Sox",
                         "home_score": 6,
@@ -106,194 +180,864 @@ def get_sample_sports_data():
         },
         "fantasy_teams": [
             {
+                "id": "sample-nfl-1",
                 "name": "Team Alpha",
                 "owner": "John Doe",
                 "points": 145.6,
                 "opponent": "Team Beta",
                 "opponent_points": 132.3,
                 "status": "Winning",
-                "league": "NFL Fantasy"
+                "league": "NFL Fantasy",
+                "league_id": "sample-nfl",
+                "sport": "football"
             },
             {
+                "id": "sample-nfl-2",
                 "name": "Team Beta",
                 "owner": "Jane Smith",
                 "points": 132.3,
                 "opponent": "Team Alpha",
                 "opponent_points": 145.6,
                 "status": "Losing",
-                "league": "NFL Fantasy"
+                "league": "NFL Fantasy",
+                "league_id": "sample-nfl",
+                "sport": "football"
             },
             {
+                "id": "sample-nba-1",
                 "name": "Dunk Masters",
                 "owner": "Mike Johnson",
                 "points": 112.8,
                 "opponent": "Three Point Kings",
                 "opponent_points": 108.4,
                 "status": "Winning",
-                "league": "NBA Fantasy"
+                "league": "NBA Fantasy",
+                "league_id": "sample-nba",
+                "sport": "basketball"
             },
             {
+                "id": "sample-nba-2",
                 "name": "Three Point Kings",
                 "owner": "Sarah Wilson",
                 "points": 108.4,
                 "opponent": "Dunk Masters",
                 "opponent_points": 112.8,
                 "status": "Losing",
-                "league": "NBA Fantasy"
+                "league": "NBA Fantasy",
+                "league_id": "sample-nba",
+                "sport": "basketball"
             }
         ]
     }
 
-def get_real_fantasy_data():
-    """Get real fantasy data from ESPN API if configured"""
-    try:
-        # Get ESPN authentication credentials
-        espn_s2 = Config.ESPN_S2
-        swid = Config.ESPN_SWID
-        
-        # Get configured leagues
-        leagues = Config.get_fantasy_leagues()
-        
-        if not leagues:
-            print("No fantasy leagues configured")
-            return None
+# espn_api module per sport; each is imported only once a league of that sport is used
+SPORT_LEAGUE_MODULES = {
+    'football': 'espn_api.football',
+    'basketball': 'espn_api.basketball',
+    'baseball': 'espn_api.baseball'
+}
+_league_classes = {}
+
+def get_league_class(sport):
+    """ESPN League class for a sport, importing its module on first use"""
+    league_class = _league_classes.get(sport)
+    if league_class is None:
+        module_name = SPORT_LEAGUE_MODULES.get(sport)
+        if module_name is None:
+            raise ValueError(f"Unknown sport: {sport}")
+        league_class = _league_classes[sport] = importlib.import_module(module_name).League
+    return league_class
+
+# Fetch layer, built by create_app() from the configuration
+league_fetcher = None
+
+# Every ESPN request shares one pool of keep-alive connections
+espn_transport = None
+
+def build_league(league_config):
+    """Build an ESPN League object for a configured league from scratch"""
+    return build_pooled_league(get_league_class(league_config['sport']), espn_transport,
+                               league_id=league_config['league_id'], year=league_config['year'],
+                               espn_s2=config.ESPN_S2, swid=config.ESPN_SWID)
+
+league_registry = LeagueRegistry(build_league)
+
+# Per-player lines of every tracked league, updated from the same scoreboard fetch
+player_box_scores = PlayerBoxScores()
+
+# Standings and power rankings of every tracked league, recomputed when a league's teams change
+league_standings = StandingsBook()
+
+# Created on the first refresh with real data so NumPy is only imported when needed;
+# False when NumPy is not installed
+win_probability_engine = None
+
+def attach_win_probabilities(fantasy_teams):
+    """Set each live matchup's win probability on the FantasyTeam records in place
+    
+    Probabilities are simulated for all leagues in one pass and reused
+    until a player line or matchup changes.
+    """
+    global win_probability_engine
+    if config.WIN_PROBABILITY_SIMULATIONS <= 0 or win_probability_engine is False:
+        return
+    if win_probability_engine is None:
+        try:
+            from win_probability import WinProbabilityEngine
+        except ImportError as e:
+            print(f"⚠️  Win probabilities disabled: {e}")
+            win_probability_engine = False
+            return
+        win_probability_engine = WinProbabilityEngine(simulations=config.WIN_PROBABILITY_SIMULATIONS,
+                                                      spread=config.WIN_PROBABILITY_SPREAD)
+    
+    probabilities = win_probability_engine.probabilities(player_box_scores.simulation_inputs(),
+                                                         revision=player_box_scores.revision())
+    for team in fantasy_teams:
+        probability = probabilities.get(((team.league_id, team.sport, team.year), team.team_id))
+        team.assign(win_probability=round(probability, 3) if probability is not None else None)
+
+# Ad-hoc /api/fantasy-league lookups, cached and coalesced per league
+league_lookup_cache = None
+
+# Per-league refresh times, and the last good teams of every league between refreshes
+refresh_scheduler = None
+league_cache = None
+
+def build_scores_pipeline():
+    """Create one scores provider per enabled sport from configuration"""
+    intervals = config.get_scores_refresh_intervals()
+    providers = []
+    for sport, enabled in config.ENABLED_SPORTS.items():
+        if not enabled:
+            continue
+        interval = intervals.get(sport, config.UPDATE_INTERVAL)
+        if config.SCORES_PROVIDER == 'espn':
+            providers.append(ESPNScoreboardProvider(sport, interval, session=espn_transport))
+        elif config.SCORES_PROVIDER == 'fixture':
+            providers.append(FixtureScoresProvider(sport, config.SCORES_FIXTURE_PATH, interval))
+        else:
+            sample_games = lambda sport=sport: get_sample_sports_data()["sports"][sport]["games"]
+            providers.append(SampleScoresProvider(sport, sample_games, interval,
+                                                  update_chance=config.SAMPLE_DATA_UPDATE_CHANCE))
+    return ScoresPipeline(providers)
+
+# Pro game scores, refreshed per sport and shared by every display
+scores_pipeline = None
+
+def team_owner(team):
+    """Display name of a team's first owner (espn_api lists owners as league members)"""
+    owners = getattr(team, 'owners', None) or []
+    if not owners:
+        return getattr(team, 'owner', 'Unknown')
+    owner = owners[0]
+    name = f"{owner.get('firstName', '')} {owner.get('lastName', '')}".strip()
+    return name or owner.get('displayName', 'Unknown')
+
+def refresh_league(league_config):
+    """Refresh one configured league's scoreboard, player lines and standings
+    
+    Runs on a fetcher worker; returns the league's registry entry, whose
+    matchup index update_fantasy_teams() applies on the refresh thread.
+    """
+    league_id = league_config['league_id']
+    sport = league_config['sport']
+    year = league_config['year']
+    league_name = league_config['name']
+    
+    print(f"Fetching data for {league_name} (ID: {league_id}, Sport: {sport}, Year: {year})")
+    
+    # Built once, then only the current scoreboard is refreshed each cycle
+    entry = league_registry.refresh(league_config)
+    player_box_scores.ingest(league_config_key(league_config), league_id, sport, entry.scoreboard,
+                             {team_id: team.team_name for team_id, team in entry.teams_by_id.items()})
+    league_standings.update(league_config_key(league_config), league_config, entry.league.teams,
+                            {team.team_id: team_owner(team) for team in entry.league.teams})
+    return entry
+
+def update_fantasy_teams(league_config, entry, teams):
+    """Update a league's FantasyTeam records in place from this week's matchups
+    
+    `teams` are the league's records from its last refresh; a record is only
+    created for a team seen for the first time, and one whose fields did not
+    change keeps its encoded fragment. Returns the records in league order and
+    whether any matchup score moved.
+    """
+    league_id, sport, year = league_config_key(league_config)
+    existing = {team.id: team for team in teams}
+    records = []
+    scores_moved = len(teams) != len(entry.league.teams)
+    for team in entry.league.teams:
+        record_id = team_record_id(league_id, sport, year, team.team_id)
+        record = existing.get(record_id)
+        if record is None:
+            record = FantasyTeam(record_id)
+            scores_moved = True
         
-        all_fantasy_teams = []
+        matchup = entry.matchup_index.get(team.team_id)
+        if matchup is None:
+            opponent_name, points, opponent_points, status, matchup_id = "TBD", 0.0, 0.0, "Bye", None
+        else:
+            opponent = entry.teams_by_id.get(matchup.opponent_id)
+            opponent_name = opponent.team_name if opponent else "BYE"
+            points, opponent_points = matchup.points, matchup.opponent_points
+            status, matchup_id = matchup.status, matchup.matchup_id
         
-        for league_config in leagues:
-            try:
-                league_id = league_config['league_id']
-                sport = league_config['sport']
-                year = league_config['year']
-                league_name = league_config['name']
-                
-                print(f"Fetching data for {league_name} (ID: {league_id}, Sport: {sport}, Year: {year})")
-                
-                # Get league data based on sport with authentication
-                if sport == 'football':
-                    league = League(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
-                elif sport == 'basketball':
-                    league = BasketballLeague(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
-                elif sport == 'baseball':
-                    league = BaseballLeague(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
-                else:
-                    print(f"Unknown sport: {sport}")
-                    continue
-                
-                # Convert league data to our format
-                for team in league.teams:
-                    # Find current opponent (simplified - you'd need to get actual matchup data)
-                    opponent = None
-                    for other_team in league.teams:
-                        if other_team != team:
-                            opponent = other_team
-                            break
-                    
-                    all_fantasy_teams.append({
-                        "name": team.team_name,
-                        "owner": team.owner,
-                        "points": float(team.points_for),
-                        "opponent": opponent.team_name if opponent else "TBD",
-                        "opponent_points": float(opponent.points_for) if opponent else 0.0,
-                        "status": "Winning" if team.points_for > (opponent.points_for if opponent else 0) else "Losing",
-                        "league": league_name
-                    })
-                
-                print(f"✅ Successfully loaded {len(league.teams)} teams from {league_name}")
-                
-            except Exception as e:
-                print(f"❌ Error loading league {league_config.get('name', 'Unknown')}: {e}")
+        if record.points != points or record.opponent_points != opponent_points:
+            scores_moved = True
+        record.assign(team_id=team.team_id, name=team.team_name, owner=team_owner(team), points=points,
+                      opponent=opponent_name, opponent_points=opponent_points, status=status,
+                      league=league_config['name'], league_id=league_id, sport=sport, year=year,
+                      matchup_id=matchup_id)
+        records.append(record)
+    return records, scores_moved
+
+def load_league_summary(league_config):
+    """Teams, standings and current scoreboard of a league, for on-demand lookups
+    
+    A league the display already tracks is answered from its registry entry;
+    any other league is built and its scoreboard fetched once.
+    """
+    entry = league_registry.get(league_config)
+    if entry is None:
+        entry = LeagueEntry(league_config, build_league(league_config))
+        entry.apply_scoreboard(fetch_scoreboard(entry.league))
+    
+    teams = []
+    for team in entry.league.teams:
+        teams.append({
+            "team_id": team.team_id,
+            "name": team.team_name,
+            "owner": team_owner(team),
+            "wins": getattr(team, 'wins', 0),
+            "losses": getattr(team, 'losses', 0),
+            "ties": getattr(team, 'ties', 0),
+            "points_for": getattr(team, 'points_for', 0),
+            "points_against": getattr(team, 'points_against', 0),
+            "standing": getattr(team, 'final_standing', 0) or getattr(team, 'standing', 0)
+        })
+    
+    # Same order as /api/standings for a tracked league
+    standings = compute_standings(league_config, [team_signature(team, summary["owner"])
+                                                  for team, summary in zip(entry.league.teams, teams)])
+    
+    scoreboard = []
+    seen_matchups = set()
+    for team_id, matchup in entry.matchup_index.items():
+        if matchup.matchup_id in seen_matchups:
+            continue
+        seen_matchups.add(matchup.matchup_id)
+        team = entry.teams_by_id.get(team_id)
+        opponent = entry.teams_by_id.get(matchup.opponent_id)
+        scoreboard.append({
+            "matchup_id": matchup.matchup_id,
+            "team": team.team_name if team else None,
+            "points": matchup.points,
+            "opponent": opponent.team_name if opponent else "BYE",
+            "opponent_points": matchup.opponent_points,
+            "status": matchup.status
+        })
+    
+    return {
+        "league_id": league_config['league_id'],
+        "sport": league_config['sport'],
+        "year": league_config['year'],
+        "week": getattr(entry.league, 'current_week', None),
+        "teams": teams,
+        "standings": [{"team_id": row["team_id"], "name": row["name"], "wins": row["wins"],
+                       "losses": row["losses"], "ties": row["ties"], "standing": row["rank"]}
+                      for row in standings],
+        "scoreboard": scoreboard,
+        "fetched_at": datetime.now().isoformat()
+    }
+
+def refresh_fantasy_leagues(leagues, keys):
+    """Fetch the due leagues and apply each result to its cached FantasyTeam records
+    
+    A league whose fetch or conversion fails keeps its cached teams, marked
+    stale, and backs off on its own; other leagues are not affected.
+    """
+    # Only leagues whose scheduled refresh time has come are fetched,
+    # and never a league whose circuit breaker is open. Leagues of a sport
+    # with pro games in progress stay on the live interval
+    configured = set(keys)
+    live_sports = scores_pipeline.live_sports()
+    refresh_scheduler.sync(keys)
+    refresh_scheduler.hold_live([key for key in keys if key[1] in live_sports])
+    league_registry.sync(keys)
+    league_cache.sync(keys)
+    player_box_scores.sync(keys)
+    league_standings.sync(keys)
+    due = set()
+    for key in refresh_scheduler.pop_due():
+        if league_cache.allow_fetch(key):
+            due.add(key)
+        else:
+            refresh_scheduler.defer(key, league_cache.retry_at(key) or time.time() + config.UPDATE_INTERVAL)
+    due_leagues = [league for league in leagues if league_config_key(league) in due]
+    
+    # Fetch due leagues concurrently. Leagues slower than the cycle timeout
+    # finish in the background and are merged by a later cycle
+    handled = set()
+    try:
+        for result in league_fetcher.fetch_all(due_leagues, refresh_league):
+            key = league_config_key(result.league_config)
+            handled.add(key)
+            if key not in configured:
                 continue
-        
-        return all_fantasy_teams
-        
-    except Exception as e:
-        print(f"Error getting real fantasy data: {e}")
+            league_name = result.league_config.get('name', 'Unknown')
+            labels = (result.league_config['league_id'], result.league_config['sport'])
+            league_fetch_seconds.observe(result.elapsed, *labels)
+            
+            error = result.error
+            if error is None:
+                try:
+                    teams, scores_moved = update_fantasy_teams(result.league_config, result.value,
+                                                               league_cache.teams(key))
+                except Exception as e:
+                    error = e
+            if error is not None:
+                league_fetch_errors.inc(*labels)
+                print(f"❌ Error loading league {league_name}: {type(error).__name__}: {error}")
+                league_cache.record_failure(key, error)
+                refresh_scheduler.record_failure(key)
+                continue
+            
+            league_cache.record_success(key, teams)
+            # A league with a matchup in play stays live even while its score
+            # holds still, whether or not the scores provider reports live games
+            refresh_scheduler.record_success(key, active=scores_moved or key[1] in live_sports
+                                             or player_box_scores.in_play(key))
+            print(f"✅ Successfully loaded {len(teams)} teams from {league_name} in {result.elapsed:.1f}s")
+    except Exception:
+        # Leagues popped from the schedule but never handled would not be refreshed again
+        for key in due - handled:
+            refresh_scheduler.defer(key, time.time() + config.UPDATE_INTERVAL)
+        raise
+
+def get_real_fantasy_data():
+    """Teams of every configured league, or None if no league is configured
+    
+    Leagues are refreshed as they come due. Every configured league is then
+    served from its last good teams, so neither a failing league nor an
+    unexpected error in the refresh cycle blanks the display.
+    """
+    # Get configured leagues; a league shown by several display profiles
+    # is fetched once and its teams are shared by every profile
+    leagues = config.get_all_fantasy_leagues()
+    if not leagues:
+        print("No fantasy leagues configured")
         return None
+    
+    keys = [league_config_key(league) for league in leagues]
+    try:
+        refresh_fantasy_leagues(leagues, keys)
+    except Exception as e:
+        print(f"❌ Error refreshing fantasy leagues: {type(e).__name__}: {e}")
+    
+    # Merge the last good teams of every league in config order; a failing
+    # league keeps showing its cached teams marked stale
+    all_fantasy_teams = []
+    for key in keys:
+        all_fantasy_teams.extend(league_cache.teams(key))
+    return all_fantasy_teams
+
+# Sample fantasy teams shown when no league is configured, built once
+sample_fantasy_teams = None
+
+def simulate_sample_fantasy_teams():
+    """Sample FantasyTeam records with a few scores nudged, as if games were live"""
+    global sample_fantasy_teams
+    import random
+    if sample_fantasy_teams is None:
+        sample_fantasy_teams = []
+        for team in get_sample_sports_data()["fantasy_teams"]:
+            record = FantasyTeam(team["id"])
+            record.update(team)
+            sample_fantasy_teams.append(record)
+    
+    for team in sample_fantasy_teams:
+        if random.random() < 0.2:  # 20% chance to update
+            points = team.points + random.uniform(0.1, 2.0)
+            opponent_points = team.opponent_points + random.uniform(0.1, 2.0)
+            team.assign(points=points, opponent_points=opponent_points,
+                        status="Winning" if points > opponent_points else "Losing")
+    return sample_fantasy_teams
+
+def get_league_status():
+    """Age and health of every configured league's cached data"""
+    now = time.time()
+    statuses = []
+    for league in config.get_all_fantasy_leagues():
+        status = league_cache.status(league_config_key(league), now)
+        status.update(league_id=league['league_id'], sport=league['sport'], year=league['year'], name=league['name'])
+        statuses.append(status)
+    return statuses
 
 def update_sports_data():
     """Update sports data periodically"""
     global sports_data
     
-    # Get base sample data
-    sports_data = get_sample_sports_data()
+    # Game scores come from the configured providers
+    sports_data = {"timestamp": datetime.now().isoformat(), "sports": scores_pipeline.refresh()}
     
-    # Try to get real fantasy data
-    real_fantasy_data = get_real_fantasy_data()
-    if real_fantasy_data:
-        sports_data["fantasy_teams"] = real_fantasy_data
-        print("✅ Using real ESPN fantasy data")
+    # Sample fantasy teams only stand in when no league is configured; a
+    # configured league that has not loaded yet shows as empty with its status.
+    # Either way the teams are FantasyTeam records updated in place
+    if config.get_all_fantasy_leagues():
+        fantasy_teams = get_real_fantasy_data()
+        try:
+            attach_win_probabilities(fantasy_teams)
+        except Exception as e:
+            # Teams keep their last probabilities rather than going unpublished
+            print(f"⚠️  Win probabilities not updated: {type(e).__name__}: {e}")
+        sports_data["leagues"] = get_league_status()
+        if fantasy_teams:
+            print("✅ Using real ESPN fantasy data")
+        else:
+            print("⚠️  No fantasy league has loaded yet")
     else:
+        fantasy_teams = simulate_sample_fantasy_teams()
         print("📊 Using sample fantasy data")
+    sports_data["fantasy_teams"] = fantasy_teams
     
-    # Simulate some data changes for sports scores
-    import random
-    if sports_data["sports"]["football"]["games"]:
-        game = sports_data["sports"]["football"]["games"][1]
-        if game["status"] == "Live":
-            # Randomly update scores
-            if random.random() < 0.3:  # 30% chance to update
-                game["home_score"] += random.randint(0, 3)
-                game["away_score"] += random.randint(0, 3)
-    
-    # Only simulate changes for fantasy data if using sample data
-    if not real_fantasy_data and sports_data["fantasy_teams"]:
-        for team in sports_data["fantasy_teams"]:
-            if random.random() < 0.2:  # 20% chance to update
-                team["points"] += random.uniform(0.1, 2.0)
-                team["opponent_points"] += random.uniform(0.1, 2.0)
-                # Update status
-                if team["points"] > team["opponent_points"]:
-                    team["status"] = "Winning"
-                else:
-                    team["status"] = "Losing"
+    fantasy_history.record((team.id, team.points, team.opponent_points) for team in fantasy_teams)
+    
+    # Encode once here so API requests only serve cached bytes
+    snapshot = snapshot_publisher.publish(sports_data)
+    if shared_store is not None:
+        shared_store.write(snapshot)
+        publish_shared_documents()
+    broadcaster.publish(snapshot.version)
+    record_snapshot_metrics(snapshot)
+    
+    # Keep the last good snapshot on disk for a warm restart
+    if config.SNAPSHOT_PATH:
+        try:
+            save_snapshot(snapshot, config.SNAPSHOT_PATH)
+        except OSError as e:
+            print(f"⚠️  Could not save snapshot to {config.SNAPSHOT_PATH}: {e}")
+
+def publish_shared_documents():
+    """Share bodies only the fetcher can build with the other worker processes"""
+    documents = {matchup_document_name(key, matchup_id): body
+                 for (key, matchup_id), body in player_box_scores.matchup_bodies()}
+    documents.update(league_standings.documents())
+    shared_store.sync_documents(documents)
+
+def shared_document(name, build):
+    """(body, etag) of a cached body, or None if there is none
+    
+    The fetcher process builds it with build(); other worker processes read
+    what the fetcher published under `name`.
+    """
+    if shared_store is None or fetcher_lock.held:
+        return build()
+    return shared_store.read_document(name)
 
 def data_update_loop():
     """Background thread to update data"""
     while True:
-        update_sports_data()
-        time.sleep(30)  # Update every 30 seconds
+        started = time.perf_counter()
+        try:
+            update_sports_data()
+        except Exception as e:
+            # One failed cycle (e.g. a locked shared store) must not stop refreshing
+            print(f"❌ Refresh cycle failed: {type(e).__name__}: {e}")
+        refresh_cycle_seconds.observe(time.perf_counter() - started)
+        
+        # Sleep until the next league or scores provider is due, at most UPDATE_INTERVAL,
+        # or until a league that outlasted the last cycle finishes
+        next_update = time.time() + config.UPDATE_INTERVAL
+        for next_due in (refresh_scheduler.next_due(), scores_pipeline.next_due()):
+            if next_due is not None:
+                next_update = min(next_update, next_due)
+        league_fetcher.wait_for_late_result(max(1.0, next_update - time.time()))
+
+def follow_shared_store():
+    """Install snapshots published by the fetcher process; returns how many were new"""
+    current = snapshot_publisher.current()
+    installed = 0
+    for snapshot in shared_store.read_since(current.version if current else 0):
+        if snapshot_publisher.install(snapshot):
+            installed += 1
+    if installed:
+        current = snapshot_publisher.current()
+        fantasy_history.record((team["id"], team.get("points"), team.get("opponent_points"))
+                               for team in json.loads(current.body)["fantasy_teams"])
+        broadcaster.publish(current.version)
+        record_snapshot_metrics(current)
+    return installed
 
-@app.route('/')
+def shared_store_loop():
+    """Background thread for multi-process mode
+    
+    Every worker follows the shared store until it wins the fetcher lock,
+    then catches up with the store and runs the normal update loop. When the
+    fetcher process exits its lock is released and another worker takes over.
+    """
+    while not fetcher_lock.try_acquire():
+        try:
+            follow_shared_store()
+        except Exception as e:
+            print(f"⚠️  Could not read the shared store: {type(e).__name__}: {e}")
+        time.sleep(config.SHARED_STORE_POLL)
+    
+    print(f"🔒 Process {os.getpid()} elected as the data fetcher")
+    try:
+        try:
+            follow_shared_store()
+        except Exception as e:
+            print(f"⚠️  Could not catch up with the shared store: {type(e).__name__}: {e}")
+        data_update_loop()
+    finally:
+        # Let another worker take over if this loop ever stops
+        fetcher_lock.release()
+
+def restore_snapshot():
+    """Serve the snapshot saved by the previous run until the first refresh lands"""
+    if not config.SNAPSHOT_PATH:
+        return False
+    snapshot = load_snapshot(config.SNAPSHOT_PATH)
+    if snapshot is None or not snapshot_publisher.install(snapshot):
+        return False
+    print(f"♻️  Restored snapshot v{snapshot.version} from {snapshot.meta.get('timestamp')}")
+    return True
+
+def start_background_updater():
+    """Start the data update thread for this process
+    
+    The last saved snapshot is restored first so the server can answer
+    immediately. With SHARED_STORE_PATH set, only one process per host
+    fetches from ESPN and the others serve what it publishes to the shared
+    store.
+    """
+    global shared_store, fetcher_lock
+    
+    restore_snapshot()
+    
+    if config.SHARED_STORE_PATH:
+        # Only multi-process deployments need SQLite and file locking
+        from shared_store import SharedSnapshotStore, FetcherLock
+        shared_store = SharedSnapshotStore(config.SHARED_STORE_PATH, history_size=config.SNAPSHOT_HISTORY)
+        fetcher_lock = FetcherLock(config.SHARED_STORE_PATH + '.lock')
+        target = shared_store_loop
+    else:
+        target = data_update_loop
+    
+    update_thread = threading.Thread(target=target, daemon=True)
+    update_thread.start()
+    return update_thread
+
+@routes.before_app_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@routes.after_app_request
+def record_request_metrics(response):
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    started = g.get('request_started')
+    if started is not None:
+        http_request_seconds.observe(time.perf_counter() - started, route)
+    http_requests.inc(route, request.method, response.status_code)
+    return response
+
+@routes.route('/metrics')
+def get_metrics():
+    """Process metrics in the Prometheus text format"""
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
+
+@routes.route('/')
 def index():
     """Main arcade display page"""
     return render_template('arcade_display.html')
 
-@app.route('/api/sports-data')
+@routes.route('/d/<profile>')
+def profile_display(profile):
+    """Arcade display for one display profile's leagues"""
+    if profile not in display_profiles:
+        abort(404)
+    return render_template('arcade_display.html', profile=profile)
+
+@dev_routes.route('/bench/render')
+def bench_render():
+    """Browser benchmark of card rendering with synthetic data (?cards=600&updates=60)"""
+    return render_template('bench_render.html')
+
+def snapshot_response(snapshot):
+    """Serve a pre-encoded snapshot (or view) with ETag revalidation and gzip
+    
+    The gzip and identity bodies are different representations, so they get
+    different strong ETags: the body hash, plus "-gz" for the gzip body. A
+    client revalidating either one gets a 304 carrying the tag it sent.
+    """
+    gzip_etag = f"{snapshot.etag}-gz"
+    if gzip_etag in request.if_none_match:
+        response = Response(status=304)
+        etag = gzip_etag
+    elif snapshot.etag in request.if_none_match:
+        response = Response(status=304)
+        etag = snapshot.etag
+    elif request.accept_encodings['gzip']:
+        response = Response(snapshot.gzip_body, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        etag = gzip_etag
+    else:
+        response = Response(snapshot.body, mimetype='application/json')
+        etag = snapshot.etag
+    
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def request_view_query():
+    """ViewQuery of the request's filters and profile, or None; aborts 404 for an unknown profile"""
+    profile = request.args.get('profile')
+    leagues = None
+    if profile is not None:
+        if profile not in display_profiles:
+            response = jsonify({"error": f"Unknown display profile: {profile}"})
+            response.status_code = 404
+            abort(response)
+        leagues = [league_token(league['league_id'], league['sport'], league['year'])
+                   for league in display_profiles[profile]]
+    return ViewQuery.from_args(request.args, leagues=leagues)
+
+@routes.route('/api/sports-data')
 def get_sports_data():
-    """API endpoint to get current sports data"""
-    return jsonify(sports_data)
+    """API endpoint to get current sports data
+    
+    With ?since=<version> only the games and fantasy teams that changed after
+    that version are returned, or the full snapshot if it is too far behind.
+    
+    ?league=, ?sport= and ?status= (game status) and ?team_status= (fantasy
+    team status), all comma-separated and case-insensitive, and
+    ?page=/?limit= return a filtered view instead, answered from the
+    snapshot's index and cached per query until the next refresh.
+    ?profile=<name> limits the view to a display profile's leagues.
+    """
+    query = request_view_query()
+    if query is not None:
+        return snapshot_response(snapshot_publisher.current().view(query))
+    
+    since = request.args.get('since', type=int)
+    if since is not None:
+        delta = snapshot_publisher.delta_since(since)
+        if delta is not None:
+            response = Response(delta, mimetype='application/json')
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+    
+    return snapshot_response(snapshot_publisher.current())
 
-@app.route('/api/fantasy-league/<int:league_id>/<int:year>')
+def stream_event(snapshot, since, query=None):
+    """Format one SSE event: a delta from `since` if possible, else the full snapshot or view"""
+    body = snapshot_publisher.delta_since(since, snapshot, query) if since is not None else None
+    event = 'delta' if body is not None else 'snapshot'
+    if body is None:
+        body = snapshot.view(query).body if query is not None else snapshot.body
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (snapshot.version, event.encode(), body)
+
+@routes.route('/api/stream')
+def stream_sports_data():
+    """Server-Sent Events stream of sports data updates
+    
+    Sends the full snapshot on connect, then a delta after every refresh.
+    Reconnecting clients resume from their Last-Event-ID. Takes the same
+    filters and ?profile= as /api/sports-data; a filtered stream sends the
+    view and deltas of just that view (paginated views are resent whole).
+    """
+    query = request_view_query()
+    last_version = request.headers.get('Last-Event-ID', type=int)
+    if last_version is None:
+        last_version = request.args.get('since', type=int)
+    
+    def events(version):
+        with broadcaster.subscription():
+            while True:
+                snapshot = snapshot_publisher.current()
+                if version is None or snapshot.version != version:
+                    yield stream_event(snapshot, version, query)
+                    version = snapshot.version
+                    continue
+                
+                if broadcaster.wait_for_update(version, timeout=config.STREAM_KEEPALIVE) <= version:
+                    # Keep proxies and the browser from timing out an idle stream
+                    yield b": keepalive\n\n"
+    
+    response = Response(events(last_version), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+def cached_json_response(body, etag):
+    """Serve a cached JSON body with ETag revalidation"""
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@routes.route('/api/fantasy-matchup/<int:league_id>/<int:year>/<int:matchup_id>')
+def get_fantasy_matchup(league_id, year, matchup_id):
+    """Player breakdown of one current matchup of a tracked league
+    
+    ?sport=football|basketball|baseball picks the league (default ESPN_SPORT).
+    Each side lists its roster with slot, live points and projection, plus
+    starter totals. The body is cached until a player in the matchup changes.
+    """
+    key = league_config_key({'league_id': league_id, 'sport': request.args.get('sport', config.ESPN_SPORT),
+                             'year': year})
+    
+    def build():
+        body = player_box_scores.matchup_body(key, matchup_id)
+        return (body, hashlib.blake2b(body, digest_size=16).hexdigest()) if body is not None else None
+    
+    document = shared_document(matchup_document_name(key, matchup_id), build)
+    if document is None:
+        return jsonify({"error": f"No matchup {matchup_id} in league {league_id}"}), 404
+    return cached_json_response(*document)
+
+@routes.route('/api/standings')
+def get_standings_leaderboard():
+    """Every tracked fantasy team across all leagues, in power ranking order
+    
+    Each team carries its league standing, record, points for/against ranks
+    and power score plus its overall rank. The body is rebuilt only after a
+    league's standings changed.
+    """
+    document = shared_document("standings", league_standings.leaderboard)
+    if document is None:
+        return jsonify({"error": "Standings have not been published yet"}), 503
+    return cached_json_response(*document)
+
+@routes.route('/api/standings/<int:league_id>/<int:year>')
+def get_league_standings(league_id, year):
+    """Standings and power rankings of one tracked league, served from cache
+    
+    ?sport=football|basketball|baseball picks the league (default ESPN_SPORT).
+    """
+    key = league_config_key({'league_id': league_id, 'sport': request.args.get('sport', config.ESPN_SPORT),
+                             'year': year})
+    document = shared_document(standings_document_name(key), lambda: league_standings.league(key))
+    if document is None:
+        return jsonify({"error": f"No standings for league {league_id} ({key[1]}, {year})"}), 404
+    return cached_json_response(*document)
+
+@routes.route('/api/fantasy-history/<team_id>')
+def get_fantasy_history(team_id):
+    """Score history of one fantasy team for sparklines
+    
+    Returns parallel lists of timestamps, points and opponent points, oldest
+    first. The whole series is thinned out evenly as it grows, so every team
+    keeps at most HISTORY_POINTS points spread over its full history.
+    """
+    history = fantasy_history.get(team_id)
+    if history is None:
+        return jsonify({"error": f"No history for team {team_id}"}), 404
+    return jsonify(history)
+
+@routes.route('/api/fantasy-league/<int:league_id>/<int:year>')
 def get_fantasy_league_data(league_id, year):
-    """API endpoint to get fantasy league data from ESPN"""
+    """API endpoint to get fantasy league data from ESPN
+    
+    Returns teams, standings and the current scoreboard of any league
+    (?sport=football|basketball|baseball, default ESPN_SPORT). Results are
+    cached for LEAGUE_LOOKUP_TTL seconds and concurrent lookups of the same
+    league share one ESPN fetch. An unknown league is a 404 and a private
+    league the configured ESPN cookies cannot read is a 403.
+    """
+    sport = request.args.get('sport', config.ESPN_SPORT)
+    if sport not in SPORT_LEAGUE_MODULES:
+        return jsonify({"error": f"Unknown sport: {sport}"}), 400
+    
+    league_config = {'league_id': league_id, 'sport': sport, 'year': year, 'name': str(league_id)}
     try:
-        # You would need to provide your actual ESPN credentials
-        # league = League(league_id=league_id, year=year)
-        # return jsonify({
-        #     "teams": [{"name": team.team_name, "owner": team.owner} for team in league.teams],
-        #     "scoreboard": league.scoreboard()
-        # })
-        
-        # For now, return sample data
-        return jsonify({
-            "message": "Fantasy league data endpoint - requires ESPN credentials",
-            "league_id": league_id,
-            "year": year
-        })
+        body = league_lookup_cache.get(league_config_key(league_config),
+                                       lambda: encode_json(load_league_summary(league_config)))
+    except ESPNInvalidLeague:
+        return jsonify({"error": f"League {league_id} does not exist for {sport} {year}"}), 404
+    except ESPNAccessDenied:
+        # The espn_api message includes the cookies, so it is not passed on
+        return jsonify({"error": f"League {league_id} is private; ESPN_S2 and ESPN_SWID cannot access it"}), 403
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        print(f"❌ Error looking up league {league_id}: {type(e).__name__}: {e}")
+        return jsonify({"error": f"Could not load league {league_id} from ESPN"}), 500
+    
+    response = Response(body, mimetype='application/json')
+    response.headers['Cache-Control'] = f'max-age={config.LEAGUE_LOOKUP_TTL}'
+    return response
+
+def create_app(app_config=None):
+    """Create the Flask app and this process's display state
+    
+    The configuration (including .env) is parsed once here unless one is
+    passed in. espn_api sport modules are imported only for sports that
+    have a configured league; other sports are imported on their first
+    on-demand lookup. Call start_background_updater() afterwards to begin
+    refreshing data.
+    """
+    global config, snapshot_publisher, fantasy_history, display_profiles, league_fetcher
+    global espn_transport, league_lookup_cache, refresh_scheduler, league_cache, scores_pipeline
+    
+    config = app_config or load_config()
+    
+    snapshot_publisher = SnapshotPublisher(history_size=config.SNAPSHOT_HISTORY)
+    snapshot_publisher.publish(sports_data)
+    fantasy_history = FantasyHistory(capacity=config.HISTORY_POINTS)
+    display_profiles = config.get_display_profiles()
+    
+    league_fetcher = LeagueFetcher(max_workers=config.FETCH_MAX_WORKERS, timeout=config.FETCH_TIMEOUT,
+                                   cycle_timeout=config.FETCH_CYCLE_TIMEOUT)
+    espn_transport = EspnTransport(pool_size=config.ESPN_POOL_SIZE, max_retries=config.ESPN_MAX_RETRIES,
+                                   backoff=config.ESPN_RETRY_BACKOFF, timeout=config.ESPN_TIMEOUT,
+                                   base_url=config.ESPN_BASE_URL or None)
+    league_lookup_cache = LookupCache(maxsize=config.LEAGUE_LOOKUP_CACHE_SIZE, ttl=config.LEAGUE_LOOKUP_TTL)
+    refresh_scheduler = RefreshScheduler(live_interval=config.UPDATE_INTERVAL,
+                                         idle_interval=config.IDLE_REFRESH_INTERVAL,
+                                         max_backoff=config.FAILURE_BACKOFF_MAX)
+    league_cache = LeagueResultCache(failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+                                     reset_timeout=config.CIRCUIT_RESET_TIMEOUT)
+    scores_pipeline = build_scores_pipeline()
+    
+    for sport in config.get_enabled_league_sports():
+        get_league_class(sport)
+    
+    app = Flask(__name__)
+    app.register_blueprint(routes)
+    if config.DEBUG:
+        app.register_blueprint(dev_routes)
+    return app
 
 if __name__ == '__main__':
-    # Start background data update thread
-    update_thread = threading.Thread(target=data_update_loop, daemon=True)
-    update_thread.start()
+    import argparse
+    import logging
+    from config import ProductionConfig
+    
+    parser = argparse.ArgumentParser(description="Retro Arcade Fantasy Sports Display")
+    parser.add_argument('--production', action='store_true',
+                        help='serve with debug, reloader and request logging off, one thread per connection')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
     
-    # Initialize with sample data
-    update_sports_data()
+    app = create_app(load_config(ProductionConfig) if args.production else None)
+    
+    # Start background data update thread; the first refresh runs there
+    start_background_updater()
     
     print("🎮 Retro Arcade Fantasy Sports Display Starting...")
-    print("🌐 Open your browser to: http://localhost:5000")
-    print("📊 API endpoint: http://localhost:5000/api/sports-data")
+    print(f"🌐 Open your browser to: http://localhost:{args.port}")
+    print(f"📊 API endpoint: http://localhost:{args.port}/api/sports-data")
+    print(f"📡 Live stream: http://localhost:{args.port}/api/stream")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if args.production:
+        # A single process keeps a single updater thread; request logs cost a
+        # write per poll from every screen
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+        app.run(debug=False, use_reloader=False, threaded=True, host=args.host, port=args.port)
+    else:
+        app.run(debug=True, host=args.host, port=args.port)
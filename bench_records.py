@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark for typed records vs plain dicts in Arcade Fantasy Sports Display
+Reports memory per fantasy team and per-refresh serialization time
+
+Usage: python bench_records.py [--teams 5000] [--changed 0.02] [--cycles 20]
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from records import FantasyTeam, SportsDataStore
+
+
+def make_team(index, points):
+    return {
+        "id": f"{index // 12}-{index % 12 + 1}",
+        "team_id": index % 12 + 1,
+        "name": f"Team {index}",
+        "owner": f"Owner {index}",
+        "points": points,
+        "opponent": f"Team {index ^ 1}",
+        "opponent_points": points / 2,
+        "status": "Winning",
+        "league": f"League {index // 12}",
+        "stale": False
+    }
+
+
+def make_data(points):
+    return {
+        "timestamp": "2024-01-01T00:00:00",
+        "sports": {"football": {"games": []}},
+        "fantasy_teams": [make_team(index, value) for index, value in enumerate(points)]
+    }
+
+
+def measure_memory(count, build):
+    gc.collect()
+    tracemalloc.start()
+    objects = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / count
+
+
+def build_dicts(count):
+    return [make_team(index, float(index)) for index in range(count)]
+
+
+def build_records(count):
+    records = []
+    for index in range(count):
+        record = FantasyTeam(f"team-{index}")
+        record.update(make_team(index, float(index)))
+        records.append(record)
+    return records
+
+
+def bench_cycles(teams, changed, cycles):
+    points = [random.uniform(0, 150) for _ in range(teams)]
+    store = SportsDataStore()
+    store.sync(make_data(points))
+
+    dict_times = []
+    record_times = []
+    for _ in range(cycles):
+        for index in random.sample(range(teams), max(1, int(teams * changed))):
+            points[index] += random.uniform(0.1, 2.0)
+        data = make_data(points)
+
+        start = time.perf_counter()
+        json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        dict_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        store.sync(data)
+        store.encode(version=1)
+        record_times.append(time.perf_counter() - start)
+
+    return sorted(dict_times)[len(dict_times) // 2], sorted(record_times)[len(record_times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=5000)
+    parser.add_argument('--changed', type=float, default=0.02, help='fraction of teams changed per refresh')
+    parser.add_argument('--cycles', type=int, default=20)
+    args = parser.parse_args()
+
+    dict_bytes = measure_memory(args.teams, build_dicts)
+    record_bytes = measure_memory(args.teams, build_records)
+    dict_time, record_time = bench_cycles(args.teams, args.changed, args.cycles)
+
+    print(f"🎮 {args.teams} fantasy teams, {args.changed:.0%} changed per refresh")
+    print(f"Memory per team:   dict {dict_bytes:7.0f} B   record {record_bytes:7.0f} B")
+    print(f"Serialize / cycle: dict {dict_time * 1000:7.2f} ms  record {record_time * 1000:7.2f} ms (sync + encode)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Refresh pipeline benchmark for Arcade Fantasy Sports Display
+Runs update_sports_data() against synthetic ESPN leagues replayed by a local stub
+server and reports cycle time, CPU, memory and per-cycle allocations per league count
+
+Usage: python bench_refresh.py [--sizes 1,10,50,200] [--cycles 5] [--latency 0.05]
+                               [--error-rate 0.0] [--json results.json]
+                               [--baseline results.json] [--tolerance 0.25]
+
+Each league count runs in a fresh interpreter so memory figures are not
+shared between sizes; the stub server runs in this process so its CPU time
+is not counted. With --baseline, exits with status 1 when a size's warm
+cycle time or CPU is more than --tolerance slower than the baseline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from replay import FixtureStore, ReplayServer, leagues_setting, synthesize_league, synthetic_leagues
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process
+
+    VmHWM is per address space, so unlike ru_maxrss it does not include the
+    parent's peak from before exec.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_size(league_count, cycles, base_url, workers):
+    """Child process: cold cycle plus `cycles` warm cycles over `league_count` leagues"""
+    import app
+    from config import Config
+
+    leagues = synthetic_leagues(league_count)
+    config = Config({
+        'FANTASY_LEAGUES': leagues_setting(leagues),
+        'ESPN_BASE_URL': base_url,
+        'SNAPSHOT_PATH': '',
+        'SCORES_PROVIDER': 'fixture',
+        'FETCH_MAX_WORKERS': str(workers),
+        'ESPN_POOL_SIZE': str(workers),
+        'ESPN_RETRY_BACKOFF': '0.05',
+        # Each cycle waits for every league so it measures the whole refresh
+        'FETCH_CYCLE_TIMEOUT': '600',
+        # Every league is due every cycle and a failed league is retried right away
+        'UPDATE_INTERVAL': '0',
+        'IDLE_REFRESH_INTERVAL': '0',
+        'FAILURE_BACKOFF_MAX': '0',
+        'CIRCUIT_FAILURE_THRESHOLD': '1000000'
+    })
+    app.create_app(config)
+    rss_before = peak_rss_mb()
+
+    walls = []
+    cpus = []
+    for _ in range(cycles + 1):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.update_sports_data()
+        walls.append(time.perf_counter() - wall_start)
+        cpus.append(time.process_time() - cpu_start)
+
+    # Peak memory allocated by one more warm cycle: what a refresh churns through
+    # even when little changed. Traced separately so tracing does not skew timings
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        app.update_sports_data()
+    _, cycle_alloc = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    body = json.loads(app.snapshot_publisher.current().body)
+    stats = app.espn_transport.snapshot_stats()
+    warm_walls = walls[1:] or walls
+    warm_cpus = cpus[1:] or cpus
+    return {
+        "leagues": league_count,
+        "teams": len(body["fantasy_teams"]),
+        "cold_s": walls[0],
+        "cold_cpu_s": cpus[0],
+        "warm_p50_s": statistics.median(warm_walls),
+        "warm_max_s": max(warm_walls),
+        "warm_cpu_s": statistics.median(warm_cpus),
+        "cycle_alloc_kb": cycle_alloc / 1024,
+        "peak_rss_mb": peak_rss_mb(),
+        "rss_growth_mb": peak_rss_mb() - rss_before,
+        "snapshot_kb": len(app.snapshot_publisher.current().body) / 1024,
+        "espn_requests": stats["requests"],
+        "espn_retries": stats["retries"],
+        "espn_errors": stats["errors"]
+    }
+
+
+def compare(results, baseline_path, tolerance):
+    """Names of (size, metric) pairs slower than the baseline by more than `tolerance`"""
+    with open(baseline_path) as f:
+        baseline = {row["leagues"]: row for row in json.load(f)}
+    regressions = []
+    for row in results:
+        previous = baseline.get(row["leagues"])
+        if previous is None:
+            continue
+        for metric in ("warm_p50_s", "warm_cpu_s"):
+            if row[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f"{row['leagues']} leagues {metric}: "
+                                   f"{previous[metric] * 1000:.0f} ms -> {row[metric] * 1000:.0f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1,10,50,200', help='comma-separated league counts')
+    parser.add_argument('--cycles', type=int, default=5, help='warm cycles after the cold one')
+    parser.add_argument('--teams', type=int, default=10, help='teams per league')
+    parser.add_argument('--workers', type=int, default=8, help='FETCH_MAX_WORKERS')
+    parser.add_argument('--latency', type=float, default=0.05, help='stub seconds per response')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--baseline', help='results file from an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_size(args.child, args.cycles, args.base_url, args.workers)))
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    store = FixtureStore()
+    for league in synthetic_leagues(max(sizes)):
+        synthesize_league(store, league['league_id'], league['year'], args.teams)
+    server = ReplayServer(store, latency=args.latency, jitter=args.jitter,
+                          error_rate=args.error_rate, seed=0).start()
+
+    print(f"🎮 Refresh benchmark: {args.cycles} warm cycles, {args.latency * 1000:.0f} ms stub latency, "
+          f"{args.error_rate:.0%} errors, {args.workers} workers")
+    print(f"{'leagues':>7} {'teams':>6} {'cold':>9} {'warm p50':>9} {'warm max':>9} "
+          f"{'cpu/cycle':>9} {'alloc/cycle':>11} {'peak rss':>9} {'requests':>8} {'retries':>7}")
+    results = []
+    try:
+        for size in sizes:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', str(size), '--cycles', str(args.cycles),
+                 '--workers', str(args.workers), '--base-url', server.url],
+                cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True
+            ).stdout
+            row = json.loads(output.strip().splitlines()[-1])
+            results.append(row)
+            print(f"{row['leagues']:>7} {row['teams']:>6} {row['cold_s'] * 1000:>7.0f}ms "
+                  f"{row['warm_p50_s'] * 1000:>7.0f}ms {row['warm_max_s'] * 1000:>7.0f}ms "
+                  f"{row['warm_cpu_s'] * 1000:>7.0f}ms {row['cycle_alloc_kb']:>9.0f}KB {row['peak_rss_mb']:>7.1f}MB "
+                  f"{row['espn_requests']:>8} {row['espn_retries']:>7}")
+    finally:
+        server.stop()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ Slower than {args.baseline} by more than {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\n✅ Within {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
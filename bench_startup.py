@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for Arcade Fantasy Sports Display
+Runs `import app; app.create_app()` in fresh interpreters under -X importtime and
+checks the total import time against a budget
+
+Usage: python bench_startup.py [--runs 5] [--budget-ms 350] [--top 10]
+Exits with status 1 when the median import time is over budget.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+STARTUP_CODE = (
+    "import time; start = time.perf_counter(); "
+    "import app; app.create_app(); "
+    "print(f'create_app_ms={(time.perf_counter() - start) * 1000:.1f}')"
+)
+
+
+def run_once():
+    """One cold start
+
+    Returns (import ms from `import app` on, slowest modules imported by app
+    as [(ms, name)], every module name imported, import + create_app wall ms).
+    Interpreter startup imports (site, encodings) are not counted.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', STARTUP_CODE],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    total_us = 0
+    app_children = []
+    pending_children = []
+    names = []
+    seen_app = False
+    # importtime prints each module after its own imports, indented by depth
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative_us, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        names.append(name)
+        if depth == 1:
+            pending_children.append((int(cumulative_us) / 1000, name))
+        elif depth == 0:
+            if name == 'app':
+                seen_app = True
+                app_children = pending_children
+            if seen_app:
+                total_us += int(cumulative_us)
+            pending_children = []
+    wall_ms = float(re.search(r'create_app_ms=([\d.]+)', result.stdout).group(1))
+    return total_us / 1000, sorted(app_children, reverse=True), names, wall_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=350.0, help='max median import time')
+    parser.add_argument('--top', type=int, default=10, help='slowest top-level imports to list')
+    args = parser.parse_args()
+
+    totals = []
+    walls = []
+    for _ in range(args.runs):
+        total_ms, app_children, names, wall_ms = run_once()
+        totals.append(total_ms)
+        walls.append(wall_ms)
+
+    median = statistics.median(totals)
+    print(f"🎮 Cold start over {args.runs} runs")
+    print(f"Import time:        median {median:7.1f} ms  (min {min(totals):.1f}, max {max(totals):.1f})")
+    print(f"import + create_app median {statistics.median(walls):7.1f} ms")
+
+    sports = [sport for sport in ('football', 'basketball', 'baseball')
+              if any(name.startswith(f'espn_api.{sport}') for name in names)]
+    print(f"espn_api sport modules loaded: {', '.join(sports) or 'none'}")
+
+    print("\nSlowest imports under app (last run):")
+    for cumulative_ms, name in app_children[:args.top]:
+        print(f"  {cumulative_ms:7.1f} ms  {name}")
+
+    if median > args.budget_ms:
+        print(f"\n❌ Over budget: {median:.1f} ms > {args.budget_ms:.1f} ms")
+        return 1
+    print(f"\n✅ Within budget: {median:.1f} ms <= {args.budget_ms:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Win probability benchmark for Arcade Fantasy Sports Display
+Times one simulation pass over many live matchups and the cached repeat
+
+Usage: python bench_win_probability.py [--matchups 5000] [--simulations 10000] [--starters 9]
+"""
+
+import argparse
+import random
+import time
+
+from win_probability import WinProbabilityEngine
+
+
+def make_matchups(count, starters, seed=0):
+    """Live matchups in the (league key, winner, sides) shape of PlayerBoxScores"""
+    rng = random.Random(seed)
+    matchups = []
+    for index in range(count):
+        sides = []
+        for side in range(2):
+            lines = []
+            for _ in range(starters):
+                projected = rng.uniform(2, 25)
+                # Roughly half the starters have played some of their game
+                points = projected * rng.uniform(0, 1.4) if rng.random() < 0.5 else 0.0
+                lines.append((round(points, 2), round(projected, 2)))
+            sides.append((2 * index + side, lines))
+        matchups.append((index // 6, 'UNDECIDED', sides))
+    return matchups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--matchups', type=int, default=5000)
+    parser.add_argument('--simulations', type=int, default=10000)
+    parser.add_argument('--starters', type=int, default=9, help='starters per side')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    matchups = make_matchups(args.matchups, args.starters)
+    engine = WinProbabilityEngine(simulations=args.simulations)
+    print(f"🎲 {args.matchups} matchups x {args.simulations} simulations, {args.starters} starters per side")
+
+    timings = []
+    for run in range(args.runs):
+        started = time.perf_counter()
+        results = engine.probabilities(matchups, revision=run)
+        timings.append(time.perf_counter() - started)
+    started = time.perf_counter()
+    engine.probabilities(matchups, revision=args.runs - 1)
+    cached = time.perf_counter() - started
+
+    print(f"Simulation pass: best {min(timings) * 1000:8.1f} ms  "
+          f"({min(timings) / args.matchups * 1e6:.1f} µs per matchup)")
+    print(f"Cached repeat:        {cached * 1000:8.3f} ms")
+    print(f"Probabilities:        {len(results)} teams")
+
+
+if __name__ == '__main__':
+    main()
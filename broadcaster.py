@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Update broadcaster for Arcade Fantasy Sports Display
+Wakes every connected stream client when a new snapshot version is published
+"""
+
+import threading
+from contextlib import contextmanager
+
+
+class Broadcaster:
+    """Fan-out of snapshot versions to any number of waiting clients
+
+    Clients block on a shared condition instead of polling, so an idle
+    connection costs a parked thread and no CPU until the next publish.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._version = 0
+        self._clients = 0
+
+    def publish(self, version):
+        with self._condition:
+            self._version = version
+            self._condition.notify_all()
+
+    def wait_for_update(self, version, timeout):
+        """Block until a version newer than `version` is published or timeout"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._version > version, timeout=timeout)
+            return self._version
+
+    @contextmanager
+    def subscription(self):
+        with self._condition:
+            self._clients += 1
+        try:
+            yield self
+        finally:
+            with self._condition:
+                self._clients -= 1
+
+    @property
+    def client_count(self):
+        return self._clients
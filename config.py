@@ -1,37 +1,22 @@
 #!/usr/bin/env python3
 """
 Configuration file for Arcade Fantasy Sports Display
+Settings are read from the environment (and .env) once by load_config() and are read-only afterwards
 """
 
 import os
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
 class Config:
-    """Application configuration"""
-    
-    # Flask Configuration
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'arcade-fantasy-sports-secret-key'
-    DEBUG = os.environ.get('DEBUG', 'True').lower() == 'true'
-    
-    # ESPN API Authentication
-    ESPN_S2 = os.environ.get('ESPN_S2')
-    ESPN_SWID = os.environ.get('ESPN_SWID')
+    """Application configuration
     
-    # ESPN API Configuration
-    ESPN_LEAGUE_ID = os.environ.get('ESPN_LEAGUE_ID')
-    ESPN_YEAR = int(os.environ.get('ESPN_YEAR', '2024'))
-    ESPN_SPORT = os.environ.get('ESPN_SPORT', 'football')  # football, basketball, baseball
+    Built once from an environment mapping; every value, including the
+    parsed league and profile lists, is resolved in __init__ and the
+    object cannot be modified afterwards.
+    """
     
-    # Display Configuration
-    UPDATE_INTERVAL = int(os.environ.get('UPDATE_INTERVAL', '30'))  # seconds
-    SCROLL_SPEED = int(os.environ.get('SCROLL_SPEED', '30'))  # seconds for full scroll
-    
-    # Sample Data Configuration
-    ENABLE_SAMPLE_DATA = os.environ.get('ENABLE_SAMPLE_DATA', 'True').lower() == 'true'
-    SAMPLE_DATA_UPDATE_CHANCE = float(os.environ.get('SAMPLE_DATA_UPDATE_CHANCE', '0.3'))
+    # Values forced by a configuration class regardless of the environment
+    OVERRIDES = {}
     
     # Sports to Display
     ENABLED_SPORTS = {
@@ -40,17 +25,108 @@ class Config:
         'baseball': True
     }
     
-    # Fantasy Leagues Configuration
-    # Format: "league_id:sport:year:display_name"
-    # Example: "123456789:football:2024:My NFL League"
-    FANTASY_LEAGUES_RAW = os.environ.get('FANTASY_LEAGUES', '')
+    def __init__(self, environ):
+        # Flask Configuration
+        self.SECRET_KEY = environ.get('SECRET_KEY') or 'arcade-fantasy-sports-secret-key'
+        self.DEBUG = environ.get('DEBUG', 'True').lower() == 'true'
+        
+        # ESPN API Authentication
+        self.ESPN_S2 = environ.get('ESPN_S2')
+        self.ESPN_SWID = environ.get('ESPN_SWID')
+        
+        # ESPN API Configuration
+        self.ESPN_LEAGUE_ID = environ.get('ESPN_LEAGUE_ID')
+        self.ESPN_YEAR = int(environ.get('ESPN_YEAR', '2024'))
+        self.ESPN_SPORT = environ.get('ESPN_SPORT', 'football')  # football, basketball, baseball
+        
+        # Display Configuration
+        self.UPDATE_INTERVAL = int(environ.get('UPDATE_INTERVAL', '30'))  # seconds, also the live league interval
+        self.IDLE_REFRESH_INTERVAL = int(environ.get('IDLE_REFRESH_INTERVAL', '1800'))  # max seconds for quiet leagues with no matchup in play and no live pro games
+        self.FAILURE_BACKOFF_MAX = int(environ.get('FAILURE_BACKOFF_MAX', '3600'))  # max seconds for failing leagues
+        self.CIRCUIT_FAILURE_THRESHOLD = int(environ.get('CIRCUIT_FAILURE_THRESHOLD', '3'))  # failures before a league is paused
+        self.CIRCUIT_RESET_TIMEOUT = int(environ.get('CIRCUIT_RESET_TIMEOUT', '300'))  # seconds a paused league waits
+        
+        # League Fetch Configuration
+        self.FETCH_MAX_WORKERS = int(environ.get('FETCH_MAX_WORKERS', '8'))  # concurrent league fetches
+        self.FETCH_TIMEOUT = float(environ.get('FETCH_TIMEOUT', '20'))  # seconds per league
+        self.FETCH_CYCLE_TIMEOUT = float(environ.get('FETCH_CYCLE_TIMEOUT', '5'))  # seconds a cycle waits before publishing; slower leagues land later
+        
+        # ESPN HTTP Transport Configuration
+        self.ESPN_POOL_SIZE = int(environ.get('ESPN_POOL_SIZE', '16'))  # pooled keep-alive connections
+        self.ESPN_TIMEOUT = float(environ.get('ESPN_TIMEOUT', '10'))  # seconds per request
+        self.ESPN_MAX_RETRIES = int(environ.get('ESPN_MAX_RETRIES', '2'))
+        self.ESPN_RETRY_BACKOFF = float(environ.get('ESPN_RETRY_BACKOFF', '0.5'))  # base seconds, jittered
+        self.ESPN_BASE_URL = environ.get('ESPN_BASE_URL', '')  # send ESPN requests here instead (replay server)
+        
+        # On-demand League Lookup Configuration (/api/fantasy-league)
+        self.LEAGUE_LOOKUP_CACHE_SIZE = int(environ.get('LEAGUE_LOOKUP_CACHE_SIZE', '64'))  # leagues kept
+        self.LEAGUE_LOOKUP_TTL = int(environ.get('LEAGUE_LOOKUP_TTL', '300'))  # seconds per cached league
+        
+        # API Snapshot Configuration
+        self.SNAPSHOT_HISTORY = int(environ.get('SNAPSHOT_HISTORY', '120'))  # versions kept for ?since= deltas
+        self.STREAM_KEEPALIVE = int(environ.get('STREAM_KEEPALIVE', '15'))  # seconds between SSE keepalives
+        self.SNAPSHOT_PATH = environ.get('SNAPSHOT_PATH', 'last_snapshot.json')  # warm start file, empty to disable
+        self.HISTORY_POINTS = int(environ.get('HISTORY_POINTS', '240'))  # score samples kept per fantasy team
+        
+        # Win Probability Configuration
+        self.WIN_PROBABILITY_SIMULATIONS = int(environ.get('WIN_PROBABILITY_SIMULATIONS', '10000'))  # per matchup, 0 to disable
+        self.WIN_PROBABILITY_SPREAD = float(environ.get('WIN_PROBABILITY_SPREAD', '0.6'))  # std dev / remaining projection
+        
+        # Multi-process Configuration (empty path = single process)
+        self.SHARED_STORE_PATH = environ.get('SHARED_STORE_PATH', '')  # SQLite file shared by all workers
+        self.SHARED_STORE_POLL = float(environ.get('SHARED_STORE_POLL', '1'))  # seconds between store checks
+        self.SCROLL_SPEED = int(environ.get('SCROLL_SPEED', '30'))  # seconds for full scroll
+        
+        # Sample Data Configuration
+        self.ENABLE_SAMPLE_DATA = environ.get('ENABLE_SAMPLE_DATA', 'True').lower() == 'true'
+        self.SAMPLE_DATA_UPDATE_CHANCE = float(environ.get('SAMPLE_DATA_UPDATE_CHANCE', '0.3'))
+        
+        # Pro Scores Configuration
+        self.SCORES_PROVIDER = environ.get('SCORES_PROVIDER', 'sample')  # sample, espn, fixture
+        self.SCORES_FIXTURE_PATH = environ.get('SCORES_FIXTURE_PATH', 'fixtures/sports_scores.json')
+        # Format: "sport:seconds", e.g. "football:60,basketball:30,baseball:30"
+        self.SCORES_REFRESH_INTERVALS_RAW = environ.get('SCORES_REFRESH_INTERVALS', '')
+        
+        # Fantasy Leagues Configuration
+        # Format: "league_id:sport:year:display_name"
+        # Example: "123456789:football:2024:My NFL League"
+        self.FANTASY_LEAGUES_RAW = environ.get('FANTASY_LEAGUES', '')
+        
+        # Display Profiles: one league set and /d/<profile> route per venue screen
+        # Format: "profile=league,league;profile=league", leagues as in FANTASY_LEAGUES
+        # Example: "lobby=123456789:football:2024:Office NFL;bar=987654321:basketball:2024:Hoops"
+        self.DISPLAY_PROFILES_RAW = environ.get('DISPLAY_PROFILES', '')
+        
+        for name, value in self.OVERRIDES.items():
+            setattr(self, name, value)
+        
+        # Parsed once; the getters below hand out these same objects
+        self._scores_refresh_intervals = self._parse_scores_refresh_intervals(self.SCORES_REFRESH_INTERVALS_RAW)
+        self._fantasy_leagues = self.parse_leagues(self.FANTASY_LEAGUES_RAW)
+        self._display_profiles = self._parse_display_profiles(self.DISPLAY_PROFILES_RAW)
+        self._all_fantasy_leagues = self._merge_leagues(self._fantasy_leagues, self._display_profiles)
+        self._frozen = True
     
-    @classmethod
-    def get_fantasy_leagues(cls):
-        """Parse fantasy leagues from environment variable"""
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"Config is read-only (tried to set {name})")
+        super().__setattr__(name, value)
+    
+    @staticmethod
+    def _parse_scores_refresh_intervals(raw):
+        intervals = {}
+        for interval_str in raw.split(','):
+            if ':' in interval_str:
+                sport, seconds = interval_str.strip().split(':', 1)
+                intervals[sport] = int(seconds)
+        return intervals
+    
+    @staticmethod
+    def parse_leagues(raw):
+        """Parse a comma-separated list of league_id:sport:year:display_name"""
         leagues = []
-        if cls.FANTASY_LEAGUES_RAW:
-            for league_str in cls.FANTASY_LEAGUES_RAW.split(','):
+        if raw:
+            for league_str in raw.split(','):
                 league_str = league_str.strip()
                 if ':' in league_str:
                     parts = league_str.split(':')
@@ -63,6 +139,49 @@ class Config:
                         })
         return leagues
     
+    @classmethod
+    def _parse_display_profiles(cls, raw):
+        profiles = {}
+        for profile_str in raw.split(';'):
+            if '=' in profile_str:
+                name, leagues = profile_str.split('=', 1)
+                profiles[name.strip()] = cls.parse_leagues(leagues)
+        return profiles
+    
+    @staticmethod
+    def _merge_leagues(leagues, profiles):
+        merged = []
+        seen = set()
+        candidates = list(leagues)
+        for profile_leagues in profiles.values():
+            candidates.extend(profile_leagues)
+        for league in candidates:
+            key = (league['league_id'], league['sport'], league['year'])
+            if key not in seen:
+                seen.add(key)
+                merged.append(league)
+        return merged
+    
+    def get_scores_refresh_intervals(self):
+        """Per-sport scores refresh intervals ("sport:seconds" pairs)"""
+        return self._scores_refresh_intervals
+    
+    def get_fantasy_leagues(self):
+        """Fantasy leagues from FANTASY_LEAGUES"""
+        return self._fantasy_leagues
+    
+    def get_display_profiles(self):
+        """Display profiles as {profile name: [league, ...]}"""
+        return self._display_profiles
+    
+    def get_all_fantasy_leagues(self):
+        """Every league shown by any display, each (league_id, sport, year) once"""
+        return self._all_fantasy_leagues
+    
+    def get_enabled_league_sports(self):
+        """Sports that have at least one configured fantasy league"""
+        return sorted({league['sport'] for league in self._all_fantasy_leagues})
+    
     # Visual Configuration
     COLORS = {
         'primary': '#00ff00',      # Green
@@ -82,13 +201,11 @@ class Config:
 
 class DevelopmentConfig(Config):
     """Development configuration"""
-    DEBUG = True
-    ENABLE_SAMPLE_DATA = True
+    OVERRIDES = {'DEBUG': True, 'ENABLE_SAMPLE_DATA': True}
 
 class ProductionConfig(Config):
     """Production configuration"""
-    DEBUG = False
-    ENABLE_SAMPLE_DATA = False
+    OVERRIDES = {'DEBUG': False, 'ENABLE_SAMPLE_DATA': False}
 
 # Configuration mapping
 config = {
@@ -96,3 +213,15 @@ config = {
     'production': ProductionConfig,
     'default': DevelopmentConfig
 }
+
+def load_config(config_class=Config, environ=None):
+    """Read .env once and build the read-only configuration
+    
+    Values already set in the process environment win over .env, as with
+    load_dotenv(). Pass `environ` to build a configuration without
+    touching the process environment (benchmarks, tools).
+    """
+    if environ is None:
+        load_dotenv()
+        environ = os.environ
+    return config_class(environ)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Concurrent league fetch engine for Arcade Fantasy Sports Display
+Runs one fetch per configured league on a bounded worker pool
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class LeagueFetchResult:
+    """Outcome of fetching a single league: what fetch_one returned, or the error it raised"""
+
+    def __init__(self, league_config, value=None, error=None, elapsed=0.0):
+        self.league_config = league_config
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class LeagueFetchTimeout(Exception):
+    """Raised when a league fetch exceeds its per-league timeout"""
+    pass
+
+
+class LeagueFetcher:
+    """Fetch many leagues concurrently with a per-league timeout
+
+    A refresh cycle waits at most `cycle_timeout` seconds. Leagues still
+    running by then keep going in the background and are not started again.
+    Their results are returned by the next fetch_all() call, so a slow
+    league never holds back the others. `late_result` is set when such a
+    background fetch finishes, so the update loop can publish it without
+    waiting for its next scheduled cycle.
+    """
+
+    def __init__(self, max_workers=8, timeout=20.0, cycle_timeout=None):
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = float(timeout)
+        self.cycle_timeout = float(cycle_timeout) if cycle_timeout is not None else self.timeout
+        self.late_result = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='league-fetch')
+        # League key -> (future, league_config) for fetches not yet reported
+        self._in_flight = {}
+        self._started = {}
+
+    def _run(self, fetch_one, key, league_config):
+        self._started[key] = time.monotonic()
+        return fetch_one(league_config)
+
+    def _submit(self, fetch_one, key, league_config):
+        future = self._executor.submit(self._run, fetch_one, key, league_config)
+        future.add_done_callback(lambda _: self.late_result.set())
+        self._in_flight[key] = (future, league_config)
+
+    def _collect(self, results, now):
+        """Move finished and timed-out fetches from in flight to `results`"""
+        for key, (future, league_config) in list(self._in_flight.items()):
+            start = self._started.get(key)
+            elapsed = now - start if start is not None else 0.0
+            if future.done():
+                try:
+                    results[key] = LeagueFetchResult(league_config, value=future.result(), elapsed=elapsed)
+                except Exception as e:
+                    results[key] = LeagueFetchResult(league_config, error=e, elapsed=elapsed)
+            elif start is not None and elapsed > self.timeout:
+                future.cancel()
+                results[key] = LeagueFetchResult(
+                    league_config, error=LeagueFetchTimeout(f"timed out after {self.timeout:.0f}s"),
+                    elapsed=elapsed
+                )
+            else:
+                continue
+            del self._in_flight[key]
+            self._started.pop(key, None)
+
+    def fetch_all(self, league_configs, fetch_one):
+        """Run fetch_one(league_config) for every league and collect results
+
+        Returns the results of background fetches from earlier calls that
+        have finished since, then the results of this call's leagues that
+        finished within the cycle timeout, in the order of the league
+        configs passed in. A league whose fetch has been running for longer
+        than the per-league timeout is reported as failed. Python threads
+        cannot be interrupted, so its worker stays busy until the underlying
+        request returns on its own.
+        """
+        deadline = time.monotonic() + self.cycle_timeout
+        earlier = list(self._in_flight)
+        keys = []
+        for league_config in league_configs:
+            key = league_config_key(league_config)
+            keys.append(key)
+            if key not in self._in_flight:
+                self._submit(fetch_one, key, league_config)
+
+        results = {}
+        while True:
+            now = time.monotonic()
+            self._collect(results, now)
+            if not self._in_flight or now >= deadline:
+                break
+            wait([future for future, _ in self._in_flight.values()],
+                 timeout=min(deadline - now, 0.5), return_when=FIRST_COMPLETED)
+
+        # Only fetches that finish after this point should wake the update loop
+        self.late_result.clear()
+        if any(future.done() for future, _ in self._in_flight.values()):
+            self.late_result.set()
+
+        ordered = [results.pop(key) for key in earlier if key in results]
+        return ordered + [results.pop(key) for key in keys if key in results]
+
+    def wait_for_late_result(self, timeout):
+        """Sleep up to `timeout` seconds; returns True early when a background fetch finished"""
+        return self.late_result.wait(timeout)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def league_config_key(league_config):
+    """Stable identity of a configured league"""
+    return (league_config['league_id'], league_config['sport'], league_config['year'])
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Fantasy score history for Arcade Fantasy Sports Display
+Keeps a fixed-size, array-backed series of (timestamp, points, opponent_points) per team
+"""
+
+import threading
+import time
+from array import array
+
+
+class ScoreSeries:
+    """Fixed-capacity score series for one team
+
+    Samples live in three preallocated float arrays, so a series always
+    takes the same memory. Each slot holds the latest sample of a bucket of
+    `stride` consecutive appends. When the arrays fill up, every second
+    slot is dropped across the whole series and the stride doubles, so
+    resolution stays even over the full time span and halves each time
+    that span doubles. The newest sample is always kept.
+    """
+
+    __slots__ = ('capacity', 'count', 'stride', 'filled', 'timestamps', 'points', 'opponent_points')
+
+    def __init__(self, capacity):
+        # An even capacity keeps the newest slot when pairs are merged
+        self.capacity = max(4, capacity + capacity % 2)
+        self.count = 0
+        self.stride = 1
+        # Appends merged into the newest slot so far
+        self.filled = 0
+        self.timestamps = array('d', bytes(8 * self.capacity))
+        self.points = array('d', bytes(8 * self.capacity))
+        self.opponent_points = array('d', bytes(8 * self.capacity))
+
+    def _compact(self):
+        for column in (self.timestamps, self.points, self.opponent_points):
+            # Keep the later sample of each pair, i.e. every odd slot
+            column[0:self.count // 2] = column[1:self.count:2]
+        self.count //= 2
+        self.stride *= 2
+        self.filled = self.stride
+
+    def append(self, timestamp, points, opponent_points):
+        """Add a sample unless the score is unchanged since the last one"""
+        last = self.count - 1
+        if last >= 0 and self.points[last] == points and self.opponent_points[last] == opponent_points:
+            return False
+        if last >= 0 and self.filled < self.stride:
+            # The newest bucket is still open: its slot moves to this sample
+            self.filled += 1
+        else:
+            if self.count == self.capacity:
+                self._compact()
+            self.count += 1
+            self.filled = 1
+        last = self.count - 1
+        self.timestamps[last] = timestamp
+        self.points[last] = points
+        self.opponent_points[last] = opponent_points
+        return True
+
+    def to_dict(self):
+        count = self.count
+        return {
+            "timestamps": self.timestamps[:count].tolist(),
+            "points": self.points[:count].tolist(),
+            "opponent_points": self.opponent_points[:count].tolist()
+        }
+
+
+class FantasyHistory:
+    """Score series for every fantasy team currently on the display"""
+
+    def __init__(self, capacity=240):
+        self.capacity = capacity
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def record(self, scores, now=None):
+        """Append the current score of each team and forget teams that are gone
+
+        `scores` yields (team id, points, opponent points) per team.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            seen = set()
+            for team_id, points, opponent_points in scores:
+                seen.add(team_id)
+                series = self._series.get(team_id)
+                if series is None:
+                    series = self._series[team_id] = ScoreSeries(self.capacity)
+                series.append(now, float(points or 0.0), float(opponent_points or 0.0))
+            if len(seen) != len(self._series):
+                for team_id in [team_id for team_id in self._series if team_id not in seen]:
+                    del self._series[team_id]
+
+    def get(self, team_id):
+        """History of one team as plain lists, or None for an unknown team"""
+        with self._lock:
+            series = self._series.get(team_id)
+            if series is None:
+                return None
+            return dict(series.to_dict(), id=team_id)
+
+    def __len__(self):
+        return len(self._series)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Per-league result cache and circuit breaker for Arcade Fantasy Sports Display
+Keeps serving each league's last good teams while its refresh retries
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    """Stops calling a league that keeps failing
+
+    After `failure_threshold` consecutive failures the circuit opens and no
+    fetch is allowed for `reset_timeout` seconds. The next fetch after that
+    is a single trial: success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=3, reset_timeout=300):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def allow(self, now):
+        if self.state == self.OPEN and now >= self.opened_at + self.reset_timeout:
+            self.state = self.HALF_OPEN
+            return True
+        return self.state == self.CLOSED
+
+    def retry_at(self):
+        """When an open circuit will allow its next trial fetch"""
+        if self.state != self.OPEN:
+            return None
+        return self.opened_at + self.reset_timeout
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self, now):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = now
+
+
+class CachedLeague:
+    """Last good teams of one league and the health of its refreshes"""
+
+    def __init__(self, breaker):
+        self.breaker = breaker
+        self.teams = None
+        self.fetched_at = None
+        self.last_error = None
+
+
+class LeagueResultCache:
+    """Last good result per league, served stale while refreshes fail"""
+
+    def __init__(self, failure_threshold=3, reset_timeout=300):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._leagues = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, key):
+        entry = self._leagues.get(key)
+        if entry is None:
+            entry = CachedLeague(CircuitBreaker(self.failure_threshold, self.reset_timeout))
+            self._leagues[key] = entry
+        return entry
+
+    def sync(self, keys):
+        """Forget leagues that are no longer configured"""
+        keys = set(keys)
+        with self._lock:
+            for key in list(self._leagues):
+                if key not in keys:
+                    del self._leagues[key]
+
+    def allow_fetch(self, key, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._entry(key).breaker.allow(now)
+
+    def retry_at(self, key):
+        with self._lock:
+            return self._entry(key).breaker.retry_at()
+
+    def record_success(self, key, teams, now=None):
+        """Store a league's fresh FantasyTeam records and mark them current"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(key)
+            entry.breaker.record_success()
+            entry.last_error = None
+            entry.fetched_at = now
+            for team in teams:
+                team.assign(stale=False)
+            entry.teams = teams
+
+    def record_failure(self, key, error, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(key)
+            entry.breaker.record_failure(now)
+            entry.last_error = str(error)
+            # The cached records are marked stale in place; unchanged ones stay cheap to publish
+            for team in entry.teams or ():
+                team.assign(stale=True)
+
+    def teams(self, key):
+        """Latest FantasyTeam records of a league (possibly stale), or an empty list"""
+        with self._lock:
+            entry = self._leagues.get(key)
+            return entry.teams or [] if entry else []
+
+    def status(self, key, now=None):
+        """Age and health of a league's cached data"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(key)
+            return {
+                "age": round(now - entry.fetched_at) if entry.fetched_at else None,
+                "stale": entry.last_error is not None,
+                "circuit": entry.breaker.state,
+                "error": entry.last_error
+            }
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Long-lived ESPN league registry for Arcade Fantasy Sports Display
+Builds each League once and refreshes only the current week's scoreboard
+"""
+
+import json
+import threading
+import time
+
+from fetcher import league_config_key
+from matchups import build_matchup_index
+
+
+def fetch_scoreboard(league):
+    """Fetch the current matchup period's live scoreboard for a league
+
+    A single request returns every matchup of the period with live totals and
+    the rosters for the current scoring period, plus the league status used
+    to detect week rollover.
+    """
+    params = {
+        'view': ['mMatchupScore', 'mScoreboard'],
+        'scoringPeriodId': league.current_week
+    }
+    filters = {"schedule": {"filterMatchupPeriodIds": {"value": [league.currentMatchupPeriod]}}}
+    headers = {'x-fantasy-filter': json.dumps(filters)}
+    return league.espn_request.league_get(params=params, headers=headers)
+
+
+class LeagueEntry:
+    """A built League plus the volatile data refreshed every cycle"""
+
+    def __init__(self, league_config, league):
+        self.league_config = league_config
+        self.league = league
+        self.teams_by_id = {team.team_id: team for team in league.teams}
+        self.scoreboard = None
+        self.matchup_index = {}
+        self.built_at = time.time()
+        self.refreshed_at = None
+
+    def apply_scoreboard(self, data):
+        self.scoreboard = data
+        self.matchup_index = build_matchup_index(data, self.matchup_index)
+        self.refreshed_at = time.time()
+
+
+class LeagueRegistry:
+    """League objects keyed by (league_id, sport, year), kept between cycles
+
+    The first refresh of a league builds it from scratch (settings, teams,
+    rosters, schedule). Later refreshes only download the current scoreboard.
+    A full rebuild happens when the matchup period rolls over or when a
+    refresh fails.
+    """
+
+    def __init__(self, build_league):
+        self._build_league = build_league
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, league_config):
+        with self._lock:
+            return self._entries.get(league_config_key(league_config))
+
+    def refresh(self, league_config):
+        """Return an up-to-date LeagueEntry for the configured league"""
+        key = league_config_key(league_config)
+        entry = self.get(league_config)
+        try:
+            if entry is None:
+                entry = self._rebuild(league_config)
+            else:
+                data = fetch_scoreboard(entry.league)
+                if self._rolled_over(entry.league, data):
+                    print(f"🔄 Week rollover in {league_config.get('name', key)}, rebuilding league")
+                    entry = self._rebuild(league_config)
+                else:
+                    entry.apply_scoreboard(data)
+        except Exception:
+            # Drop the cached league so the next cycle starts from a clean build
+            self.discard(league_config)
+            raise
+        return entry
+
+    def sync(self, keys):
+        """Forget leagues that are no longer configured"""
+        keys = set(keys)
+        with self._lock:
+            for key in set(self._entries) - keys:
+                del self._entries[key]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def discard(self, league_config):
+        with self._lock:
+            self._entries.pop(league_config_key(league_config), None)
+
+    def _rebuild(self, league_config):
+        league = self._build_league(league_config)
+        entry = LeagueEntry(league_config, league)
+        entry.apply_scoreboard(fetch_scoreboard(league))
+        with self._lock:
+            self._entries[league_config_key(league_config)] = entry
+        return entry
+
+    def _rolled_over(self, league, data):
+        """Check scoreboard status against the built league
+
+        A new matchup period needs a full rebuild. A new scoring period inside
+        the same matchup period (daily leagues) only moves the league forward
+        and is picked up by the next scoreboard fetch.
+        """
+        status = data.get('status', {})
+        if status.get('currentMatchupPeriod', league.currentMatchupPeriod) != league.currentMatchupPeriod:
+            return True
+
+        scoring_period = data.get('scoringPeriodId', league.scoringPeriodId)
+        if scoring_period != league.scoringPeriodId:
+            league.scoringPeriodId = scoring_period
+            league.current_week = min(scoring_period, league.finalScoringPeriod)
+        return False
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Load test for the Arcade Fantasy Sports Display serving layer
+Simulates N kiosk screens behaving like ArcadeSportsDisplay (page load, then
+polling or streaming) and reports throughput, latency and server CPU as JSON
+
+Usage:
+  python loadtest.py --clients 200 --mode poll --interval 30 --duration 120
+  python loadtest.py --clients 500 --mode stream --duration 60
+  python loadtest.py --url http://kiosk-host:5000 --server-pid 1234 --clients 50
+
+Without --url a server is started with `python app.py --production` on a
+free port and its CPU time is measured. Results go to stdout and, with
+--json, to a file for comparing runs.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+import requests
+
+PAGE_ASSETS = ('/', '/static/arcade_display.js', '/static/arcade_display.css')
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def cpu_seconds(pid):
+    """User + system CPU seconds used so far by a process (Linux /proc)"""
+    if pid is None:
+        return None
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+    except OSError:
+        return None
+    # utime and stime are fields 14 and 15 of /proc/<pid>/stat
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+class Recorder:
+    """Thread-safe collection of request samples grouped by route"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.bytes = defaultdict(int)
+        self.errors = Counter()
+        self.events = 0
+
+    def request(self, route, seconds, status, size):
+        with self._lock:
+            self.latencies[route].append(seconds)
+            self.statuses[route][status] += 1
+            self.bytes[route] += size
+
+    def error(self, route, error):
+        with self._lock:
+            self.errors[f"{route}: {type(error).__name__}"] += 1
+
+    def event(self):
+        with self._lock:
+            self.events += 1
+
+
+class DisplayClient(threading.Thread):
+    """One simulated screen
+
+    Loads the page and its assets once, then either polls /api/sports-data
+    every `interval` seconds with ETag revalidation (as the browser's fetch
+    does for a no-cache response) or holds one /api/stream connection.
+    """
+
+    def __init__(self, base_url, recorder, stop, mode, interval, query, start_delay):
+        super().__init__(daemon=True)
+        self.base_url = base_url
+        self.recorder = recorder
+        self.stop = stop
+        self.mode = mode
+        self.interval = interval
+        self.query = query
+        self.start_delay = start_delay
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip'
+
+    def get(self, route, path, headers=None):
+        started = time.perf_counter()
+        try:
+            response = self.session.get(self.base_url + path, headers=headers, timeout=30)
+            size = len(response.content)
+        except requests.RequestException as e:
+            self.recorder.error(route, e)
+            return None
+        self.recorder.request(route, time.perf_counter() - started, response.status_code, size)
+        return response
+
+    def run(self):
+        if self.stop.wait(self.start_delay):
+            return
+        for asset in PAGE_ASSETS:
+            self.get('page', asset)
+        if self.mode == 'stream':
+            self.stream()
+        else:
+            self.poll()
+
+    def poll(self):
+        etag = None
+        next_poll = time.monotonic()
+        while not self.stop.is_set():
+            headers = {'If-None-Match': etag} if etag else None
+            response = self.get('api', f"/api/sports-data{self.query}", headers)
+            if response is not None and response.headers.get('ETag'):
+                etag = response.headers['ETag']
+            next_poll += self.interval
+            if self.stop.wait(max(0.0, next_poll - time.monotonic())):
+                return
+
+    def stream(self):
+        while not self.stop.is_set():
+            started = time.perf_counter()
+            try:
+                url = f"{self.base_url}/api/stream{self.query}"
+                with self.session.get(url, stream=True, timeout=(10, 60)) as response:
+                    first = True
+                    for line in response.iter_lines(decode_unicode=True):
+                        if self.stop.is_set():
+                            return
+                        if line.startswith('data:'):
+                            if first:
+                                # Time to the initial snapshot is this route's latency
+                                self.recorder.request('stream', time.perf_counter() - started,
+                                                      response.status_code, len(line))
+                                first = False
+                            self.recorder.event()
+            except requests.RequestException as e:
+                if self.stop.is_set():
+                    return
+                self.recorder.error('stream', e)
+                self.stop.wait(1.0)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    """Start `app.py --production` and wait until it answers"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    process = subprocess.Popen([sys.executable, os.path.join(directory, 'app.py'), '--production',
+                                '--host', '127.0.0.1', '--port', str(port)],
+                               cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            requests.get(base_url + '/api/sports-data', timeout=1)
+            return process, base_url
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Server did not start within 30 seconds")
+
+
+def summarize(recorder, duration):
+    routes = {}
+    for route, latencies in sorted(recorder.latencies.items()):
+        latencies = sorted(latencies)
+        routes[route] = {
+            "requests": len(latencies),
+            "throughput_rps": len(latencies) / duration,
+            "latency_ms": {name: percentile(latencies, fraction) * 1000
+                           for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))},
+            "max_ms": latencies[-1] * 1000,
+            "statuses": {str(status): count for status, count in recorder.statuses[route].items()},
+            "bytes": recorder.bytes[route]
+        }
+    return routes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help='server to test; default starts app.py --production')
+    parser.add_argument('--server-pid', type=int, help='measure CPU of this server process')
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--mode', choices=('poll', 'stream'), default='poll')
+    parser.add_argument('--interval', type=float, default=30.0,
+                        help='seconds between polls per client (the display uses 30)')
+    parser.add_argument('--query', default='', help='display filter, e.g. "?profile=lobby"')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds of load after ramp-up')
+    parser.add_argument('--ramp', type=float, help='spread client starts over this many seconds '
+                                                   '(default: one poll interval, max 10 s)')
+    parser.add_argument('--json', help='write results to this file')
+    args = parser.parse_args()
+
+    process = None
+    base_url = args.url
+    server_pid = args.server_pid
+    if base_url is None:
+        process, base_url = start_server(free_port())
+        server_pid = process.pid
+    base_url = base_url.rstrip('/')
+
+    ramp = args.ramp if args.ramp is not None else min(args.interval, 10.0)
+    recorder = Recorder()
+    stop = threading.Event()
+    clients = [DisplayClient(base_url, recorder, stop, args.mode, args.interval, args.query,
+                             random.uniform(0, ramp)) for _ in range(args.clients)]
+
+    print(f"🎮 {args.clients} {args.mode} clients against {base_url} for {args.duration:.0f}s "
+          f"(+{ramp:.0f}s ramp)")
+    try:
+        for client in clients:
+            client.start()
+        stop.wait(ramp)
+        # Only the steady state after ramp-up counts towards server CPU
+        cpu_start = cpu_seconds(server_pid)
+        wall_start = time.perf_counter()
+        stop.wait(args.duration)
+        elapsed = time.perf_counter() - wall_start
+        cpu_end = cpu_seconds(server_pid)
+    finally:
+        stop.set()
+        # Streaming clients may be blocked in a read until the next event or keepalive
+        deadline = time.monotonic() + 5
+        for client in clients:
+            client.join(timeout=max(0.0, deadline - time.monotonic()))
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    routes = summarize(recorder, elapsed + ramp)
+    server_cpu = None
+    if cpu_start is not None and cpu_end is not None:
+        server_cpu = {"seconds": cpu_end - cpu_start, "percent_of_core": (cpu_end - cpu_start) / elapsed * 100}
+    result = {
+        "url": base_url,
+        "mode": args.mode,
+        "clients": args.clients,
+        "interval_s": args.interval,
+        "query": args.query,
+        "duration_s": elapsed,
+        "ramp_s": ramp,
+        "routes": routes,
+        "stream_events": recorder.events if args.mode == 'stream' else None,
+        "errors": dict(recorder.errors),
+        "server_cpu": server_cpu
+    }
+
+    for route, stats in routes.items():
+        latency = stats["latency_ms"]
+        print(f"  {route:<7} {stats['requests']:>7} req  {stats['throughput_rps']:>8.1f} req/s  "
+              f"p50 {latency['p50']:>7.1f} ms  p99 {latency['p99']:>7.1f} ms  statuses {stats['statuses']}")
+    if args.mode == 'stream':
+        print(f"  events  {recorder.events:>7} received")
+    if server_cpu:
+        print(f"  server CPU {server_cpu['seconds']:.2f}s ({server_cpu['percent_of_core']:.1f}% of one core)")
+    if recorder.errors:
+        print(f"  ❌ errors: {dict(recorder.errors)}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"Results written to {args.json}")
+    return 1 if recorder.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
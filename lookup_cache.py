@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+On-demand lookup cache for Arcade Fantasy Sports Display
+A size-bounded LRU with per-entry TTL; concurrent misses for one key share a single load
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class _PendingLoad:
+    """One in-flight load that other requests for the same key wait on"""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class LookupCache:
+    """LRU cache of at most `maxsize` values, each valid for `ttl` seconds
+
+    get() returns a cached value while it is fresh. On a miss the first
+    caller runs the loader and every concurrent caller for the same key
+    waits for that result (singleflight), so a burst of lookups makes one
+    upstream call. Failed loads are not cached; their waiters get the same
+    error.
+    """
+
+    def __init__(self, maxsize=64, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def get(self, key, load):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return value
+                del self._entries[key]
+
+            pending = self._pending.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._pending[key] = _PendingLoad()
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            pending.value = load()
+        except Exception as e:
+            pending.error = e
+            raise
+        else:
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl, pending.value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.stats["evictions"] += 1
+            return pending.value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.done.set()
+
+    def __len__(self):
+        return len(self._entries)
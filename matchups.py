@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Matchup resolution for Arcade Fantasy Sports Display
+Indexes the current scoreboard by team id so each team's matchup is an O(1) lookup
+"""
+
+from records import Matchup
+
+
+def _side_points(side):
+    """Live total for one side of a matchup, falling back to the settled total"""
+    if 'totalPointsLive' in side:
+        return float(side['totalPointsLive'])
+    return float(side.get('totalPoints', 0.0))
+
+
+def _side_status(points, opponent_points, winner, side):
+    if winner in ('HOME', 'AWAY'):
+        return "Winning" if winner == side else "Losing"
+    if winner == 'TIE' or points == opponent_points:
+        return "Tied"
+    return "Winning" if points > opponent_points else "Losing"
+
+
+def _set_matchup(index, team_id, values):
+    """Update the team's Matchup record in place, creating it on first sight"""
+    matchup = index.get(team_id)
+    if matchup is None:
+        matchup = Matchup(team_id)
+    matchup.update(values)
+    return matchup
+
+
+def build_matchup_index(scoreboard, previous=None):
+    """Build a team_id -> Matchup record map from a raw ESPN scoreboard response
+
+    Each record holds the team's own view of its matchup (points, opponent
+    id, opponent points, status), so callers never scan the schedule per
+    team. Records from the previous index are reused and updated in place.
+    """
+    previous = previous or {}
+    index = {}
+    if not scoreboard:
+        return index
+
+    for matchup in scoreboard.get('schedule', []):
+        home = matchup.get('home')
+        away = matchup.get('away')
+        winner = matchup.get('winner', 'UNDECIDED')
+        matchup_id = matchup.get('id')
+
+        if home and not away:
+            # A team with no away side is on bye this period
+            index[home['teamId']] = _set_matchup(previous, home['teamId'], {
+                "matchup_id": matchup_id,
+                "opponent_id": None,
+                "points": _side_points(home),
+                "opponent_points": 0.0,
+                "status": "Bye"
+            })
+            continue
+        if not home or not away:
+            continue
+
+        home_points = _side_points(home)
+        away_points = _side_points(away)
+        index[home['teamId']] = _set_matchup(previous, home['teamId'], {
+            "matchup_id": matchup_id,
+            "opponent_id": away['teamId'],
+            "points": home_points,
+            "opponent_points": away_points,
+            "status": _side_status(home_points, away_points, winner, 'HOME')
+        })
+        index[away['teamId']] = _set_matchup(previous, away['teamId'], {
+            "matchup_id": matchup_id,
+            "opponent_id": home['teamId'],
+            "points": away_points,
+            "opponent_points": home_points,
+            "status": _side_status(away_points, home_points, winner, 'AWAY')
+        })
+
+    return index
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+In-process metrics for Arcade Fantasy Sports Display
+Counters, gauges and histograms rendered in the Prometheus text exposition format
+"""
+
+import bisect
+import threading
+
+# Default latency buckets in seconds, from fast API hits to slow ESPN fetches
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, labels, extra=()):
+    pairs = list(zip(labelnames, labels)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base metric: one value (or histogram) per label combination
+
+    Each metric has its own small lock held only for the update itself, so
+    hot paths never contend on a global lock.
+    """
+
+    TYPE = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _samples(self):
+        with self._lock:
+            return [(self.name, labels, value, ()) for labels, value in self._values.items()]
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.TYPE}']
+        for name, labels, value, extra in self._samples():
+            lines.append(f'{name}{_format_labels(self.labelnames, labels, extra)} {_format_value(value)}')
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    TYPE = 'counter'
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    TYPE = 'gauge'
+
+    def set(self, value, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+
+class CallbackMetric(Metric):
+    """Metric read from a function at scrape time, e.g. a client count or transport stats
+
+    The function returns a number, or a dict of {label values tuple: number}.
+    """
+
+    def __init__(self, name, documentation, function, labelnames=(), metric_type='gauge'):
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+        self.TYPE = metric_type
+
+    def _samples(self):
+        values = self.function()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [(self.name, labels, value, ()) for labels, value in values.items()]
+
+
+class Histogram(Metric):
+    TYPE = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                # Per-bucket (non-cumulative) counts, sum, count
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self):
+        with self._lock:
+            states = [(labels, list(state[0]), state[1], state[2]) for labels, state in self._values.items()]
+        samples = []
+        for labels, counts, total, count in states:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                samples.append((f'{self.name}_bucket', labels, cumulative, [('le', _format_value(float(bound)))]))
+            samples.append((f'{self.name}_sum', labels, total, ()))
+            samples.append((f'{self.name}_count', labels, count, ()))
+        return samples
+
+
+class MetricsRegistry:
+    """Named metrics of this process, rendered together for /metrics"""
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def _add(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._add(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._add(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._add(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name, documentation, function, labelnames=(), metric_type='gauge'):
+        return self._add(CallbackMetric(name, documentation, function, labelnames, metric_type))
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics)
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Player box scores for Arcade Fantasy Sports Display
+Ingests per-player live points, projections and lineup slots from each league's
+scoreboard and recomputes only the players whose stat lines changed
+"""
+
+import importlib
+import threading
+
+from records import PlayerLine, encode_json
+
+# Lineup slots that do not count towards a team's score
+RESERVE_SLOTS = {'BE', 'IR', 'IL'}
+
+_sport_constants = {}
+
+
+def matchup_document_name(key, matchup_id):
+    """Shared store name of a matchup breakdown, from its league's (league_id, sport, year) key"""
+    league_id, sport, year = key
+    return f"matchup/{sport}/{league_id}/{year}/{matchup_id}"
+
+
+def sport_constants(sport):
+    """(slot id -> name, pro team id -> abbreviation) for a sport, imported on first use"""
+    constants = _sport_constants.get(sport)
+    if constants is None:
+        module = importlib.import_module(f'espn_api.{sport}.constant')
+        constants = _sport_constants[sport] = (module.POSITION_MAP, module.PRO_TEAM_MAP)
+    return constants
+
+
+def stat_signature(entry, scoring_period):
+    """Cheap fingerprint of a roster entry's stat line
+
+    Only the slot, injury status and the applied totals of the current
+    scoring period are read, so an unchanged player costs one tuple
+    comparison instead of a full re-parse.
+    """
+    pool = entry.get('playerPoolEntry', {})
+    player = pool.get('player', {})
+    return (
+        entry.get('lineupSlotId'),
+        pool.get('appliedStatTotal'),
+        player.get('injuryStatus'),
+        tuple((stats.get('statSourceId'), stats.get('appliedTotal')) for stats in player.get('stats', ())
+              if stats.get('scoringPeriodId') == scoring_period)
+    )
+
+
+def parse_player(entry, team_id, scoring_period, position_map, pro_team_map):
+    """Normalized player line for one roster entry"""
+    pool = entry.get('playerPoolEntry', {})
+    player = pool.get('player', {})
+    player_id = player.get('id', entry.get('playerId'))
+
+    points = pool.get('appliedStatTotal')
+    projected = None
+    for stats in player.get('stats', ()):
+        if stats.get('scoringPeriodId') != scoring_period:
+            continue
+        if stats.get('statSourceId') == 1:
+            projected = stats.get('appliedTotal')
+        elif points is None:
+            points = stats.get('appliedTotal')
+
+    # Main position is the first eligible slot that is not a combo slot, as in espn_api
+    position = None
+    for slot_id in player.get('eligibleSlots', ()):
+        name = position_map.get(slot_id, '')
+        if name and '/' not in name and slot_id != 25:
+            position = name
+            break
+
+    slot = position_map.get(entry.get('lineupSlotId'), '')
+    return {
+        "player_id": player_id,
+        "team_id": team_id,
+        "name": player.get('fullName'),
+        "position": position,
+        "slot": slot,
+        "starter": slot not in RESERVE_SLOTS,
+        "pro_team": pro_team_map.get(player.get('proTeamId')),
+        "points": round(float(points or 0.0), 2),
+        "projected_points": round(float(projected), 2) if projected is not None else None,
+        "injury_status": player.get('injuryStatus')
+    }
+
+
+class MatchupBreakdown:
+    """Player lines of both sides of one matchup, encoded on demand"""
+
+    __slots__ = ('matchup_id', 'team_ids', 'team_names', 'winner', 'dirty', '_body')
+
+    def __init__(self, matchup_id):
+        self.matchup_id = matchup_id
+        self.team_ids = ()
+        self.team_names = {}
+        self.winner = None
+        self.dirty = True
+        self._body = None
+
+
+class LeaguePlayers:
+    """Player lines of one league's current scoring period
+
+    Lines are keyed by (team_id, player_id) and kept between refreshes
+    together with the stat signature they were parsed from. A refresh only
+    parses entries whose signature changed, and only marks the matchups
+    containing them for re-encoding. `revision` moves whenever anything
+    in the league changed.
+    """
+
+    def __init__(self, league_id, sport):
+        self.league_id = league_id
+        self.sport = sport
+        self.scoring_period = None
+        self.lines = {}
+        self.signatures = {}
+        self.rosters = {}
+        self.matchups = {}
+        self.revision = 0
+        self._lock = threading.Lock()
+
+    def ingest(self, scoreboard, team_names=None):
+        """Apply a raw scoreboard response; returns how many player lines changed"""
+        team_names = team_names or {}
+        scoring_period = scoreboard.get('scoringPeriodId')
+        position_map, pro_team_map = sport_constants(self.sport)
+        changed = 0
+        modified = False
+
+        with self._lock:
+            if scoring_period != self.scoring_period:
+                # A new scoring period has different stat lines for everyone
+                self.signatures.clear()
+                self.scoring_period = scoring_period
+
+            seen_matchups = set()
+            seen_teams = set()
+            for matchup in scoreboard.get('schedule', ()):
+                matchup_id = matchup.get('id')
+                sides = [matchup[side] for side in ('home', 'away') if matchup.get(side)]
+                if not sides:
+                    continue
+                breakdown = self.matchups.get(matchup_id)
+                if breakdown is None:
+                    breakdown = self.matchups[matchup_id] = MatchupBreakdown(matchup_id)
+                team_ids = tuple(side['teamId'] for side in sides)
+                names = {team_id: team_names.get(team_id) for team_id in team_ids}
+                winner = matchup.get('winner', 'UNDECIDED')
+                if breakdown.team_ids != team_ids or breakdown.team_names != names or breakdown.winner != winner:
+                    breakdown.team_ids = team_ids
+                    breakdown.team_names = names
+                    breakdown.winner = winner
+                    breakdown.dirty = modified = True
+                seen_matchups.add(matchup_id)
+
+                for side in sides:
+                    team_id = side['teamId']
+                    seen_teams.add(team_id)
+                    entries = side.get('rosterForCurrentScoringPeriod', {}).get('entries', ())
+                    roster = []
+                    for entry in entries:
+                        key = (team_id, entry.get('playerId'))
+                        roster.append(key)
+                        signature = stat_signature(entry, scoring_period)
+                        if self.signatures.get(key) == signature:
+                            continue
+                        self.signatures[key] = signature
+                        line = self.lines.get(key)
+                        if line is None:
+                            line = self.lines[key] = PlayerLine(f"{self.league_id}-{team_id}-{key[1]}")
+                        if line.update(parse_player(entry, team_id, scoring_period, position_map, pro_team_map)):
+                            changed += 1
+                            breakdown.dirty = modified = True
+
+                    if roster != self.rosters.get(team_id):
+                        # Players added, dropped or reordered
+                        for key in set(self.rosters.get(team_id, ())) - set(roster):
+                            self.lines.pop(key, None)
+                            self.signatures.pop(key, None)
+                        self.rosters[team_id] = roster
+                        breakdown.dirty = modified = True
+
+            for matchup_id in set(self.matchups) - seen_matchups:
+                del self.matchups[matchup_id]
+                modified = True
+            for team_id in set(self.rosters) - seen_teams:
+                for key in self.rosters.pop(team_id):
+                    self.lines.pop(key, None)
+                    self.signatures.pop(key, None)
+                modified = True
+            if modified:
+                self.revision += 1
+        return changed
+
+    def in_play(self):
+        """Whether an undecided matchup has a starter yet to reach their projection
+
+        True from the start of a matchup period until ESPN decides every
+        matchup, so a league is kept live on its own scoreboard rather than
+        on whether a pro-scores provider reports live games.
+        """
+        with self._lock:
+            for breakdown in self.matchups.values():
+                if breakdown.winner != 'UNDECIDED':
+                    continue
+                for team_id in breakdown.team_ids:
+                    for key in self.rosters.get(team_id, ()):
+                        line = self.lines.get(key)
+                        if (line is not None and line.starter and line.projected_points is not None
+                                and line.projected_points > line.points):
+                            return True
+        return False
+
+    def simulation_inputs(self):
+        """(winner, [(team_id, [(points, projected_points), ...] of starters), ...]) per matchup"""
+        inputs = []
+        with self._lock:
+            for breakdown in self.matchups.values():
+                sides = []
+                for team_id in breakdown.team_ids:
+                    starters = [(line.points, line.projected_points) for line in
+                                (self.lines.get(key) for key in self.rosters.get(team_id, ()))
+                                if line is not None and line.starter]
+                    sides.append((team_id, starters))
+                inputs.append((breakdown.winner, sides))
+        return inputs
+
+    def _side(self, team_id, team_name):
+        players = [self.lines[key] for key in self.rosters.get(team_id, ()) if key in self.lines]
+        starters = [line for line in players if line.starter]
+        fragments = [line.fragment for line in players]
+        summary = {
+            "team_id": team_id,
+            "name": team_name,
+            "points": round(sum(line.points for line in starters), 2),
+            "projected_points": round(sum(line.points if line.projected_points is None else line.projected_points
+                                       for line in starters), 2)
+        }
+        # Player fragments are spliced in as cached bytes
+        return encode_json(summary)[:-1] + b',"players":[' + b','.join(fragments) + b']}'
+
+    def matchup_body(self, matchup_id):
+        """Encoded breakdown of one matchup, or None if it is not on the scoreboard"""
+        with self._lock:
+            breakdown = self.matchups.get(matchup_id)
+            if breakdown is None:
+                return None
+            if breakdown.dirty or breakdown._body is None:
+                sides = b','.join(self._side(team_id, breakdown.team_names.get(team_id))
+                                  for team_id in breakdown.team_ids)
+                header = encode_json({"league_id": self.league_id, "matchup_id": matchup_id,
+                                      "scoring_period": self.scoring_period, "sport": self.sport})
+                breakdown._body = header[:-1] + b',"teams":[' + sides + b']}'
+                breakdown.dirty = False
+            return breakdown._body
+
+    def __len__(self):
+        return len(self.lines)
+
+
+class PlayerBoxScores:
+    """Player lines of every tracked league, keyed like the league registry"""
+
+    def __init__(self):
+        self._leagues = {}
+        self._lock = threading.Lock()
+
+    def ingest(self, key, league_id, sport, scoreboard, team_names=None):
+        with self._lock:
+            league = self._leagues.get(key)
+            if league is None:
+                league = self._leagues[key] = LeaguePlayers(league_id, sport)
+        return league.ingest(scoreboard, team_names)
+
+    def sync(self, keys):
+        """Forget leagues that are no longer configured"""
+        keys = set(keys)
+        with self._lock:
+            for key in set(self._leagues) - keys:
+                del self._leagues[key]
+
+    def revision(self):
+        """Changes whenever any league's player lines or matchups change"""
+        with self._lock:
+            return tuple(sorted((key, league.revision) for key, league in self._leagues.items()))
+
+    def in_play(self, key):
+        """Whether the league with this key has a matchup still in play"""
+        with self._lock:
+            league = self._leagues.get(key)
+        return league is not None and league.in_play()
+
+    def simulation_inputs(self):
+        """Every current matchup of every league as (league key, winner, sides)"""
+        with self._lock:
+            leagues = list(self._leagues.items())
+        return [(key, winner, sides) for key, league in leagues
+                for winner, sides in league.simulation_inputs()]
+
+    def matchup_bodies(self):
+        """((league key, matchup_id), encoded breakdown) of every current matchup"""
+        with self._lock:
+            leagues = list(self._leagues.items())
+        for key, league in leagues:
+            with league._lock:
+                matchup_ids = list(league.matchups)
+            for matchup_id in matchup_ids:
+                body = league.matchup_body(matchup_id)
+                if body is not None:
+                    yield (key, matchup_id), body
+
+    def matchup_body(self, key, matchup_id):
+        """Encoded breakdown of one matchup of the league with this key, or None"""
+        with self._lock:
+            league = self._leagues.get(key)
+        return league.matchup_body(matchup_id) if league is not None else None
+
+    def __len__(self):
+        with self._lock:
+            leagues = list(self._leagues.values())
+        return sum(len(league) for league in leagues)
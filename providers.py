@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Pro sports score providers for Arcade Fantasy Sports Display
+Each provider produces normalized game records for one sport's `sports.<sport>.games` section
+"""
+
+import json
+import os
+import random
+import time
+
+import requests
+
+ESPN_SCOREBOARD_URLS = {
+    'football': 'https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard',
+    'basketball': 'https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard',
+    'baseball': 'https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard'
+}
+
+ESPN_STATES = {
+    'pre': 'Scheduled',
+    'in': 'Live',
+    'post': 'Final'
+}
+
+
+def normalize_game(sport, game):
+    """Coerce a game record into the shape the display expects"""
+    record = {
+        "id": str(game["id"]),
+        "sport": sport,
+        "home_team": game.get("home_team", "TBD"),
+        "away_team": game.get("away_team", "TBD"),
+        "home_score": int(game.get("home_score") or 0),
+        "away_score": int(game.get("away_score") or 0),
+        "status": game.get("status", "Scheduled")
+    }
+    for field in ("quarter", "inning", "time_remaining"):
+        if game.get(field):
+            record[field] = str(game[field])
+    return record
+
+
+class ScoresProvider:
+    """Base class for a source of games for one sport
+
+    fetch() returns a list of normalized games, or None when the source
+    reports nothing new since the last fetch. `reports_live` says whether a
+    Live game means real games are in progress.
+    """
+
+    reports_live = True
+
+    def __init__(self, sport, refresh_interval):
+        self.sport = sport
+        self.refresh_interval = refresh_interval
+
+    def fetch(self):
+        raise NotImplementedError
+
+
+class SampleScoresProvider(ScoresProvider):
+    """Built-in demonstration games with randomly moving live scores"""
+
+    reports_live = False
+
+    def __init__(self, sport, sample_games, refresh_interval, update_chance=0.3):
+        super().__init__(sport, refresh_interval)
+        self.sample_games = sample_games
+        self.update_chance = update_chance
+
+    def fetch(self):
+        games = [normalize_game(self.sport, game) for game in self.sample_games()]
+        for game in games:
+            if game["status"] == "Live" and random.random() < self.update_chance:
+                game["home_score"] += random.randint(0, 3)
+                game["away_score"] += random.randint(0, 3)
+        return games
+
+
+class FixtureScoresProvider(ScoresProvider):
+    """Games read from a JSON file shaped like the `sports` section
+
+    The file is only re-parsed when its modification time changes, which
+    makes it suitable for offline displays and tests.
+    """
+
+    def __init__(self, sport, path, refresh_interval):
+        super().__init__(sport, refresh_interval)
+        self.path = path
+        self._mtime = None
+
+    def fetch(self):
+        mtime = os.path.getmtime(self.path)
+        if mtime == self._mtime:
+            return None
+        with open(self.path) as fixture_file:
+            section = json.load(fixture_file).get(self.sport, {})
+        self._mtime = mtime
+        return [normalize_game(self.sport, game) for game in section.get("games", [])]
+
+
+class ESPNScoreboardProvider(ScoresProvider):
+    """Live games from ESPN's public scoreboard feed
+
+    Uses conditional requests (ETag / Last-Modified) so an unchanged feed
+    costs a 304 and no parsing. `session` can be any object with a
+    requests-style get(), such as the shared EspnTransport.
+    """
+
+    def __init__(self, sport, refresh_interval, session=None, timeout=10):
+        super().__init__(sport, refresh_interval)
+        self.url = ESPN_SCOREBOARD_URLS[sport]
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self._etag = None
+        self._last_modified = None
+
+    def fetch(self):
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+
+        response = self.session.get(self.url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        games = [self._parse_event(event) for event in response.json().get('events', [])]
+        self._etag = response.headers.get('ETag')
+        self._last_modified = response.headers.get('Last-Modified')
+        return [game for game in games if game is not None]
+
+    def _parse_event(self, event):
+        competitions = event.get('competitions') or [{}]
+        competitors = {team.get('homeAway'): team for team in competitions[0].get('competitors', [])}
+        if 'home' not in competitors or 'away' not in competitors:
+            return None
+
+        status = event.get('status', {})
+        status_name = ESPN_STATES.get(status.get('type', {}).get('state'), 'Scheduled')
+        period = status.get('period') or 0
+
+        game = {
+            "id": f"{self.sport}-{event['id']}",
+            "home_team": competitors['home'].get('team', {}).get('displayName', 'TBD'),
+            "away_team": competitors['away'].get('team', {}).get('displayName', 'TBD'),
+            "home_score": competitors['home'].get('score', 0),
+            "away_score": competitors['away'].get('score', 0),
+            "status": status_name
+        }
+        if status_name == 'Live':
+            if self.sport == 'baseball':
+                game["inning"] = period
+            else:
+                game["quarter"] = f"Q{period}" if period <= 4 else "OT"
+                game["time_remaining"] = status.get('displayClock')
+        elif status_name == 'Final' and self.sport != 'baseball':
+            game["quarter"] = "Final"
+        elif status_name == 'Scheduled':
+            game["time_remaining"] = status.get('type', {}).get('shortDetail')
+        return normalize_game(self.sport, game)
+
+
+class ScoresPipeline:
+    """Runs each sport's provider on its own cadence and keeps the latest games
+
+    Every provider is parsed at most once per refresh interval; the resulting
+    section is shared by every display.
+    """
+
+    def __init__(self, providers):
+        self.providers = providers
+        self._games = {provider.sport: [] for provider in providers}
+        self._next_due = {provider.sport: 0.0 for provider in providers}
+
+    def refresh(self, now=None):
+        """Refresh due providers and return the `sports` section"""
+        now = time.time() if now is None else now
+        for provider in self.providers:
+            if now < self._next_due[provider.sport]:
+                continue
+            self._next_due[provider.sport] = now + provider.refresh_interval
+            try:
+                games = provider.fetch()
+            except Exception as e:
+                print(f"❌ Error loading {provider.sport} scores: {e}")
+                continue
+            if games is not None:
+                self._games[provider.sport] = games
+
+        return {sport: {"games": games} for sport, games in self._games.items()}
+
+    def next_due(self):
+        return min(self._next_due.values()) if self._next_due else None
+
+    def live_sports(self):
+        """Sports with a real game in progress as of the last refresh"""
+        return {provider.sport for provider in self.providers
+                if provider.reports_live and any(game["status"] == "Live" for game in self._games[provider.sport])}
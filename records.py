@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Compact typed records for Arcade Fantasy Sports Display
+Games, fantasy teams, matchups, player lines and standings are created once, updated in place and
+keep their own encoded JSON so unchanged records are never re-serialized
+"""
+
+import json
+
+
+def encode_json(data):
+    """Encode data the same way everywhere (compact, sorted keys)"""
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def team_record_id(league_id, sport, year, team_id):
+    """Id of a fantasy team record; one league id can be tracked for several sports and seasons"""
+    return f"{sport}-{league_id}-{year}-{team_id}"
+
+
+class Record:
+    """Base record with a stable id, slot storage and a cached JSON fragment
+
+    Subclasses list their fields in FIELDS and use them as __slots__. Fields
+    that are None are left out of the JSON, matching the optional keys of
+    the original dict records. `revision` counts the changes so a table can
+    tell which records moved since it last saw them.
+    """
+
+    __slots__ = ('id', 'revision', '_fragment')
+    FIELDS = ()
+
+    def __init__(self, record_id):
+        self.id = record_id
+        self.revision = 0
+        self._fragment = None
+        for field in self.FIELDS:
+            setattr(self, field, None)
+
+    def update(self, values):
+        """Copy fields from a dict in place; returns True if anything changed"""
+        changed = False
+        for field in self.FIELDS:
+            value = values.get(field)
+            if getattr(self, field) != value:
+                setattr(self, field, value)
+                changed = True
+        if changed:
+            self.revision += 1
+            self._fragment = None
+        return changed
+
+    def assign(self, **values):
+        """Set the given fields in place; returns True if any of them changed"""
+        changed = False
+        for field, value in values.items():
+            if getattr(self, field) != value:
+                setattr(self, field, value)
+                changed = True
+        if changed:
+            self.revision += 1
+            self._fragment = None
+        return changed
+
+    def values(self):
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def to_dict(self):
+        data = {"id": self.id}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        return data
+
+    @property
+    def fragment(self):
+        """Encoded JSON of this record, rebuilt only after a change"""
+        if self._fragment is None:
+            self._fragment = encode_json(self.to_dict())
+        return self._fragment
+
+
+class Game(Record):
+    FIELDS = ('sport', 'home_team', 'away_team', 'home_score', 'away_score',
+              'status', 'quarter', 'inning', 'time_remaining')
+    __slots__ = FIELDS
+
+
+class FantasyTeam(Record):
+    FIELDS = ('team_id', 'name', 'owner', 'points', 'opponent', 'opponent_points',
+              'status', 'league', 'league_id', 'sport', 'year', 'matchup_id', 'win_probability', 'stale')
+    __slots__ = FIELDS
+
+
+class Matchup(Record):
+    FIELDS = ('matchup_id', 'opponent_id', 'points', 'opponent_points', 'status')
+    __slots__ = FIELDS
+
+
+class PlayerLine(Record):
+    FIELDS = ('player_id', 'team_id', 'name', 'position', 'slot', 'starter', 'pro_team',
+              'points', 'projected_points', 'injury_status')
+    __slots__ = FIELDS
+
+
+class Standing(Record):
+    FIELDS = ('team_id', 'name', 'owner', 'league', 'league_id', 'sport', 'year', 'rank', 'wins', 'losses',
+              'ties', 'win_pct', 'games_back', 'streak', 'points_for', 'points_against', 'points_for_rank',
+              'points_against_rank', 'all_play_wins', 'all_play_losses', 'all_play_ties',
+              'power_score', 'power_rank')
+    __slots__ = FIELDS
+
+
+class RecordTable:
+    """Ordered records of one type, synced in place from lists of dicts or records
+
+    Rows that are already records (e.g. fantasy teams kept by the league
+    cache) are adopted as they are and compared by revision, so an unchanged
+    record costs one comparison. The table never writes into an adopted record.
+    """
+
+    def __init__(self, record_class):
+        self.record_class = record_class
+        self._records = {}
+        self._revisions = {}
+        self._order = []
+
+    def _adopt(self, record):
+        """Take a caller's record; returns True if it differs from what the table held"""
+        held = self._records.get(record.id)
+        if held is record:
+            changed = self._revisions[record.id] != record.revision
+        else:
+            changed = held is None or held.values() != record.values()
+            self._records[record.id] = record
+        self._revisions[record.id] = record.revision
+        return changed
+
+    def sync(self, rows):
+        """Update records from rows keyed by 'id'
+
+        Returns (changed records, removed ids). Records that did not change
+        keep their cached fragment.
+        """
+        changed = []
+        order = []
+        for row in rows:
+            if isinstance(row, Record):
+                if self._adopt(row):
+                    changed.append(row)
+                order.append(row.id)
+                continue
+            record = self._records.get(row["id"])
+            if record is None or row["id"] in self._revisions:
+                record = self.record_class(row["id"])
+                self._records[row["id"]] = record
+                self._revisions.pop(row["id"], None)
+                record.update(row)
+                changed.append(record)
+            elif record.update(row):
+                changed.append(record)
+            order.append(row["id"])
+
+        removed = []
+        if len(order) != len(self._records):
+            current = set(order)
+            removed = [record_id for record_id in self._records if record_id not in current]
+            for record_id in removed:
+                del self._records[record_id]
+                self._revisions.pop(record_id, None)
+        self._order = order
+        return changed, removed
+
+    def __iter__(self):
+        records = self._records
+        return (records[record_id] for record_id in self._order)
+
+    def __len__(self):
+        return len(self._order)
+
+    def encode(self):
+        """JSON array of every record, joined from cached fragments"""
+        return b'[' + b','.join(record.fragment for record in self) + b']'
+
+
+class SportsDataStore:
+    """Record tables behind a sports_data document
+
+    sync() applies a freshly built sports_data dict in place and returns the
+    diff against the previous sync (its fantasy teams may be FantasyTeam
+    records, which are adopted); encode() assembles the full JSON body
+    from cached record fragments.
+    """
+
+    def __init__(self):
+        self.games = {}
+        self.teams = RecordTable(FantasyTeam)
+        self.meta = {}
+
+    def sync(self, data):
+        sports = data.get("sports", {})
+        diff_sports = {}
+        for sport, section in sports.items():
+            table = self.games.get(sport)
+            if table is None:
+                table = self.games[sport] = RecordTable(Game)
+            changed, removed = table.sync(section.get("games", []))
+            if changed or removed:
+                diff_sports[sport] = {"changed": [record.to_dict() for record in changed], "removed": removed}
+        for sport in list(self.games):
+            if sport not in sports:
+                removed = [record.id for record in self.games.pop(sport)]
+                diff_sports[sport] = {"changed": [], "removed": removed}
+
+        changed, removed = self.teams.sync(data.get("fantasy_teams", []))
+        self.meta = {key: value for key, value in data.items() if key not in ("sports", "fantasy_teams")}
+        return {
+            "sports": diff_sports,
+            "fantasy_teams": {"changed": [record.to_dict() for record in changed], "removed": removed}
+        }
+
+    def encode(self, **extra):
+        """Full document as compact JSON with sorted keys"""
+        meta = dict(self.meta, **extra)
+        parts = []
+        for key in sorted(set(meta) | {"sports", "fantasy_teams"}):
+            if key == "sports":
+                value = b'{' + b','.join(
+                    encode_json(sport) + b':{"games":' + table.encode() + b'}'
+                    for sport, table in sorted(self.games.items())
+                ) + b'}'
+            elif key == "fantasy_teams":
+                value = self.teams.encode()
+            else:
+                value = encode_json(meta[key])
+            parts.append(encode_json(key) + b':' + value)
+        return b'{' + b','.join(parts) + b'}'
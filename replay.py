@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+ESPN record/replay for Arcade Fantasy Sports Display
+Captures ESPN responses to fixture files and serves them from a local stub server
+with configurable latency and errors, so the refresh pipeline runs without ESPN
+
+Usage:
+  python replay.py record [--dir fixtures/espn]       one refresh of the configured leagues, recorded
+  python replay.py synth [--dir fixtures/espn] [--leagues 10] [--teams 10]
+  python replay.py serve [--dir fixtures/espn] [--port 8765] [--latency 0.05] [--error-rate 0.02]
+
+Point the app at the stub with ESPN_BASE_URL=http://127.0.0.1:8765.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from espn_api.requests.espn_requests import EspnFantasyRequests
+
+from transport import EspnTransport
+
+DEFAULT_FIXTURE_DIR = os.path.join('fixtures', 'espn')
+
+# FETCH_CYCLE_TIMEOUT while recording: the one recorded cycle waits for every league
+RECORD_CYCLE_TIMEOUT = 600
+
+# Query parameters that select what a response contains; the rest (scoring
+# period, cache busters) only narrow it
+ROUTE_PARAMS = ('view', 'seasonId')
+
+
+def _normalize_filter(fantasy_filter):
+    if not fantasy_filter:
+        return ''
+    try:
+        return json.dumps(json.loads(fantasy_filter), sort_keys=True, separators=(',', ':'))
+    except ValueError:
+        return fantasy_filter
+
+
+def fixture_key(path, query, fantasy_filter=None):
+    """Exact fixture key: path, sorted query and the x-fantasy-filter header"""
+    key = path + '?' + urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    fantasy_filter = _normalize_filter(fantasy_filter)
+    return key + '#' + fantasy_filter if fantasy_filter else key
+
+
+def fixture_route(path, query):
+    """Loose fixture key: path and the view parameters only
+
+    Used when no exact recording exists, so a recorded league still replays
+    after its scoring period or filters move on.
+    """
+    pairs = sorted((name, value) for name, value in parse_qsl(query) if name in ROUTE_PARAMS)
+    return path + '?' + urlencode(pairs)
+
+
+class FixtureStore:
+    """Recorded ESPN responses, in memory and optionally in a directory
+
+    Each response is one JSON file holding its exact key, route, status and
+    body, so fixtures can be inspected and edited by hand.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._exact = {}
+        self._routes = {}
+        self._files = {}
+        self._lock = threading.Lock()
+        if directory and os.path.isdir(directory):
+            self.load()
+
+    def load(self):
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith('.json'):
+                with open(os.path.join(self.directory, name), encoding='utf-8') as f:
+                    fixture = json.load(f)
+                self._add(fixture)
+
+    def _add(self, fixture):
+        body = fixture['body']
+        encoded = body.encode('utf-8') if isinstance(body, str) else json.dumps(body, separators=(',', ':')).encode('utf-8')
+        response = (fixture['status'], encoded)
+        with self._lock:
+            self._exact[fixture['key']] = response
+            self._routes[fixture['route']] = response
+            self._files[fixture['key']] = fixture
+
+    def add(self, url, status, body, fantasy_filter=None):
+        """Record a response for a full request URL; `body` is parsed JSON or text"""
+        parts = urlsplit(url)
+        self._add({
+            'key': fixture_key(parts.path, parts.query, fantasy_filter),
+            'route': fixture_route(parts.path, parts.query),
+            'url': url,
+            'status': status,
+            'body': body
+        })
+
+    def lookup(self, path, query, fantasy_filter=None):
+        """(status, body bytes) for a request, or None when nothing was recorded"""
+        with self._lock:
+            response = self._exact.get(fixture_key(path, query, fantasy_filter))
+            if response is None:
+                response = self._routes.get(fixture_route(path, query))
+            return response
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            fixtures = list(self._files.values())
+        for fixture in fixtures:
+            name = hashlib.sha1(fixture['key'].encode('utf-8')).hexdigest()[:16] + '.json'
+            with open(os.path.join(self.directory, name), 'w', encoding='utf-8') as f:
+                json.dump(fixture, f, indent=1, sort_keys=True)
+        return len(fixtures)
+
+    def __len__(self):
+        return len(self._files)
+
+
+class RecordingTransport(EspnTransport):
+    """EspnTransport that copies every final response into a FixtureStore"""
+
+    def __init__(self, store, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+
+    def get(self, url, params=None, headers=None, cookies=None, timeout=None):
+        response = super().get(url, params=params, headers=headers, cookies=cookies, timeout=timeout)
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        self.store.add(response.request.url, response.status_code, body,
+                       fantasy_filter=response.request.headers.get('x-fantasy-filter'))
+        return response
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        replay = self.server.replay
+        parts = urlsplit(self.path)
+        replay.delay()
+
+        if replay.inject_error():
+            status, body = replay.error_status, b'{"messages":["injected replay error"]}'
+        else:
+            response = replay.store.lookup(parts.path, parts.query, self.headers.get('x-fantasy-filter'))
+            if response is None:
+                replay.count('misses')
+                status, body = 404, b'{"messages":["no recorded response"]}'
+            else:
+                status, body = response
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer:
+    """Local HTTP server that answers ESPN requests from a FixtureStore
+
+    Every response waits `latency` seconds plus up to `jitter` more, and a
+    fraction `error_rate` of requests fail with `error_status` (503 by
+    default, which EspnTransport retries). Connections are kept alive like
+    ESPN's, so the transport's pooling behaves as it does in production.
+    """
+
+    def __init__(self, store, host='127.0.0.1', port=0, latency=0.0, jitter=0.0,
+                 error_rate=0.0, error_status=503, seed=None):
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors': 0, 'misses': 0}
+        self._server = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self._server.daemon_threads = True
+        self._server.replay = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def delay(self):
+        with self._lock:
+            self.stats['requests'] += 1
+            seconds = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def inject_error(self):
+        with self._lock:
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            if failed:
+                self.stats['errors'] += 1
+        return failed
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+# Synthetic football leagues shaped like real ESPN responses
+
+SYNTHETIC_LEAGUE_BASE_ID = 900000
+ROSTER_SLOTS = (0, 2, 2, 4, 4, 6, 23, 16, 17, 20, 20, 20, 20)  # QB, RB x2, WR x2, TE, FLEX, D/ST, K, bench x4
+ELIGIBLE_SLOTS = {0: [0, 7, 20, 21], 2: [2, 3, 23, 7, 20, 21], 4: [4, 3, 5, 23, 7, 20, 21],
+                  6: [6, 5, 23, 7, 20, 21], 16: [16, 20, 21], 17: [17, 20, 21]}
+
+
+def synthetic_leagues(count, year=2024, sport='football'):
+    """League configs for `count` synthetic leagues, as parsed from FANTASY_LEAGUES"""
+    return [{'league_id': SYNTHETIC_LEAGUE_BASE_ID + index, 'sport': sport, 'year': year,
+             'name': f"Replay League {index + 1}"} for index in range(count)]
+
+
+def leagues_setting(leagues):
+    """FANTASY_LEAGUES value for a list of league configs"""
+    return ','.join(f"{league['league_id']}:{league['sport']}:{league['year']}:{league['name']}"
+                    for league in leagues)
+
+
+def _player(player_id, slot, year, week, rng):
+    points = round(rng.uniform(0, 25), 2)
+    position = slot if slot in ELIGIBLE_SLOTS else rng.choice((0, 2, 4, 6))
+    if slot == 23:
+        position = rng.choice((2, 4, 6))
+    return {
+        'lineupSlotId': slot,
+        'playerId': player_id,
+        'playerPoolEntry': {
+            'id': player_id,
+            'acquisitionType': 'DRAFT',
+            'appliedStatTotal': points,
+            'player': {
+                'id': player_id,
+                'fullName': f"Player {player_id}",
+                'eligibleSlots': ELIGIBLE_SLOTS[position],
+                'proTeamId': rng.randint(1, 30),
+                'injuryStatus': 'ACTIVE',
+                'injured': False,
+                'stats': [
+                    {'seasonId': year, 'scoringPeriodId': week, 'statSourceId': 0, 'statSplitTypeId': 1,
+                     'appliedTotal': points, 'appliedStats': {'3': points}},
+                    {'seasonId': year, 'scoringPeriodId': week, 'statSourceId': 1, 'statSplitTypeId': 1,
+                     'appliedTotal': round(points * rng.uniform(0.7, 1.3), 2), 'appliedStats': {'3': points}}
+                ]
+            }
+        }
+    }
+
+
+def _schedule(team_ids, weeks, rng):
+    """Round-robin matchups for every period up to `weeks`; the last one is live"""
+    schedule = []
+    rotation = list(team_ids)
+    for period in range(1, weeks + 1):
+        for index in range(len(rotation) // 2):
+            home_points = round(rng.uniform(70, 150), 2)
+            away_points = round(rng.uniform(70, 150), 2)
+            live = period == weeks
+            schedule.append({
+                'id': len(schedule) + 1,
+                'matchupPeriodId': period,
+                'winner': 'UNDECIDED' if live else ('HOME' if home_points >= away_points else 'AWAY'),
+                'home': {'teamId': rotation[index], 'totalPoints': home_points},
+                'away': {'teamId': rotation[-1 - index], 'totalPoints': away_points}
+            })
+        rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+    return schedule
+
+
+def synthesize_league(store, league_id, year=2024, team_count=10, week=5, seed=None):
+    """Add fixtures for one synthetic football league to a FixtureStore
+
+    Covers every request a build and a scoreboard refresh make: league
+    settings/teams/rosters/schedule, draft, pro players, pro schedule and
+    the live scoreboard for `week`.
+    """
+    if team_count % 2:
+        raise ValueError("Synthetic leagues need an even number of teams")
+    rng = random.Random(league_id if seed is None else seed)
+    requests = EspnFantasyRequests(sport='nfl', year=year, league_id=league_id)
+    team_ids = list(range(1, team_count + 1))
+
+    rosters = {}
+    players = []
+    for team_id in team_ids:
+        entries = []
+        for slot_index, slot in enumerate(ROSTER_SLOTS):
+            player_id = league_id * 1000 + team_id * 20 + slot_index
+            entries.append(_player(player_id, slot, year, week, rng))
+            players.append({'id': player_id, 'fullName': f"Player {player_id}"})
+        rosters[team_id] = entries
+
+    schedule = _schedule(team_ids, week, rng)
+    members = [{'id': f"{{MEMBER-{team_id}}}", 'displayName': f"owner{team_id}",
+                'firstName': "Owner", 'lastName': str(team_id)} for team_id in team_ids]
+    teams = []
+    for seed_rank, team_id in enumerate(team_ids, start=1):
+        played = [side for matchup in schedule if matchup['winner'] != 'UNDECIDED'
+                  for name, side in (('home', matchup['home']), ('away', matchup['away']))
+                  if side['teamId'] == team_id]
+        teams.append({
+            'id': team_id,
+            'abbrev': f"T{team_id}",
+            'name': f"Team {team_id} of {league_id}",
+            'divisionId': 0,
+            'owners': [f"{{MEMBER-{team_id}}}"],
+            'playoffSeed': seed_rank,
+            'rankCalculatedFinal': 0,
+            'record': {'overall': {'wins': rng.randint(0, week - 1), 'losses': rng.randint(0, week - 1),
+                                   'ties': 0, 'pointsFor': round(sum(side['totalPoints'] for side in played), 2),
+                                   'pointsAgainst': round(rng.uniform(70, 150) * len(played), 2),
+                                   'streakLength': 1, 'streakType': 'WIN'}},
+            'roster': {'entries': rosters[team_id]}
+        })
+
+    status = {'currentMatchupPeriod': week, 'firstScoringPeriod': 1, 'finalScoringPeriod': 17,
+              'latestScoringPeriod': week, 'previousSeasons': []}
+    settings = {
+        'name': f"Replay League {league_id}",
+        'size': team_count,
+        'scheduleSettings': {'matchupPeriodCount': 14, 'matchupPeriods': {}, 'playoffTeamCount': 4,
+                             'playoffSeedingRule': 'TOTAL_POINTS_SCORED', 'divisions': [{'id': 0, 'name': 'League'}]},
+        'tradeSettings': {'vetoVotesRequired': 4},
+        'draftSettings': {'keeperCount': 0},
+        'scoringSettings': {'matchupTieRule': 'NONE', 'playoffMatchupTieRule': 'NONE', 'scoringItems': []},
+        'acquisitionSettings': {'isUsingAcquisitionBudget': False},
+        'rosterSettings': {'lineupSlotCounts': {}}
+    }
+    league_url = requests.LEAGUE_ENDPOINT
+    store.add(f"{league_url}?{urlencode([('view', view) for view in ('mTeam', 'mRoster', 'mMatchup', 'mSettings', 'mStandings')])}",
+              200, {'id': league_id, 'seasonId': year, 'scoringPeriodId': week, 'status': status,
+                    'settings': settings, 'members': members, 'teams': teams, 'schedule': schedule})
+    store.add(f"{league_url}?view=mDraftDetail", 200, {'draftDetail': {'drafted': False}})
+    store.add(f"{requests.ENDPOINT}?view=proTeamSchedules_wl", 200, {'settings': {'proTeams': []}})
+    store.add(f"{requests.ENDPOINT}/players?view=players_wl", 200, players)
+
+    live = []
+    for matchup in schedule:
+        if matchup['matchupPeriodId'] != week:
+            continue
+        live_matchup = dict(matchup)
+        for side in ('home', 'away'):
+            entries = rosters[matchup[side]['teamId']]
+            live_points = round(sum(entry['playerPoolEntry']['appliedStatTotal'] for entry in entries
+                                    if entry['lineupSlotId'] != 20), 2)
+            live_matchup[side] = dict(matchup[side], totalPointsLive=live_points,
+                                      rosterForCurrentScoringPeriod={'appliedStatTotal': live_points,
+                                                                     'entries': entries})
+        live.append(live_matchup)
+    store.add(f"{league_url}?view=mMatchupScore&view=mScoreboard&scoringPeriodId={week}", 200,
+              {'id': league_id, 'seasonId': year, 'scoringPeriodId': week, 'status': status, 'schedule': live})
+
+
+def record(directory):
+    """Run one refresh cycle against ESPN with every response recorded"""
+    import app
+    from config import load_config
+    from dotenv import load_dotenv
+
+    store = FixtureStore(directory)
+    # A league left running in the background would be missing from the recording
+    load_dotenv()
+    app.create_app(load_config(environ=dict(os.environ, FETCH_CYCLE_TIMEOUT=str(RECORD_CYCLE_TIMEOUT))))
+    config = app.config
+    app.espn_transport = RecordingTransport(store, pool_size=config.ESPN_POOL_SIZE,
+                                            max_retries=config.ESPN_MAX_RETRIES,
+                                            backoff=config.ESPN_RETRY_BACKOFF, timeout=config.ESPN_TIMEOUT,
+                                            base_url=config.ESPN_BASE_URL or None)
+    app.scores_pipeline = app.build_scores_pipeline()
+    app.update_sports_data()
+    print(f"📼 Recorded {store.save()} ESPN responses to {directory}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='record one refresh of the configured leagues')
+    record_parser.add_argument('--dir', default=DEFAULT_FIXTURE_DIR)
+
+    synth_parser = commands.add_parser('synth', help='write synthetic football league fixtures')
+    synth_parser.add_argument('--dir', default=DEFAULT_FIXTURE_DIR)
+    synth_parser.add_argument('--leagues', type=int, default=10)
+    synth_parser.add_argument('--teams', type=int, default=10)
+    synth_parser.add_argument('--year', type=int, default=2024)
+    synth_parser.add_argument('--week', type=int, default=5)
+
+    serve_parser = commands.add_parser('serve', help='replay fixtures over HTTP')
+    serve_parser.add_argument('--dir', default=DEFAULT_FIXTURE_DIR)
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    serve_parser.add_argument('--jitter', type=float, default=0.0, help='up to this many extra seconds')
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered 503')
+    serve_parser.add_argument('--seed', type=int)
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        record(args.dir)
+    elif args.command == 'synth':
+        store = FixtureStore()
+        store.directory = args.dir
+        leagues = synthetic_leagues(args.leagues, args.year)
+        for league in leagues:
+            synthesize_league(store, league['league_id'], args.year, args.teams, args.week)
+        print(f"🧪 Wrote {store.save()} fixtures for {len(leagues)} leagues to {args.dir}")
+        print(f"FANTASY_LEAGUES={leagues_setting(leagues)}")
+    else:
+        store = FixtureStore(args.dir)
+        server = ReplayServer(store, args.host, args.port, latency=args.latency, jitter=args.jitter,
+                              error_rate=args.error_rate, seed=args.seed)
+        print(f"📼 Replaying {len(store)} ESPN responses at {server.url}")
+        print(f"Run the app with ESPN_BASE_URL={server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
+
+
+if __name__ == '__main__':
+    main()
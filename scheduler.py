@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-league refresh scheduler for Arcade Fantasy Sports Display
+Keeps a priority queue of next-due times so busy leagues refresh fast and quiet ones back off
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+
+class LeagueSchedule:
+    """Refresh state for one league"""
+
+    def __init__(self, interval, due):
+        self.interval = interval
+        self.due = due
+        self.failures = 0
+
+
+class RefreshScheduler:
+    """Priority queue of league refresh times
+
+    - A league reported active on its last refresh (scores moved, or a
+      matchup still in play) is considered live and is refreshed every
+      `live_interval` seconds.
+    - A quiet league doubles its interval after each unchanged refresh, up to
+      `idle_interval`.
+    - While pro games of a league's sport are live, hold_live() keeps it at
+      `live_interval` and pulls a backed-off league forward, so kickoff is
+      noticed within one live interval.
+    - A failing league backs off exponentially from `live_interval` up to
+      `max_backoff`.
+    """
+
+    def __init__(self, live_interval=30, idle_interval=1800, max_backoff=3600):
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.max_backoff = max_backoff
+        self._heap = []
+        self._schedules = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _push(self, key, schedule):
+        heapq.heappush(self._heap, (schedule.due, next(self._counter), key))
+
+    def sync(self, keys, now=None):
+        """Track exactly the given league keys; new leagues are due immediately"""
+        now = time.time() if now is None else now
+        keys = set(keys)
+        with self._lock:
+            for key in keys - self._schedules.keys():
+                schedule = LeagueSchedule(self.live_interval, now)
+                self._schedules[key] = schedule
+                self._push(key, schedule)
+            for key in self._schedules.keys() - keys:
+                # Stale heap entries for dropped leagues are skipped on pop
+                del self._schedules[key]
+
+    def pop_due(self, now=None):
+        """Remove and return every league key that is due at `now`"""
+        now = time.time() if now is None else now
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due_time, _, key = heapq.heappop(self._heap)
+                schedule = self._schedules.get(key)
+                if schedule is not None and schedule.due == due_time:
+                    due.append(key)
+        return due
+
+    def next_due(self):
+        """Earliest scheduled refresh time, or None if nothing is scheduled"""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def record_success(self, key, active, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            schedule = self._schedules.get(key)
+            if schedule is None:
+                return
+            schedule.failures = 0
+            if active:
+                schedule.interval = self.live_interval
+            else:
+                schedule.interval = min(schedule.interval * 2, self.idle_interval)
+            schedule.due = now + schedule.interval
+            self._push(key, schedule)
+
+    def hold_live(self, keys, now=None):
+        """Keep these leagues at the live interval, bringing later refreshes forward"""
+        now = time.time() if now is None else now
+        with self._lock:
+            for key in keys:
+                schedule = self._schedules.get(key)
+                if schedule is None or schedule.failures:
+                    continue
+                schedule.interval = self.live_interval
+                if schedule.due > now + self.live_interval:
+                    schedule.due = now + self.live_interval
+                    self._push(key, schedule)
+
+    def defer(self, key, due):
+        """Reschedule a league for a specific time without touching its interval"""
+        with self._lock:
+            schedule = self._schedules.get(key)
+            if schedule is None:
+                return
+            schedule.due = due
+            self._push(key, schedule)
+
+    def record_failure(self, key, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            schedule = self._schedules.get(key)
+            if schedule is None:
+                return
+            schedule.failures += 1
+            backoff = min(self.live_interval * (2 ** schedule.failures), self.max_backoff)
+            schedule.due = now + backoff
+            self._push(key, schedule)
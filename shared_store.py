@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Shared snapshot store for Arcade Fantasy Sports Display
+Lets several web worker processes serve data fetched by a single elected fetcher
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from snapshot import Snapshot, encode_json
+
+
+class FetcherLock:
+    """Non-blocking file lock that elects one fetcher process per host
+
+    The lock is held until release() or the end of the process; the OS
+    releases it when the fetcher exits, so another worker can take over.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def try_acquire(self):
+        if self._file is not None:
+            return True
+        lock_file = open(self.path, 'a+')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self):
+        if self._file is None:
+            return
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    @property
+    def held(self):
+        return self._file is not None
+
+
+class SharedSnapshotStore:
+    """Recent encoded snapshots in an SQLite database in WAL mode
+
+    The fetcher appends each snapshot with its diff; readers pick up new
+    versions without blocking the writer. Only the last `history_size`
+    versions are kept. Other encoded bodies only the fetcher can build
+    (matchup breakdowns, standings) are kept as named documents.
+    """
+
+    def __init__(self, path, history_size=120):
+        self.path = path
+        self.history_size = history_size
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "version INTEGER PRIMARY KEY, etag TEXT NOT NULL, "
+            "body BLOB NOT NULL, gzip_body BLOB NOT NULL, diff BLOB)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            "name TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL)"
+        )
+        connection.commit()
+        # Etags of the documents this process last wrote, loaded on first sync
+        self._document_etags = None
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def write(self, snapshot):
+        diff = encode_json(snapshot.diff) if snapshot.diff is not None else None
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO snapshots (version, etag, body, gzip_body, diff) VALUES (?, ?, ?, ?, ?)",
+                (snapshot.version, snapshot.etag, snapshot.body, snapshot.gzip_body, diff)
+            )
+            connection.execute("DELETE FROM snapshots WHERE version <= ?",
+                               (snapshot.version - self.history_size,))
+
+    def latest_version(self):
+        row = self._connection().execute("SELECT MAX(version) FROM snapshots").fetchone()
+        return row[0] or 0
+
+    def read_since(self, version):
+        """Snapshots newer than `version`, oldest first"""
+        rows = self._connection().execute(
+            "SELECT version, body, gzip_body, etag, diff FROM snapshots WHERE version > ? ORDER BY version",
+            (version,)
+        ).fetchall()
+        return [
+            Snapshot.from_encoded(row_version, bytes(body), bytes(gzip_body), etag,
+                                  json.loads(diff) if diff is not None else None)
+            for row_version, body, gzip_body, etag, diff in rows
+        ]
+
+    def sync_documents(self, documents):
+        """Make the stored documents exactly `documents` ({name: body})
+
+        Only documents whose body changed since the last sync are written,
+        and documents that are no longer present are deleted.
+        """
+        connection = self._connection()
+        if self._document_etags is None:
+            self._document_etags = dict(connection.execute("SELECT name, etag FROM documents").fetchall())
+        etags = {name: hashlib.blake2b(body, digest_size=16).hexdigest() for name, body in documents.items()}
+        changed = [(name, etag, documents[name]) for name, etag in etags.items()
+                   if self._document_etags.get(name) != etag]
+        removed = [(name,) for name in self._document_etags if name not in etags]
+        if changed or removed:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO documents (name, etag, body) VALUES (?, ?, ?)", changed)
+                connection.executemany("DELETE FROM documents WHERE name = ?", removed)
+        self._document_etags = etags
+        return len(changed) + len(removed)
+
+    def read_document(self, name):
+        """(body, etag) of a document, or None if the fetcher has not published it"""
+        row = self._connection().execute("SELECT body, etag FROM documents WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        return bytes(row[0]), row[1]
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Pre-encoded data snapshots for Arcade Fantasy Sports Display
+The updater encodes sports data once per refresh; API requests serve the cached bytes
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import deque
+
+from records import SportsDataStore, encode_json
+from views import SnapshotIndex
+
+RECORD_KEYS = ("sports", "fantasy_teams")
+
+# Filtered views cached per snapshot; further distinct queries are encoded per request
+MAX_CACHED_VIEWS = 64
+
+
+def _merge_record_diff(merged, diff):
+    for record in diff["changed"]:
+        merged["changed"][record["id"]] = record
+        merged["removed"].discard(record["id"])
+    for record_id in diff["removed"]:
+        merged["changed"].pop(record_id, None)
+        merged["removed"].add(record_id)
+
+
+def _filter_record_diff(merged, matches, in_scope=None):
+    """A merged record diff narrowed to a view
+
+    Changed records that match go out as changes. Records that may have
+    been in the view before (`in_scope`, e.g. same league but a different
+    status now) go out as removals; others were never in it and are left out.
+    """
+    changed = {}
+    removed = set(merged["removed"])
+    for record_id, record in merged["changed"].items():
+        if matches(record):
+            changed[record_id] = record
+        elif in_scope is None or in_scope(record):
+            removed.add(record_id)
+    return {"changed": changed, "removed": removed}
+
+
+class Snapshot:
+    """Immutable encoded view of one published sports_data document
+
+    `meta` holds the top-level fields other than the game and team records.
+    `diff` holds the changes from the previous version (None for the first
+    snapshot a publisher sees).
+    """
+
+    __slots__ = ('version', 'meta', 'body', 'gzip_body', 'etag', 'diff', '_deltas', '_index', '_views')
+
+    def __init__(self, version, body, meta, diff=None, gzip_body=None, etag=None):
+        self.version = version
+        self.meta = meta
+        self.body = body
+        self.gzip_body = gzip_body or gzip.compress(body, compresslevel=6, mtime=0)
+        self.etag = etag or hashlib.blake2b(body, digest_size=16).hexdigest()
+        self.diff = diff
+        # Encoded deltas keyed by the client's version, filled on first request
+        self._deltas = {}
+        # Record index for filtered views, built on publish or on first use
+        self._index = None
+        self._views = {}
+
+    @classmethod
+    def from_data(cls, version, data, diff=None):
+        """Encode a plain sports_data dict as a snapshot"""
+        data = dict(data, version=version)
+        meta = {key: value for key, value in data.items() if key not in RECORD_KEYS}
+        return cls(version, encode_json(data), meta, diff)
+
+    @classmethod
+    def from_encoded(cls, version, body, gzip_body, etag, diff=None):
+        """Rebuild a snapshot another process already encoded, without re-encoding"""
+        meta = {key: value for key, value in json.loads(body).items() if key not in RECORD_KEYS}
+        return cls(version, body, meta, diff, gzip_body=gzip_body, etag=etag)
+
+    def view(self, query):
+        """Filtered and paginated snapshot for a ViewQuery, encoded once per query"""
+        view = self._views.get(query.key)
+        if view is not None:
+            return view
+        if self._index is None:
+            self._index = SnapshotIndex.from_body(self.body)
+        view = Snapshot(self.version, self._index.encode(query, self.meta), self.meta)
+        if len(self._views) < MAX_CACHED_VIEWS:
+            self._views[query.key] = view
+        return view
+
+
+class SnapshotPublisher:
+    """Holds the current snapshot and swaps it atomically on publish
+
+    Every publish gets the next version number and records the diff against
+    the previous snapshot in a bounded history, so clients can ask for only
+    what changed since the version they already have.
+    """
+
+    def __init__(self, history_size=120):
+        self._lock = threading.Lock()
+        self._current = None
+        self._history = deque(maxlen=history_size)
+        # Typed records behind the current snapshot, updated in place
+        self._store = SportsDataStore()
+        self._store_version = None
+
+    def publish(self, data):
+        with self._lock:
+            previous = self._current
+            version = previous.version + 1 if previous else 1
+            if previous is not None and self._store_version != previous.version:
+                # The current snapshot was installed from elsewhere (disk or a
+                # shared store); load it so the diff is against what clients have
+                self._store.sync(json.loads(previous.body))
+            diff = self._store.sync(data)
+            snapshot = Snapshot(version, self._store.encode(version=version),
+                                dict(self._store.meta, version=version),
+                                diff if previous is not None else None)
+            snapshot._index = SnapshotIndex.from_store(self._store)
+            self._store_version = version
+            if previous is not None:
+                self._history.append((version, diff))
+            self._current = snapshot
+        return snapshot
+
+    def install(self, snapshot):
+        """Make an already encoded snapshot current (e.g. one read from a shared store)"""
+        with self._lock:
+            previous = self._current
+            if previous is not None and snapshot.version <= previous.version:
+                return False
+            if snapshot.diff is not None and previous is not None and snapshot.version == previous.version + 1:
+                self._history.append((snapshot.version, snapshot.diff))
+            else:
+                # A gap in versions makes older history unusable for deltas
+                self._history.clear()
+            self._current = snapshot
+        return True
+
+    def current(self):
+        return self._current
+
+    def _merged_diff(self, since, snapshot):
+        """Changes from version `since` to `snapshot` as {"sports": {sport: diff}, "fantasy_teams": diff}
+
+        Each diff maps changed record ids to records plus a set of removed
+        ids. None when the history no longer covers `since`.
+        """
+        with self._lock:
+            history = [entry for entry in self._history if entry[0] <= snapshot.version]
+        if since < snapshot.version and (not history or history[0][0] > since + 1):
+            return None
+
+        merged_sports = {}
+        merged_teams = {"changed": {}, "removed": set()}
+        for version, diff in history:
+            if version <= since:
+                continue
+            for sport, sport_diff in diff["sports"].items():
+                merged = merged_sports.setdefault(sport, {"changed": {}, "removed": set()})
+                _merge_record_diff(merged, sport_diff)
+            _merge_record_diff(merged_teams, diff["fantasy_teams"])
+        return {"sports": merged_sports, "fantasy_teams": merged_teams}
+
+    @staticmethod
+    def _encode_delta(since, snapshot, meta, merged):
+        def finish(merged):
+            return {"changed": list(merged["changed"].values()), "removed": sorted(merged["removed"])}
+
+        return encode_json({
+            "delta": True,
+            "since": since,
+            "version": snapshot.version,
+            "timestamp": meta.get("timestamp"),
+            "stale": meta.get("stale", False),
+            "leagues": meta.get("leagues"),
+            "sports": {sport: finish(sport_merged) for sport, sport_merged in merged["sports"].items()},
+            "fantasy_teams": finish(merged["fantasy_teams"])
+        })
+
+    def delta_since(self, since, snapshot=None, query=None):
+        """Encoded delta from version `since` to the given (or current) snapshot
+
+        With a ViewQuery the delta only covers that view: changed records
+        that no longer match it are sent as removed. Paginated views have
+        no deltas, since a change can move records across pages.
+
+        Returns None when the history no longer covers `since` (or it is not
+        a version this publisher produced); callers then serve the full
+        snapshot (or view) instead.
+        """
+        snapshot = snapshot or self._current
+        if snapshot is None or since > snapshot.version or (query is not None and query.limit is not None):
+            return None
+        cache_key = since if query is None else (since, query.key)
+        body = snapshot._deltas.get(cache_key)
+        if body is not None:
+            return body
+
+        merged = self._merged_diff(since, snapshot)
+        if merged is None:
+            return None
+        meta = snapshot.meta
+        if query is not None:
+            meta = query.filter_meta(meta)
+            merged = {
+                "sports": {sport: _filter_record_diff(sport_merged,
+                                                      lambda game, sport=sport: query.matches_game(sport, game))
+                           for sport, sport_merged in merged["sports"].items()
+                           if query.sports is None or sport in query.sports},
+                "fantasy_teams": _filter_record_diff(merged["fantasy_teams"], query.matches_team,
+                                                     query.team_in_scope)
+            }
+
+        body = self._encode_delta(since, snapshot, meta, merged)
+        if query is None or len(snapshot._deltas) < MAX_CACHED_VIEWS:
+            snapshot._deltas[cache_key] = body
+        return body
+
+
+def save_snapshot(snapshot, path):
+    """Atomically write a snapshot's encoded body to disk"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.snapshot-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(snapshot.body)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def load_snapshot(path):
+    """Load the last saved snapshot, marked stale, or None if there is none"""
+    try:
+        with open(path, 'rb') as snapshot_file:
+            data = json.loads(snapshot_file.read())
+    except (OSError, ValueError):
+        return None
+    version = data.pop('version', None)
+    if not isinstance(version, int):
+        return None
+    data['stale'] = True
+    return Snapshot.from_data(version, data)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Standings and power rankings for Arcade Fantasy Sports Display
+Derives each league's standings, records, points for/against ranks and power
+rankings from its built League, plus one leaderboard across all leagues, and
+recomputes only the leagues whose teams changed
+"""
+
+import hashlib
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
+
+from records import Standing, encode_json, team_record_id
+
+# Share of the power score that comes from the actual record; the rest comes
+# from the all-play record (or the points-for rank when weekly scores are unknown)
+POWER_RECORD_WEIGHT = 0.6
+
+STREAK_LETTERS = {'WIN': 'W', 'LOSS': 'L', 'TIE': 'T'}
+
+
+def team_signature(team, owner):
+    """Everything the standings read from one espn_api Team"""
+    return (
+        team.team_id,
+        team.team_name,
+        owner,
+        getattr(team, 'wins', 0),
+        getattr(team, 'losses', 0),
+        getattr(team, 'ties', 0),
+        getattr(team, 'points_for', 0),
+        getattr(team, 'points_against', 0),
+        getattr(team, 'standing', 0),
+        getattr(team, 'final_standing', 0),
+        getattr(team, 'streak_type', None),
+        getattr(team, 'streak_length', None),
+        tuple(getattr(team, 'scores', ())),
+        tuple(getattr(team, 'outcomes', ()))
+    )
+
+
+def competition_ranks(values, reverse=True):
+    """1-based ranks where equal values share a rank ("1, 2, 2, 4")"""
+    ordered = sorted(values)
+    if reverse:
+        return [len(ordered) - bisect_right(ordered, value) + 1 for value in values]
+    return [bisect_left(ordered, value) + 1 for value in values]
+
+
+def all_play_records(signatures):
+    """(wins, losses, ties) of each team had it played every other team every completed week
+
+    Weekly scores and outcomes are only known for football; other sports
+    get None.
+    """
+    weeks = max((len(signature[12]) for signature in signatures), default=0)
+    records = [[0, 0, 0] for _ in signatures]
+    played = False
+    for week in range(weeks):
+        scores = [(position, signature[12][week]) for position, signature in enumerate(signatures)
+                  if week < len(signature[13]) and signature[13][week] in ('W', 'L', 'T')
+                  and signature[12][week] is not None]
+        if len(scores) < 2:
+            continue
+        played = True
+        ordered = sorted(score for _, score in scores)
+        for position, score in scores:
+            below = bisect_left(ordered, score)
+            equal = bisect_right(ordered, score) - below - 1
+            record = records[position]
+            record[0] += below
+            record[1] += len(ordered) - below - equal - 1
+            record[2] += equal
+    if not played:
+        return [None] * len(signatures)
+    return [tuple(record) for record in records]
+
+
+def compute_standings(league_config, signatures):
+    """Standing rows of one league, in standings order
+
+    Teams are ordered by ESPN's playoff seed when the league has one, else by
+    winning percentage and points for. The power score (0-100) blends the
+    winning percentage with the all-play winning percentage, which rewards
+    high scoring regardless of schedule luck; it is comparable across
+    leagues and sports.
+    """
+    league_id = league_config['league_id']
+    rows = []
+    for signature in signatures:
+        (team_id, name, owner, wins, losses, ties, points_for, points_against,
+         standing, final_standing, streak_type, streak_length, _, _) = signature
+        games = wins + losses + ties
+        rows.append({
+            "id": team_record_id(league_id, league_config.get('sport'), league_config.get('year'), team_id),
+            "team_id": team_id,
+            "name": name,
+            "owner": owner,
+            "league": league_config.get('name'),
+            "league_id": league_id,
+            "sport": league_config.get('sport'),
+            "year": league_config.get('year'),
+            "wins": wins,
+            "losses": losses,
+            "ties": ties,
+            "win_pct": round((wins + ties / 2) / games, 3) if games else 0.0,
+            "streak": f"{STREAK_LETTERS[streak_type]}{streak_length}"
+                      if streak_type in STREAK_LETTERS and streak_length else None,
+            "points_for": round(float(points_for or 0), 2),
+            "points_against": round(float(points_against or 0), 2),
+            "seed": final_standing or standing or None
+        })
+
+    # Most points for and fewest points against rank first
+    for row, rank in zip(rows, competition_ranks([row["points_for"] for row in rows])):
+        row["points_for_rank"] = rank
+    for row, rank in zip(rows, competition_ranks([row["points_against"] for row in rows], reverse=False)):
+        row["points_against_rank"] = rank
+
+    all_play = all_play_records(signatures)
+    for row, record in zip(rows, all_play):
+        if record is not None:
+            row["all_play_wins"], row["all_play_losses"], row["all_play_ties"] = record
+            games = sum(record)
+            strength = (record[0] + record[2] / 2) / games if games else 0.0
+        elif len(rows) > 1:
+            strength = (len(rows) - row["points_for_rank"]) / (len(rows) - 1)
+        else:
+            strength = 0.0
+        row["power_score"] = round(100 * (POWER_RECORD_WEIGHT * row["win_pct"]
+                                          + (1 - POWER_RECORD_WEIGHT) * strength), 1)
+    for row, rank in zip(rows, competition_ranks([row["power_score"] for row in rows])):
+        row["power_rank"] = rank
+
+    unseeded = len(rows) + 1
+    rows.sort(key=lambda row: (row["seed"] or unseeded, -row["win_pct"], -row["points_for"]))
+    # Games back are counted from the best record, which need not hold the top seed
+    best = max((row["wins"] - row["losses"] for row in rows), default=0)
+    for position, row in enumerate(rows, start=1):
+        row["rank"] = position
+        row["games_back"] = (best - (row["wins"] - row["losses"])) / 2
+    return rows
+
+
+def standings_document_name(key):
+    """Shared store name of a league's standings, from its (league_id, sport, year) key"""
+    league_id, sport, year = key
+    return f"standings/{sport}/{league_id}/{year}"
+
+
+def power_key(standing):
+    """Sort key for power order, shared by leagues and the leaderboard"""
+    return (-standing.power_score, -standing.win_pct, -standing.points_for)
+
+
+class LeagueStandings:
+    """Standing records of one league and its cached encoded body"""
+
+    def __init__(self, league_config):
+        self.league_config = league_config
+        self.signature = None
+        self.records = {}
+        self.by_rank = []
+        self.by_power = []
+        self.body = None
+        self.etag = None
+
+    def apply(self, league_config, signature, rows):
+        self.league_config = league_config
+        self.signature = signature
+        records = {}
+        for row in rows:
+            record = self.records.get(row["id"]) or Standing(row["id"])
+            record.update(row)
+            records[row["id"]] = record
+        self.records = records
+        self.by_rank = [records[row["id"]] for row in rows]
+        self.by_power = sorted(self.by_rank, key=power_key)
+
+        # Unchanged teams keep their fragments; only the envelope is rebuilt
+        header = encode_json({"league_id": league_config['league_id'], "league": league_config.get('name'),
+                              "sport": league_config.get('sport'), "year": league_config.get('year')})
+        self.body = (header[:-1] + b',"standings":[' + b','.join(record.fragment for record in self.by_rank)
+                     + b'],"power_rankings":[' + b','.join(record.fragment for record in self.by_power) + b']}')
+        self.etag = hashlib.blake2b(self.body, digest_size=16).hexdigest()
+
+
+class StandingsBook:
+    """Standings of every tracked league plus the combined leaderboard
+
+    update() is called after each league refresh. It compares a cheap
+    signature of the league's teams with the last one and only recomputes
+    and re-encodes that league's standings when it differs, which for a
+    built league is normally once per week. The leaderboard is a merge of
+    the leagues' power-ordered lists, rebuilt lazily on the first request
+    after any league changed.
+    """
+
+    def __init__(self):
+        self._leagues = {}
+        self._order = []
+        self._leaderboard = None
+        self._lock = threading.Lock()
+
+    def update(self, key, league_config, teams, owners=None):
+        """Recompute a league's standings if its teams changed; returns True if they did"""
+        owners = owners or {}
+        signature = (league_config.get('name'),
+                     tuple(team_signature(team, owners.get(team.team_id)) for team in teams))
+        with self._lock:
+            league = self._leagues.get(key)
+            if league is not None and league.signature == signature:
+                return False
+
+        rows = compute_standings(league_config, signature[1])
+        with self._lock:
+            league = self._leagues.get(key)
+            if league is None:
+                league = self._leagues[key] = LeagueStandings(league_config)
+                self._order.append(key)
+            league.apply(league_config, signature, rows)
+            self._leaderboard = None
+        return True
+
+    def sync(self, keys):
+        """Forget leagues that are no longer configured; leaderboard follows config order"""
+        keys = list(keys)
+        with self._lock:
+            for key in set(self._leagues) - set(keys):
+                del self._leagues[key]
+                self._leaderboard = None
+            order = [key for key in keys if key in self._leagues]
+            if order != self._order:
+                self._order = order
+                self._leaderboard = None
+
+    def league(self, key):
+        """(body, etag) of one league's standings by league key, or None if it is not tracked"""
+        with self._lock:
+            league = self._leagues.get(key)
+            return (league.body, league.etag) if league is not None else None
+
+    def leaderboard(self):
+        """(body, etag) of every tracked team in power order across leagues"""
+        with self._lock:
+            if self._leaderboard is None:
+                leagues = [self._leagues[key] for key in self._order]
+                merged = heapq.merge(*(league.by_power for league in leagues), key=power_key)
+                rows = [b'{"overall_rank":%d,' % position + record.fragment[1:]
+                        for position, record in enumerate(merged, start=1)]
+                body = b'{"leagues":%d,"teams":[' % len(leagues) + b','.join(rows) + b']}'
+                self._leaderboard = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+            return self._leaderboard
+
+    def documents(self):
+        """{name: body} of the leaderboard and every league, for the shared store"""
+        documents = {"standings": self.leaderboard()[0]}
+        with self._lock:
+            for key, league in self._leagues.items():
+                documents[standings_document_name(key)] = league.body
+        return documents
+
+    def __len__(self):
+        with self._lock:
+            return len(self._leagues)
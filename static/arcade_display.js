@@ -0,0 +1,326 @@
+// Retro Arcade Fantasy Sports Display - client
+// Cards are keyed by game/team id and patched in place, so a refresh only
+// touches the text and classes that actually changed.
+
+const SPORT_SECTIONS = [
+  ["football", "🏈 NFL"],
+  ["basketball", "🏀 NBA"],
+  ["baseball", "⚾ MLB"],
+];
+
+function createElement(tag, className, text) {
+  const element = document.createElement(tag);
+  if (className) element.className = className;
+  if (text !== undefined) element.textContent = text;
+  return element;
+}
+
+// Set a card field only when its value changed since the last update
+function patch(card, key, value, apply) {
+  if (card.values[key] === value) return;
+  card.values[key] = value;
+  apply(value);
+}
+
+function setText(card, key, node, value) {
+  patch(card, key, value, (text) => {
+    node.textContent = text;
+  });
+}
+
+function setClass(card, value) {
+  patch(card, "className", value, (className) => {
+    card.root.className = className;
+  });
+}
+
+class KeyedCardList {
+  // Keeps one card element per record id inside `container`, in record order
+  constructor(container, createCard, updateCard) {
+    this.container = container;
+    this.createCard = createCard;
+    this.updateCard = updateCard;
+    this.cards = new Map();
+  }
+
+  sync(records) {
+    const ids = new Set(records.map((record) => record.id));
+    this.cards.forEach((card, id) => {
+      if (!ids.has(id)) {
+        card.root.remove();
+        this.cards.delete(id);
+      }
+    });
+
+    // Walk the existing cards in order; only cards that are new or out of
+    // place are (re)inserted
+    let next = this.container.firstChild;
+    records.forEach((record) => {
+      let card = this.cards.get(record.id);
+      if (!card) {
+        card = this.createCard();
+        this.cards.set(record.id, card);
+      }
+      this.updateCard(card, record);
+      if (card.root === next) {
+        next = next.nextSibling;
+      } else {
+        this.container.insertBefore(card.root, next);
+      }
+    });
+  }
+
+  get size() {
+    return this.cards.size;
+  }
+}
+
+class ArcadeSportsDisplay {
+  constructor(options = {}) {
+    this.sportsContent = document.getElementById("sports-content");
+    this.fantasyContent = document.getElementById("fantasy-content");
+    this.timestampElement = document.getElementById("timestamp");
+    this.updateInterval = 30000; // 30 seconds (polling fallback only)
+    this.state = null;
+    this.mounted = false;
+    // Filters from the page URL (e.g. /?league=123&sport=football) and the
+    // display profile (/d/<profile>) are passed through to the API and the
+    // stream, which then sends deltas of just that view
+    const params = new URLSearchParams(window.location.search);
+    if (document.body.dataset.profile) {
+      params.set("profile", document.body.dataset.profile);
+    }
+    this.query = params.toString() ? `?${params}` : "";
+
+    if (options.autoStart !== false) {
+      this.init();
+    }
+  }
+
+  init() {
+    if (window.EventSource) {
+      this.connectStream();
+    } else {
+      this.updateDisplay();
+      setInterval(() => this.updateDisplay(), this.updateInterval);
+    }
+    this.updateTimestamp();
+    setInterval(() => this.updateTimestamp(), 1000);
+  }
+
+  connectStream() {
+    // The browser reconnects on its own and resumes via Last-Event-ID
+    const source = new EventSource(`/api/stream${this.query}`);
+
+    source.addEventListener("snapshot", (event) => {
+      this.state = JSON.parse(event.data);
+      this.render();
+    });
+
+    source.addEventListener("delta", (event) => {
+      if (!this.state) return;
+      this.applyDelta(JSON.parse(event.data));
+      this.render();
+    });
+
+    source.onerror = (error) => {
+      console.error("Stream interrupted, reconnecting:", error);
+    };
+  }
+
+  applyDelta(delta) {
+    Object.entries(delta.sports).forEach(([sport, diff]) => {
+      const section =
+        this.state.sports[sport] || (this.state.sports[sport] = { games: [] });
+      section.games = this.patchRecords(section.games, diff);
+    });
+    this.state.fantasy_teams = this.patchRecords(
+      this.state.fantasy_teams,
+      delta.fantasy_teams
+    );
+    this.state.version = delta.version;
+    this.state.timestamp = delta.timestamp;
+    this.state.stale = delta.stale;
+    this.state.leagues = delta.leagues;
+  }
+
+  patchRecords(records, diff) {
+    const removed = new Set(diff.removed);
+    const changed = new Map(diff.changed.map((record) => [record.id, record]));
+    const patched = records
+      .filter((record) => !removed.has(record.id))
+      .map((record) => {
+        const update = changed.get(record.id);
+        changed.delete(record.id);
+        return update || record;
+      });
+    changed.forEach((record) => patched.push(record));
+    return patched;
+  }
+
+  async updateDisplay() {
+    try {
+      const response = await fetch(`/api/sports-data${this.query}`);
+      this.state = await response.json();
+      this.render();
+    } catch (error) {
+      console.error("Error fetching data:", error);
+      this.showError();
+    }
+  }
+
+  mount() {
+    // Replace the loading placeholders with the keyed card containers once
+    this.sportsContent.replaceChildren();
+    this.sportGroups = new Map();
+    SPORT_SECTIONS.forEach(([sport, title]) => {
+      const group = createElement("div", "sport-group");
+      const cards = createElement("div");
+      group.append(createElement("h3", "sport-heading", title), cards);
+      group.hidden = true;
+      this.sportsContent.appendChild(group);
+      this.sportGroups.set(sport, {
+        group,
+        list: new KeyedCardList(cards, () => this.createGameCard(), (card, game) =>
+          this.updateGameCard(card, game)
+        ),
+      });
+    });
+    this.noGames = createElement("div", "loading", "No live games currently");
+    this.sportsContent.appendChild(this.noGames);
+
+    this.fantasyContent.replaceChildren();
+    const fantasyCards = createElement("div");
+    this.noFantasy = createElement("div", "loading", "No fantasy data available");
+    this.fantasyContent.append(fantasyCards, this.noFantasy);
+    this.fantasyList = new KeyedCardList(
+      fantasyCards,
+      () => this.createFantasyCard(),
+      (card, team) => this.updateFantasyCard(card, team)
+    );
+
+    this.mounted = true;
+  }
+
+  render() {
+    if (!this.mounted) this.mount();
+    this.renderSportsData(this.state.sports);
+    this.renderFantasyData(this.state.fantasy_teams, this.state.leagues);
+  }
+
+  renderSportsData(sports) {
+    let total = 0;
+    this.sportGroups.forEach(({ group, list }, sport) => {
+      const games = (sports[sport] && sports[sport].games) || [];
+      list.sync(games);
+      group.hidden = games.length === 0;
+      total += games.length;
+    });
+    this.noGames.hidden = total > 0;
+  }
+
+  createGameCard() {
+    const card = { root: createElement("div"), values: {} };
+    const teams = createElement("div", "teams");
+    const away = createElement("div", "team");
+    const home = createElement("div", "team");
+    card.awayName = createElement("div", "team-name");
+    card.awayScore = createElement("div", "score");
+    card.homeName = createElement("div", "team-name");
+    card.homeScore = createElement("div", "score");
+    away.append(card.awayName, card.awayScore);
+    home.append(card.homeName, card.homeScore);
+    teams.append(away, createElement("div", "vs", "VS"), home);
+
+    const info = createElement("div", "game-info");
+    card.status = createElement("span");
+    card.detail = createElement("span");
+    info.append(card.status, card.detail);
+
+    card.root.append(teams, info);
+    return card;
+  }
+
+  updateGameCard(card, game) {
+    const isLive = game.status === "Live";
+    let detail = "";
+    if (game.quarter) detail += ` • ${game.quarter}`;
+    if (game.inning) detail += ` • Inning ${game.inning}`;
+    if (game.time_remaining) detail += ` • ${game.time_remaining}`;
+
+    setClass(card, isLive ? "game-card live" : "game-card");
+    setText(card, "awayName", card.awayName, game.away_team);
+    setText(card, "awayScore", card.awayScore, String(game.away_score));
+    setText(card, "homeName", card.homeName, game.home_team);
+    setText(card, "homeScore", card.homeScore, String(game.home_score));
+    setText(card, "status", card.status, game.status);
+    patch(card, "statusClass", isLive ? "status live" : "status final", (className) => {
+      card.status.className = className;
+    });
+    setText(card, "detail", card.detail, detail);
+  }
+
+  renderFantasyData(fantasyTeams, leagues) {
+    const teams = fantasyTeams || [];
+    this.fantasyList.sync(teams);
+    this.noFantasy.hidden = teams.length > 0;
+    if (teams.length === 0) {
+      // Configured leagues that have not loaded yet report why
+      const failing = (leagues || []).find((league) => league.error);
+      this.noFantasy.textContent = failing
+        ? `Waiting for ${failing.name}: ${failing.error}`
+        : leagues && leagues.length
+          ? "Loading fantasy leagues..."
+          : "No fantasy data available";
+    }
+  }
+
+  createFantasyCard() {
+    const card = { root: createElement("div"), values: {} };
+    const header = createElement("div", "team-header");
+    card.name = createElement("div", "team-name-fantasy");
+    card.league = createElement("div", "league");
+    header.append(card.name, card.league);
+
+    card.owner = createElement("div", "owner");
+    const points = createElement("div", "points-container");
+    card.points = createElement("div", "points");
+    card.opponentPoints = createElement("div", "points");
+    points.append(card.points, createElement("div", "points-vs", "vs"), card.opponentPoints);
+
+    card.opponent = createElement("div", "opponent-info");
+    card.status = createElement("div");
+
+    card.root.append(header, card.owner, points, card.opponent, card.status);
+    return card;
+  }
+
+  updateFantasyCard(card, team) {
+    const status = team.status.toLowerCase();
+    setClass(card, `fantasy-card ${status}${team.stale ? " stale" : ""}`);
+    setText(card, "name", card.name, team.name);
+    setText(card, "league", card.league, team.league);
+    setText(card, "owner", card.owner, `Owner: ${team.owner}`);
+    setText(card, "points", card.points, `${team.points.toFixed(1)} pts`);
+    setText(card, "opponentPoints", card.opponentPoints, `${team.opponent_points.toFixed(1)} pts`);
+    setText(card, "opponent", card.opponent, `vs ${team.opponent}`);
+    setText(card, "status", card.status, team.status);
+    patch(card, "statusClass", `status-fantasy ${status}`, (className) => {
+      card.status.className = className;
+    });
+  }
+
+  updateTimestamp() {
+    const now = new Date();
+    // Data restored from the previous run is shown until the first refresh
+    const stale = this.state && this.state.stale ? " • CACHED" : "";
+    this.timestampElement.textContent = now.toLocaleString() + stale;
+  }
+
+  showError() {
+    // Once cards are on screen keep showing the last good data
+    if (this.mounted) return;
+    this.sportsContent.innerHTML = '<div class="loading">Error loading data</div>';
+    this.fantasyContent.innerHTML = '<div class="loading">Error loading data</div>';
+  }
+}
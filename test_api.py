@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for API routes of Arcade Fantasy Sports Display
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from espn_api.requests.espn_requests import ESPNAccessDenied, ESPNInvalidLeague
+
+import app
+from config import Config
+from replay import FixtureStore, ReplayServer, leagues_setting, synthesize_league, synthetic_leagues
+from snapshot import SnapshotPublisher
+
+
+@pytest.fixture
+def client():
+    return app.create_app(Config({'SNAPSHOT_PATH': ''})).test_client()
+
+
+def lookup_failing_with(monkeypatch, client, error):
+    def load_league_summary(league_config):
+        raise error
+    monkeypatch.setattr(app, 'load_league_summary', load_league_summary)
+    return client.get('/api/fantasy-league/123/2024?sport=football')
+
+
+def test_unknown_league_is_not_found(monkeypatch, client):
+    response = lookup_failing_with(monkeypatch, client, ESPNInvalidLeague("League 123 does not exist"))
+    assert response.status_code == 404
+
+
+def test_private_league_is_forbidden_without_echoing_cookies(monkeypatch, client):
+    error = ESPNAccessDenied("League 123 cannot be accessed with espn_s2=secret and swid=secret")
+    response = lookup_failing_with(monkeypatch, client, error)
+    assert response.status_code == 403
+    assert b'secret' not in response.get_data()
+
+
+def test_other_lookup_errors_hide_the_exception(monkeypatch, client):
+    response = lookup_failing_with(monkeypatch, client, RuntimeError("internal detail"))
+    assert response.status_code == 500
+    assert b'internal detail' not in response.get_data()
+
+
+def test_render_benchmark_is_only_served_in_debug():
+    assert app.create_app(Config({'SNAPSHOT_PATH': '', 'DEBUG': 'True'})).test_client().get(
+        '/bench/render').status_code == 200
+    assert app.create_app(Config({'SNAPSHOT_PATH': '', 'DEBUG': 'False'})).test_client().get(
+        '/bench/render').status_code == 404
+
+
+def test_same_league_id_in_two_sports_gets_distinct_team_records():
+    def entry(name):
+        team = SimpleNamespace(team_id=1, team_name=name, owners=[])
+        return SimpleNamespace(league=SimpleNamespace(teams=[team]), matchup_index={}, teams_by_id={1: team})
+
+    football, _ = app.update_fantasy_teams({'league_id': 7, 'sport': 'football', 'year': 2025, 'name': 'F'},
+                                           entry("Football team"), [])
+    basketball, _ = app.update_fantasy_teams({'league_id': 7, 'sport': 'basketball', 'year': 2025, 'name': 'B'},
+                                             entry("Basketball team"), [])
+    assert football[0].id != basketball[0].id
+
+    publisher = SnapshotPublisher()
+    body = json.loads(publisher.publish({"sports": {}, "fantasy_teams": football + basketball}).body)
+    assert [team["name"] for team in body["fantasy_teams"]] == ["Football team", "Basketball team"]
+
+
+@pytest.fixture
+def replayed_leagues():
+    """The app set up against two synthetic leagues that are due every cycle"""
+    leagues = synthetic_leagues(2)
+    store = FixtureStore()
+    for league in leagues:
+        synthesize_league(store, league['league_id'], league['year'], 4)
+    server = ReplayServer(store).start()
+    app.create_app(Config({'FANTASY_LEAGUES': leagues_setting(leagues), 'ESPN_BASE_URL': server.url,
+                           'SNAPSHOT_PATH': '', 'UPDATE_INTERVAL': '0', 'IDLE_REFRESH_INTERVAL': '0',
+                           'FAILURE_BACKOFF_MAX': '0'}))
+    yield leagues
+    server.stop()
+
+
+def published_teams():
+    return json.loads(app.snapshot_publisher.current().body)["fantasy_teams"]
+
+
+def test_league_failing_to_convert_keeps_its_teams_stale(replayed_leagues, monkeypatch):
+    app.update_sports_data()
+    assert len(published_teams()) == 8
+
+    update_fantasy_teams = app.update_fantasy_teams
+    failing_id = replayed_leagues[0]['league_id']
+
+    def failing_for_one_league(league_config, entry, teams):
+        if league_config['league_id'] == failing_id:
+            raise ValueError("unexpected scoreboard")
+        return update_fantasy_teams(league_config, entry, teams)
+
+    monkeypatch.setattr(app, 'update_fantasy_teams', failing_for_one_league)
+    app.update_sports_data()
+    teams = published_teams()
+    assert len(teams) == 8
+    assert {team["league_id"]: team["stale"] for team in teams} == {
+        failing_id: True, replayed_leagues[1]['league_id']: False}
+
+
+def test_failed_refresh_cycle_serves_cached_teams(replayed_leagues, monkeypatch):
+    app.update_sports_data()
+
+    def fail():
+        raise RuntimeError("scores provider broke")
+
+    monkeypatch.setattr(app.scores_pipeline, 'live_sports', fail)
+    app.update_sports_data()
+    assert len(published_teams()) == 8
+
+
+def test_stream_sends_the_snapshot_then_a_delta(client):
+    response = client.get('/api/stream', buffered=False)
+    events = iter(response.response)
+    try:
+        first = next(events)
+        assert b'event: snapshot' in first
+        version = app.snapshot_publisher.current().version
+        assert first.startswith(b'id: %d\n' % version)
+
+        app.update_sports_data()
+        second = next(events)
+        assert second.startswith(b'id: %d\nevent: delta\n' % (version + 1))
+        assert json.loads(second.split(b'data: ', 1)[1])["since"] == version
+    finally:
+        response.close()
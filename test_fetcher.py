@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent league fetch engine of Arcade Fantasy Sports Display
+"""
+
+import threading
+import time
+
+from fetcher import LeagueFetcher, LeagueFetchTimeout
+
+
+def league(league_id):
+    return {'league_id': league_id, 'sport': 'football', 'year': 2025, 'name': str(league_id)}
+
+
+def test_results_come_back_in_config_order():
+    fetcher = LeagueFetcher(max_workers=4, timeout=5, cycle_timeout=5)
+
+    def fetch(config):
+        time.sleep(0.05 if config['league_id'] == 1 else 0)
+        return [config['league_id']]
+
+    results = fetcher.fetch_all([league(1), league(2), league(3)], fetch)
+    assert [result.value for result in results] == [[1], [2], [3]]
+    assert all(result.ok for result in results)
+    fetcher.shutdown()
+
+
+def test_errors_are_reported_per_league():
+    fetcher = LeagueFetcher(max_workers=2, timeout=5, cycle_timeout=5)
+
+    def fetch(config):
+        if config['league_id'] == 2:
+            raise ValueError("boom")
+        return []
+
+    results = fetcher.fetch_all([league(1), league(2)], fetch)
+    assert [result.ok for result in results] == [True, False]
+    assert isinstance(results[1].error, ValueError)
+    fetcher.shutdown()
+
+
+def test_slow_league_does_not_hold_back_the_cycle():
+    fetcher = LeagueFetcher(max_workers=4, timeout=10, cycle_timeout=0.2)
+    release = threading.Event()
+    calls = []
+
+    def fetch(config):
+        calls.append(config['league_id'])
+        if config['league_id'] == 1:
+            release.wait(5)
+        return [config['league_id']]
+
+    started = time.monotonic()
+    results = fetcher.fetch_all([league(1), league(2)], fetch)
+    assert time.monotonic() - started < 1
+    assert [result.value for result in results] == [[2]]
+
+    # Still running: the next cycle does not start it again
+    assert fetcher.fetch_all([league(1)], fetch) == []
+    assert calls.count(1) == 1
+
+    release.set()
+    assert fetcher.wait_for_late_result(5)
+    results = fetcher.fetch_all([league(2)], fetch)
+    assert [result.value for result in results] == [[1], [2]]
+    fetcher.shutdown()
+
+
+def test_league_past_its_timeout_is_reported_failed():
+    fetcher = LeagueFetcher(max_workers=2, timeout=0.1, cycle_timeout=1)
+    release = threading.Event()
+    results = fetcher.fetch_all([league(1)], lambda config: release.wait(5))
+    assert len(results) == 1
+    assert isinstance(results[0].error, LeagueFetchTimeout)
+    release.set()
+    fetcher.shutdown()
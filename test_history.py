@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the fantasy score history of Arcade Fantasy Sports Display
+"""
+
+from history import FantasyHistory, ScoreSeries
+
+WEEK = 7 * 24 * 3600
+
+
+def fill(series, seconds, step=30):
+    """Append one changing score sample every `step` seconds"""
+    for index in range(seconds // step):
+        series.append(float(index * step), float(index), 0.0)
+
+
+def test_keeps_every_sample_until_full():
+    series = ScoreSeries(8)
+    fill(series, 8 * 30)
+    assert series.to_dict()["timestamps"] == [index * 30.0 for index in range(8)]
+
+
+def test_skips_unchanged_scores():
+    series = ScoreSeries(8)
+    assert series.append(0.0, 1.0, 2.0)
+    assert not series.append(30.0, 1.0, 2.0)
+    assert series.count == 1
+
+
+def test_week_of_samples_spans_the_whole_week():
+    series = ScoreSeries(240)
+    fill(series, WEEK)
+    timestamps = series.to_dict()["timestamps"]
+    assert len(timestamps) <= 240
+    # The oldest kept sample is within one bucket of the start
+    assert timestamps[0] <= series.stride * 30
+    # The newest sample is always the last one appended
+    assert timestamps[-1] == WEEK - 30
+    # Resolution is even across the span, not concentrated at the end
+    gaps = [later - earlier for earlier, later in zip(timestamps, timestamps[1:])]
+    assert max(gaps) == series.stride * 30
+    assert sum(1 for timestamp in timestamps if timestamp < WEEK / 2) >= len(timestamps) // 2 - 1
+
+
+def test_newest_score_is_current_between_buckets():
+    series = ScoreSeries(4)
+    fill(series, 30 * 11)
+    data = series.to_dict()
+    assert data["points"][-1] == 10.0
+    assert data["timestamps"] == sorted(data["timestamps"])
+
+
+def test_history_forgets_teams_that_are_gone():
+    history = FantasyHistory(capacity=8)
+    history.record([("1-1", 1.0, 2.0), ("1-2", 3.0, 4.0)], now=0.0)
+    history.record([("1-1", 5.0, 2.0)], now=30.0)
+    assert history.get("1-2") is None
+    assert history.get("1-1")["points"] == [1.0, 5.0]
+    assert len(history) == 1
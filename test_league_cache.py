@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-league result cache and circuit breaker of Arcade Fantasy Sports Display
+"""
+
+from league_cache import CircuitBreaker, LeagueResultCache
+from records import FantasyTeam
+
+
+def team(record_id, points):
+    record = FantasyTeam(record_id)
+    record.assign(points=points)
+    return record
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for now in (0, 1):
+        breaker.record_failure(now)
+        assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure(2)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow(30)
+    assert breaker.retry_at() == 62
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure(0)
+    breaker.record_success()
+    breaker.record_failure(1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_trial_closes_or_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure(0)
+    assert breaker.allow(60)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one trial fetch while half open
+    assert not breaker.allow(61)
+
+    # A failed trial reopens the circuit for another full timeout
+    breaker.record_failure(61)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_at() == 121
+
+    assert breaker.allow(121)
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.retry_at() is None
+
+
+def test_failing_league_serves_its_last_teams_marked_stale():
+    cache = LeagueResultCache(failure_threshold=2, reset_timeout=60)
+    teams = [team("1-1", 10.0), team("1-2", 5.0)]
+    cache.record_success("a", teams, now=1000)
+    cache.record_failure("a", ValueError("boom"), now=1030)
+    assert cache.teams("a") is teams
+    assert all(record.stale for record in teams)
+    assert cache.status("a", now=1040) == {"age": 40, "stale": True, "circuit": "closed", "error": "boom"}
+
+    cache.record_failure("a", ValueError("boom"), now=1031)
+    assert not cache.allow_fetch("a", now=1032)
+    assert cache.retry_at("a") == 1091
+
+    cache.record_success("a", teams, now=1100)
+    assert not any(record.stale for record in teams)
+    assert cache.status("a", now=1100)["stale"] is False
+
+
+def test_sync_forgets_unconfigured_leagues():
+    cache = LeagueResultCache()
+    cache.record_success("a", [team("1-1", 1.0)], now=0)
+    cache.sync(["b"])
+    assert cache.teams("a") == []
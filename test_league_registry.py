@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the long-lived league registry of Arcade Fantasy Sports Display
+"""
+
+from types import SimpleNamespace
+
+from fetcher import league_config_key
+from league_registry import LeagueRegistry
+
+LEAGUE = {'league_id': 1, 'sport': 'football', 'year': 2025, 'name': 'Test League'}
+
+
+class FakeEspn:
+    """Scoreboards served to every built league, for the matchup period set here"""
+
+    def __init__(self):
+        self.matchup_period = 5
+        self.builds = 0
+
+    def scoreboard(self, params=None, headers=None):
+        return {'scoringPeriodId': self.matchup_period, 'status': {'currentMatchupPeriod': self.matchup_period},
+                'schedule': [{'id': 1, 'home': {'teamId': 1, 'totalPoints': 10.0},
+                              'away': {'teamId': 2, 'totalPoints': 8.0}, 'winner': 'UNDECIDED'}]}
+
+    def build_league(self, league_config):
+        self.builds += 1
+        return SimpleNamespace(
+            teams=[SimpleNamespace(team_id=1, team_name="One"), SimpleNamespace(team_id=2, team_name="Two")],
+            current_week=self.matchup_period, currentMatchupPeriod=self.matchup_period,
+            scoringPeriodId=self.matchup_period, finalScoringPeriod=17,
+            espn_request=SimpleNamespace(league_get=self.scoreboard))
+
+
+def test_league_is_built_once_then_only_scoreboards_refresh():
+    espn = FakeEspn()
+    registry = LeagueRegistry(espn.build_league)
+    first = registry.refresh(LEAGUE)
+    assert registry.refresh(LEAGUE) is first
+    assert espn.builds == 1
+    assert first.matchup_index[1].opponent_id == 2
+
+
+def test_matchup_period_rollover_swaps_the_league():
+    espn = FakeEspn()
+    registry = LeagueRegistry(espn.build_league)
+    before = registry.refresh(LEAGUE)
+    espn.matchup_period = 6
+    after = registry.refresh(LEAGUE)
+    assert after is not before
+    assert after.league is not before.league
+    assert after.league.currentMatchupPeriod == 6
+    assert registry.get(LEAGUE) is after
+    assert espn.builds == 2
+
+
+def test_failed_refresh_discards_the_league():
+    espn = FakeEspn()
+    registry = LeagueRegistry(espn.build_league)
+    entry = registry.refresh(LEAGUE)
+
+    def fail(params=None, headers=None):
+        raise ConnectionError("ESPN unavailable")
+
+    entry.league.espn_request.league_get = fail
+    try:
+        registry.refresh(LEAGUE)
+    except ConnectionError:
+        pass
+    assert registry.get(LEAGUE) is None
+
+
+def test_removed_config_entry_is_dropped():
+    espn = FakeEspn()
+    registry = LeagueRegistry(espn.build_league)
+    other = dict(LEAGUE, league_id=2)
+    registry.refresh(LEAGUE)
+    registry.refresh(other)
+    registry.sync([league_config_key(other)])
+    assert registry.get(LEAGUE) is None
+    assert registry.get(other) is not None
+    assert len(registry) == 1
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-demand lookup cache of Arcade Fantasy Sports Display
+"""
+
+import threading
+
+import pytest
+
+from lookup_cache import LookupCache
+
+
+def test_fresh_values_are_served_from_the_cache():
+    cache = LookupCache()
+    calls = []
+    for _ in range(3):
+        assert cache.get("a", lambda: calls.append(1) or "value") == "value"
+    assert len(calls) == 1
+    assert cache.stats["hits"] == 2
+
+
+def test_expired_values_are_loaded_again():
+    cache = LookupCache(ttl=0)
+    calls = []
+    cache.get("a", lambda: calls.append(1))
+    cache.get("a", lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LookupCache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+    assert cache.get("a", lambda: "reloaded") == 1
+    assert cache.get("b", lambda: "reloaded") == "reloaded"
+    assert cache.stats["evictions"] == 2
+
+
+def test_concurrent_misses_share_one_load():
+    cache = LookupCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get("a", load)))
+    leader.start()
+    started.wait(5)
+    waiters = [threading.Thread(target=lambda: results.append(cache.get("a", load))) for _ in range(4)]
+    for waiter in waiters:
+        waiter.start()
+    while cache.stats["coalesced"] < 4:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in [leader] + waiters:
+        thread.join(5)
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_failed_loads_are_not_cached():
+    cache = LookupCache()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get("a", fail)
+    assert cache.get("a", lambda: "value") == "value"
+    assert len(cache) == 1
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for scoreboard matchup indexing in Arcade Fantasy Sports Display
+"""
+
+from matchups import build_matchup_index
+
+
+def side(team_id, live=None, total=0.0):
+    data = {'teamId': team_id, 'totalPoints': total}
+    if live is not None:
+        data['totalPointsLive'] = live
+    return data
+
+
+SCOREBOARD = {'schedule': [
+    {'id': 10, 'home': side(1, live=101.5), 'away': side(2, live=88.0), 'winner': 'UNDECIDED'},
+    {'id': 11, 'home': side(3, total=95.0), 'away': side(4, total=120.0), 'winner': 'AWAY'},
+    {'id': 12, 'home': side(5, live=70.0), 'away': side(6, live=70.0), 'winner': 'UNDECIDED'},
+    {'id': 13, 'home': side(7, live=12.0)}
+]}
+
+
+def test_each_team_finds_its_own_matchup():
+    index = build_matchup_index(SCOREBOARD)
+    assert sorted(index) == [1, 2, 3, 4, 5, 6, 7]
+    for team_id, opponent_id, matchup_id in ((1, 2, 10), (2, 1, 10), (4, 3, 11), (6, 5, 12)):
+        assert index[team_id].opponent_id == opponent_id
+        assert index[team_id].matchup_id == matchup_id
+    assert (index[2].points, index[2].opponent_points) == (88.0, 101.5)
+
+
+def test_winner_flags_and_live_leader():
+    index = build_matchup_index(SCOREBOARD)
+    # A settled winner decides the status even without live totals
+    assert (index[3].status, index[4].status) == ("Losing", "Winning")
+    assert (index[3].points, index[4].points) == (95.0, 120.0)
+    # Undecided matchups follow the live score
+    assert (index[1].status, index[2].status) == ("Winning", "Losing")
+
+
+def test_tie():
+    index = build_matchup_index(SCOREBOARD)
+    assert index[5].status == index[6].status == "Tied"
+    tie = build_matchup_index({'schedule': [{'id': 1, 'home': side(1, total=90.0), 'away': side(2, total=80.0),
+                                             'winner': 'TIE'}]})
+    assert tie[1].status == tie[2].status == "Tied"
+
+
+def test_bye_has_no_opponent():
+    bye = build_matchup_index(SCOREBOARD)[7]
+    assert (bye.status, bye.opponent_id, bye.points, bye.opponent_points) == ("Bye", None, 12.0, 0.0)
+
+
+def test_records_are_reused_between_refreshes():
+    first = build_matchup_index(SCOREBOARD)
+    second = build_matchup_index(SCOREBOARD, previous=first)
+    assert all(second[team_id] is first[team_id] for team_id in first)
+    assert build_matchup_index(None) == {}
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental player box scores of Arcade Fantasy Sports Display
+"""
+
+import copy
+
+from players import LeaguePlayers
+
+
+def entry(player_id, points, projected, slot=2):
+    return {
+        'playerId': player_id,
+        'lineupSlotId': slot,
+        'playerPoolEntry': {
+            'appliedStatTotal': points,
+            'player': {'id': player_id, 'fullName': f"Player {player_id}", 'eligibleSlots': [2, 23],
+                       'proTeamId': 1, 'injuryStatus': 'ACTIVE',
+                       'stats': [{'scoringPeriodId': 5, 'statSourceId': 1, 'appliedTotal': projected}]}
+        }
+    }
+
+
+def scoreboard():
+    return {'scoringPeriodId': 5, 'schedule': [{
+        'id': 1, 'winner': 'UNDECIDED',
+        'home': {'teamId': 1, 'rosterForCurrentScoringPeriod': {'entries': [entry(11, 4.0, 12.0),
+                                                                             entry(12, 0.0, 9.0, slot=20)]}},
+        'away': {'teamId': 2, 'rosterForCurrentScoringPeriod': {'entries': [entry(21, 7.5, 10.0)]}}
+    }]}
+
+
+def test_unchanged_box_score_updates_nothing():
+    league = LeaguePlayers(1, 'football')
+    assert league.ingest(scoreboard()) == 3
+    revision = league.revision
+    body = league.matchup_body(1)
+    revisions = {key: line.revision for key, line in league.lines.items()}
+
+    assert league.ingest(scoreboard()) == 0
+    assert league.revision == revision
+    assert league.matchup_body(1) is body
+    assert {key: line.revision for key, line in league.lines.items()} == revisions
+
+
+def test_one_changed_stat_line_updates_only_that_player():
+    league = LeaguePlayers(1, 'football')
+    league.ingest(scoreboard())
+    lines = dict(league.lines)
+    revisions = {key: line.revision for key, line in lines.items()}
+    fragments = {key: line.fragment for key, line in lines.items()}
+
+    changed = copy.deepcopy(scoreboard())
+    changed['schedule'][0]['away']['rosterForCurrentScoringPeriod']['entries'][0][
+        'playerPoolEntry']['appliedStatTotal'] = 13.5
+    assert league.ingest(changed) == 1
+
+    assert lines[(2, 21)].points == 13.5
+    assert lines[(2, 21)].revision == revisions[(2, 21)] + 1
+    for key in ((1, 11), (1, 12)):
+        assert league.lines[key] is lines[key]
+        assert lines[key].revision == revisions[key]
+        assert lines[key].fragment is fragments[key]
+    assert b'"points":13.5' in league.matchup_body(1)
+
+
+def test_matchup_is_in_play_until_starters_reach_projections_or_it_is_decided():
+    league = LeaguePlayers(1, 'football')
+    league.ingest(scoreboard())
+    assert league.in_play()
+
+    # Only the bench player (slot 20) is short of their projection
+    finished = scoreboard()
+    finished['schedule'][0]['home']['rosterForCurrentScoringPeriod']['entries'][0] = entry(11, 12.0, 12.0)
+    finished['schedule'][0]['away']['rosterForCurrentScoringPeriod']['entries'][0] = entry(21, 11.0, 10.0)
+    league.ingest(finished)
+    assert not league.in_play()
+
+    decided = scoreboard()
+    decided['schedule'][0]['winner'] = 'HOME'
+    league.ingest(decided)
+    assert not league.in_play()
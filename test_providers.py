@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for pro sports score providers of Arcade Fantasy Sports Display
+"""
+
+import json
+import os
+
+from providers import ESPNScoreboardProvider, FixtureScoresProvider
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class FixtureResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+class FixtureSession:
+    """requests-style session answering with a saved ESPN scoreboard, 304 when revalidated"""
+
+    def __init__(self, sport):
+        with open(os.path.join(FIXTURES, 'espn_scoreboard', f'{sport}.json')) as fixture_file:
+            self.body = json.load(fixture_file)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        if (headers or {}).get('If-None-Match') == '"v1"':
+            return FixtureResponse(304)
+        return FixtureResponse(200, self.body, {'ETag': '"v1"'})
+
+
+def games_by_id(games):
+    return {game["id"]: game for game in games}
+
+
+def test_espn_football_scoreboard_normalizes_status_period_and_clock():
+    games = games_by_id(ESPNScoreboardProvider('football', 30, session=FixtureSession('football')).fetch())
+    assert games["football-401671001"] == {
+        "id": "football-401671001", "sport": "football", "home_team": "Chicago Bears",
+        "away_team": "Carolina Panthers", "home_score": 0, "away_score": 0, "status": "Scheduled",
+        "time_remaining": "10/6 - 1:00 PM EDT"}
+    live = games["football-401671002"]
+    assert (live["status"], live["quarter"], live["time_remaining"]) == ("Live", "Q3", "8:45")
+    assert (live["home_score"], live["away_score"]) == (17, 14)
+    assert games["football-401671003"]["quarter"] == "OT"
+    final = games["football-401671004"]
+    assert (final["status"], final["quarter"]) == ("Final", "Final")
+    assert "time_remaining" not in final
+
+
+def test_espn_baseball_scoreboard_reports_the_inning():
+    games = games_by_id(ESPNScoreboardProvider('baseball', 30, session=FixtureSession('baseball')).fetch())
+    live = games["baseball-401569001"]
+    assert (live["status"], live["inning"]) == ("Live", "7")
+    assert "quarter" not in live and "time_remaining" not in live
+    assert "inning" not in games["baseball-401569002"]
+
+
+def test_unchanged_espn_scoreboard_is_not_parsed_again():
+    session = FixtureSession('football')
+    provider = ESPNScoreboardProvider('football', 30, session=session)
+    assert provider.fetch()
+    assert provider.fetch() is None
+    assert session.requests[1]['If-None-Match'] == '"v1"'
+
+
+def test_fixture_provider_reads_the_sports_section_once_per_change():
+    provider = FixtureScoresProvider('football', os.path.join(FIXTURES, 'sports_scores.json'), 30)
+    games = games_by_id(provider.fetch())
+    live = games["football-sample-2"]
+    assert (live["status"], live["quarter"], live["time_remaining"]) == ("Live", "Q3", "8:45")
+    assert all(game["sport"] == "football" for game in games.values())
+    assert provider.fetch() is None
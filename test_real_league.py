@@ -12,15 +12,19 @@ from datetime import datetime
 import sys
 import os
 from dotenv import load_dotenv
+from transport import EspnTransport, build_pooled_league
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Reuse pooled connections across every league tested
+espn_transport = EspnTransport()
+
 def test_football_league(league_id, year=2024, espn_s2=None, swid=None):
     """Test NFL/Football API with real league data"""
     print(f"=== NFL/Football API Test - League ID: {league_id}, Year: {year} ===")
     try:
-        league = League(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
+        league = build_pooled_league(League, espn_transport, league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
         print(f"✅ Successfully connected to league: {league.settings.name}")
         
         # Print all available league attributes
@@ -71,7 +75,7 @@ def test_basketball_league(league_id, year=2024, espn_s2=None, swid=None):
     """Test NBA/Basketball API with real league data"""
     print(f"\n=== NBA/Basketball API Test - League ID: {league_id}, Year: {year} ===")
     try:
-        league = BasketballLeague(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
+        league = build_pooled_league(BasketballLeague, espn_transport, league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
         print(f"✅ Successfully connected to league: {league.settings.name}")
         
         # Print all available league attributes
@@ -122,7 +126,7 @@ def test_baseball_league(league_id, year=2024, espn_s2=None, swid=None):
     """Test MLB/Baseball API with real league data"""
     print(f"\n=== MLB/Baseball API Test - League ID: {league_id}, Year: {year} ===")
     try:
-        league = BaseballLeague(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
+        league = build_pooled_league(BaseballLeague, espn_transport, league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
         print(f"✅ Successfully connected to league: {league.settings.name}")
         
         # Print all available league attributes
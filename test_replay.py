@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Tests for recording and replaying ESPN responses in Arcade Fantasy Sports Display
+"""
+
+import json
+import os
+
+import app
+from replay import FixtureStore, ReplayServer, leagues_setting, record, synthesize_league, synthetic_leagues
+
+
+def test_record_waits_for_leagues_slower_than_the_cycle_timeout(tmp_path, monkeypatch):
+    # A season no other test builds, so the league registry has nothing cached for it
+    leagues = synthetic_leagues(2, year=2023)
+    store = FixtureStore()
+    for league in leagues:
+        synthesize_league(store, league['league_id'], league['year'], 4)
+    server = ReplayServer(store, latency=0.3).start()
+    try:
+        monkeypatch.setenv('FANTASY_LEAGUES', leagues_setting(leagues))
+        monkeypatch.setenv('ESPN_BASE_URL', server.url)
+        monkeypatch.setenv('SNAPSHOT_PATH', '')
+        monkeypatch.setenv('FETCH_CYCLE_TIMEOUT', '0.1')
+        record(str(tmp_path))
+    finally:
+        server.stop()
+
+    assert len(json.loads(app.snapshot_publisher.current().body)["fantasy_teams"]) == 8
+    recorded = [(tmp_path / name).read_text() for name in os.listdir(tmp_path)]
+    for league in leagues:
+        assert sum(f"leagues/{league['league_id']}" in fixture for fixture in recorded) == 3
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive refresh scheduler of Arcade Fantasy Sports Display
+"""
+
+from scheduler import RefreshScheduler
+
+
+def make_scheduler():
+    scheduler = RefreshScheduler(live_interval=30, idle_interval=1800, max_backoff=600)
+    scheduler.sync(['a', 'b'], now=0)
+    return scheduler
+
+
+def test_new_leagues_are_due_immediately_and_popped_once():
+    scheduler = make_scheduler()
+    assert sorted(scheduler.pop_due(now=0)) == ['a', 'b']
+    assert scheduler.pop_due(now=0) == []
+    assert scheduler.next_due() is None
+
+
+def test_quiet_league_backs_off_up_to_idle_interval():
+    scheduler = make_scheduler()
+    scheduler.pop_due(now=0)
+    now = 0
+    intervals = []
+    for _ in range(8):
+        scheduler.record_success('a', active=False, now=now)
+        due = scheduler.next_due()
+        intervals.append(due - now)
+        now = due
+        assert scheduler.pop_due(now=now) == ['a']
+    assert intervals[:3] == [60, 120, 240]
+    assert intervals[-1] == 1800
+
+    scheduler.record_success('a', active=True, now=now)
+    assert scheduler.next_due() == now + 30
+
+
+def test_failures_back_off_exponentially_up_to_max():
+    scheduler = make_scheduler()
+    scheduler.pop_due(now=0)
+    for failures, expected in ((1, 60), (2, 120), (3, 240), (4, 480), (5, 600)):
+        scheduler.record_failure('a', now=0)
+        assert scheduler.next_due() == expected
+        scheduler.pop_due(now=expected)
+
+
+def test_hold_live_pulls_idle_leagues_forward():
+    scheduler = make_scheduler()
+    scheduler.pop_due(now=0)
+    scheduler.record_success('a', active=False, now=0)
+    scheduler.defer('a', 1800)
+    scheduler.record_success('b', active=False, now=0)
+
+    scheduler.hold_live(['a'], now=100)
+    assert scheduler.pop_due(now=129) == ['b']
+    assert scheduler.pop_due(now=130) == ['a']
+    # Holding does not make a league due earlier than one live interval
+    scheduler.record_success('a', active=False, now=130)
+    scheduler.hold_live(['a'], now=140)
+    assert scheduler.pop_due(now=169) == []
+    assert scheduler.pop_due(now=170) == ['a']
+
+
+def test_dropped_leagues_are_never_returned():
+    scheduler = make_scheduler()
+    scheduler.sync(['a'], now=0)
+    assert scheduler.pop_due(now=0) == ['a']
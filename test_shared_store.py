@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared snapshot store of Arcade Fantasy Sports Display
+"""
+
+from shared_store import FetcherLock, SharedSnapshotStore
+from snapshot import Snapshot
+
+
+def test_fetcher_lock_elects_one_holder_until_released(tmp_path):
+    path = str(tmp_path / 'arcade.db.lock')
+    first = FetcherLock(path)
+    second = FetcherLock(path)
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert not first.held
+    assert second.try_acquire()
+    second.release()
+
+
+def test_store_returns_snapshots_newer_than_a_version(tmp_path):
+    store = SharedSnapshotStore(str(tmp_path / 'arcade.db'), history_size=2)
+    for version in (1, 2, 3):
+        store.write(Snapshot.from_data(version, {"sports": {}, "fantasy_teams": []}))
+    assert store.latest_version() == 3
+    assert [snapshot.version for snapshot in store.read_since(0)] == [2, 3]
+    assert store.read_since(3) == []
+
+
+def test_documents_are_written_only_when_changed_and_removed_when_gone(tmp_path):
+    path = str(tmp_path / 'arcade.db')
+    fetcher = SharedSnapshotStore(path)
+    follower = SharedSnapshotStore(path)
+    assert fetcher.sync_documents({"matchup/1/1": b'{"a":1}', "matchup/1/2": b'{"b":2}'}) == 2
+    assert fetcher.sync_documents({"matchup/1/1": b'{"a":1}', "matchup/1/2": b'{"b":3}'}) == 1
+    body, etag = follower.read_document("matchup/1/2")
+    assert body == b'{"b":3}' and etag
+    assert fetcher.sync_documents({"matchup/1/1": b'{"a":1}'}) == 1
+    assert follower.read_document("matchup/1/2") is None
+    # A newly elected fetcher replaces whatever the previous one left behind
+    assert SharedSnapshotStore(path).sync_documents({}) == 1
+    assert follower.read_document("matchup/1/1") is None
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for snapshot publishing and serving in Arcade Fantasy Sports Display
+"""
+
+import gzip
+import json
+
+from flask import Flask
+
+from app import snapshot_response
+from records import FantasyTeam
+from snapshot import Snapshot, SnapshotPublisher
+
+flask_app = Flask(__name__)
+
+
+def data(*teams):
+    return {"timestamp": "2025-01-01T00:00:00", "sports": {},
+            "fantasy_teams": [{"id": team_id, "points": points} for team_id, points in teams]}
+
+
+def delta(publisher, since):
+    body = publisher.delta_since(since)
+    return json.loads(body) if body is not None else None
+
+
+def test_delta_merges_changes_across_versions():
+    publisher = SnapshotPublisher()
+    publisher.publish(data(("a", 1.0), ("b", 2.0)))
+    publisher.publish(data(("a", 3.0), ("b", 2.0)))
+    publisher.publish(data(("a", 4.0), ("b", 5.0)))
+    teams = delta(publisher, 1)["fantasy_teams"]
+    assert {team["id"]: team["points"] for team in teams["changed"]} == {"a": 4.0, "b": 5.0}
+    assert teams["removed"] == []
+    assert delta(publisher, 3)["fantasy_teams"] == {"changed": [], "removed": []}
+
+
+def test_removed_then_readded_record_is_a_change():
+    publisher = SnapshotPublisher()
+    publisher.publish(data(("a", 1.0), ("b", 2.0)))
+    publisher.publish(data(("a", 1.0)))
+    assert delta(publisher, 1)["fantasy_teams"] == {"changed": [], "removed": ["b"]}
+    publisher.publish(data(("a", 1.0), ("b", 2.0)))
+    teams = delta(publisher, 1)["fantasy_teams"]
+    assert [team["id"] for team in teams["changed"]] == ["b"]
+    assert teams["removed"] == []
+
+
+def test_changed_then_removed_record_is_only_removed():
+    publisher = SnapshotPublisher()
+    publisher.publish(data(("a", 1.0), ("b", 2.0)))
+    publisher.publish(data(("a", 1.0), ("b", 3.0)))
+    publisher.publish(data(("a", 1.0)))
+    assert delta(publisher, 1)["fantasy_teams"] == {"changed": [], "removed": ["b"]}
+
+
+def test_versions_older_than_the_history_get_no_delta():
+    publisher = SnapshotPublisher(history_size=2)
+    for points in range(5):
+        publisher.publish(data(("a", float(points))))
+    assert delta(publisher, 2) is None
+    assert delta(publisher, 3) is not None
+    assert delta(publisher, 6) is None
+
+
+def test_install_keeps_history_only_for_the_next_version():
+    source = SnapshotPublisher()
+    snapshots = [source.publish(data(("a", float(points)))) for points in range(4)]
+
+    follower = SnapshotPublisher()
+    assert follower.install(snapshots[0])
+    assert follower.install(snapshots[1])
+    assert delta(follower, 1) is not None
+    # An old or repeated version is ignored
+    assert not follower.install(snapshots[1])
+    # Skipping version 3 drops the history, so no delta reaches back past the gap
+    assert follower.install(snapshots[3])
+    assert delta(follower, 1) is None
+    assert delta(follower, 4)["fantasy_teams"] == {"changed": [], "removed": []}
+
+
+def test_publish_after_install_diffs_against_the_installed_snapshot():
+    source = SnapshotPublisher()
+    source.publish(data(("a", 1.0)))
+    installed = source.publish(data(("a", 2.0)))
+
+    publisher = SnapshotPublisher()
+    publisher.install(installed)
+    publisher.publish(data(("a", 2.0), ("b", 1.0)))
+    teams = delta(publisher, 2)["fantasy_teams"]
+    assert [team["id"] for team in teams["changed"]] == ["b"]
+
+
+def test_adopted_records_are_diffed_by_revision():
+    team = FantasyTeam("a")
+    team.assign(points=1.0)
+    publisher = SnapshotPublisher()
+    publisher.publish({"sports": {}, "fantasy_teams": [team]})
+    publisher.publish({"sports": {}, "fantasy_teams": [team]})
+    assert delta(publisher, 1)["fantasy_teams"]["changed"] == []
+    team.assign(points=2.0)
+    publisher.publish({"sports": {}, "fantasy_teams": [team]})
+    assert delta(publisher, 2)["fantasy_teams"]["changed"] == [{"id": "a", "points": 2.0}]
+
+
+def snapshot():
+    return Snapshot.from_data(1, {"sports": {}, "fantasy_teams": []})
+
+
+def serve(snapshot, **headers):
+    with flask_app.test_request_context(headers=headers):
+        return snapshot_response(snapshot)
+
+
+def test_gzip_and_identity_bodies_have_different_etags():
+    current = snapshot()
+    plain = serve(current)
+    compressed = serve(current, **{'Accept-Encoding': 'gzip'})
+    assert plain.get_etag() == (current.etag, False)
+    assert compressed.get_etag() == (current.etag + '-gz', False)
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+
+
+def test_either_etag_revalidates_with_the_tag_sent():
+    current = snapshot()
+    for etag in (current.etag, current.etag + '-gz'):
+        response = serve(current, **{'Accept-Encoding': 'gzip', 'If-None-Match': f'"{etag}"'})
+        assert response.status_code == 304
+        assert response.get_etag() == (etag, False)
+
+
+def test_stale_etag_gets_the_new_body():
+    response = serve(snapshot(), **{'If-None-Match': '"old"'})
+    assert response.status_code == 200
+    assert response.get_data()
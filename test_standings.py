@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the standings and power rankings of Arcade Fantasy Sports Display
+"""
+
+import json
+from types import SimpleNamespace
+
+from standings import StandingsBook, compute_standings, competition_ranks, team_signature
+
+LEAGUE = {'league_id': 1, 'sport': 'football', 'year': 2025, 'name': 'Test League'}
+KEY = (1, 'football', 2025)
+
+
+def team(team_id, wins, losses, points_for, scores=(), outcomes=(), standing=0):
+    return SimpleNamespace(team_id=team_id, team_name=f"Team {team_id}", wins=wins, losses=losses, ties=0,
+                           points_for=points_for, points_against=100.0, standing=standing, final_standing=0,
+                           streak_type='WIN', streak_length=1, scores=list(scores), outcomes=list(outcomes))
+
+
+def test_competition_ranks_share_ties():
+    assert competition_ranks([10, 30, 30, 5]) == [3, 1, 1, 4]
+    assert competition_ranks([10, 30, 30, 5], reverse=False) == [2, 3, 3, 1]
+
+
+def test_standings_follow_seed_then_record():
+    teams = [team(1, 1, 2, 300.0), team(2, 3, 0, 250.0), team(3, 2, 1, 400.0, standing=1)]
+    rows = compute_standings(LEAGUE, [team_signature(t, None) for t in teams])
+    assert [row["team_id"] for row in rows] == [3, 2, 1]
+    assert [row["games_back"] for row in rows] == [1.0, 0.0, 2.0]
+    assert [row["points_for_rank"] for row in rows] == [1, 3, 2]
+
+
+def test_all_play_counts_completed_weeks_only():
+    teams = [team(1, 1, 0, 0, scores=[100, 0], outcomes=['W', 'U']),
+             team(2, 0, 1, 0, scores=[90, 0], outcomes=['L', 'U']),
+             team(3, 1, 0, 0, scores=[95, 0], outcomes=['W', 'U'])]
+    rows = {row["team_id"]: row for row in compute_standings(LEAGUE, [team_signature(t, None) for t in teams])}
+    assert (rows[1]["all_play_wins"], rows[1]["all_play_losses"]) == (2, 0)
+    assert (rows[2]["all_play_wins"], rows[2]["all_play_losses"]) == (0, 2)
+    assert rows[1]["power_rank"] == 1
+
+
+def test_book_recomputes_only_changed_leagues():
+    book = StandingsBook()
+    teams = [team(1, 1, 0, 100.0), team(2, 0, 1, 90.0)]
+    assert book.update(KEY, LEAGUE, teams)
+    body, etag = book.leaderboard()
+    assert not book.update(KEY, LEAGUE, teams)
+    assert book.leaderboard() == (body, etag)
+
+    teams[1].wins, teams[1].losses, teams[1].points_for = 2, 0, 120.0
+    assert book.update(KEY, LEAGUE, teams)
+    leaderboard = json.loads(book.leaderboard()[0])
+    assert [row["team_id"] for row in leaderboard["teams"]] == [2, 1]
+    assert book.league(KEY) is not None
+    assert book.league((1, 'football', 2024)) is None
+
+    book.sync([])
+    assert json.loads(book.leaderboard()[0]) == {"leagues": 0, "teams": []}
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the retry policy of the ESPN transport of Arcade Fantasy Sports Display
+"""
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+import transport
+from transport import EspnTransport
+
+URL = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl/seasons/2025/segments/0/leagues/1"
+
+
+class StubAdapter(BaseAdapter):
+    """Answers each request with the next outcome: a status code or an exception to raise"""
+
+    def __init__(self, *outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        outcome = self.outcomes[min(self.sent, len(self.outcomes) - 1)]
+        self.sent += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = requests.Response()
+        response.status_code = outcome
+        response._content = b'{}'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    waits = []
+    monkeypatch.setattr(transport.time, 'sleep', waits.append)
+    return waits
+
+
+def stub_transport(*outcomes, max_retries=2):
+    espn = EspnTransport(max_retries=max_retries, backoff=0.5, max_backoff=0.75)
+    adapter = StubAdapter(*outcomes)
+    espn.session.mount('https://', adapter)
+    return espn, adapter
+
+
+def test_server_errors_are_retried_a_bounded_number_of_times(waits):
+    espn, adapter = stub_transport(503)
+    assert espn.get(URL).status_code == 503
+    assert adapter.sent == 3
+    assert espn.snapshot_stats()['retries'] == 2
+    assert espn.snapshot_stats()['requests'] == 3
+    # Jittered waits stay under the capped exponential backoff
+    assert len(waits) == 2
+    assert 0 <= waits[0] <= 0.5 and 0 <= waits[1] <= 0.75
+
+
+def test_retry_recovers_once_the_server_answers(waits):
+    espn, adapter = stub_transport(502, 500, 200)
+    assert espn.get(URL).status_code == 200
+    assert adapter.sent == 3
+    assert espn.snapshot_stats()['errors'] == 0
+
+
+def test_connection_errors_are_retried_then_raised(waits):
+    espn, adapter = stub_transport(requests.ConnectionError("reset"), max_retries=3)
+    with pytest.raises(requests.ConnectionError):
+        espn.get(URL)
+    assert adapter.sent == 4
+    stats = espn.snapshot_stats()
+    assert stats['retries'] == 3
+    assert stats['errors'] == 1
+
+
+def test_client_errors_are_not_retried(waits):
+    for status in (401, 404):
+        espn, adapter = stub_transport(status, 200)
+        assert espn.get(URL).status_code == status
+        assert adapter.sent == 1
+        assert espn.snapshot_stats()['retries'] == 0
+    assert waits == []
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for filtered views and per-view deltas of Arcade Fantasy Sports Display
+"""
+
+import json
+
+from werkzeug.datastructures import MultiDict
+
+from snapshot import SnapshotPublisher
+from views import ViewQuery
+
+
+def data(game_status="Live", team_status="Winning", points=10.0):
+    return {
+        "timestamp": "2025-01-01T00:00:00",
+        "sports": {
+            "football": {"games": [{"id": "football-1", "home_team": "A", "away_team": "B", "home_score": 7,
+                                    "away_score": 3, "status": game_status}]},
+            "baseball": {"games": [{"id": "baseball-1", "home_team": "C", "away_team": "D", "home_score": 1,
+                                    "away_score": 0, "status": "Final"}]}
+        },
+        "fantasy_teams": [
+            {"id": "1-1", "team_id": 1, "name": "One", "points": points, "opponent_points": 5.0,
+             "status": team_status, "league_id": 1, "sport": "football"},
+            {"id": "2-1", "team_id": 1, "name": "Two", "points": 3.0, "opponent_points": 8.0,
+             "status": "Losing", "league_id": 2, "sport": "basketball"}
+        ]
+    }
+
+
+def query(**args):
+    return ViewQuery.from_args(MultiDict(args))
+
+
+def test_status_filters_games_only():
+    publisher = SnapshotPublisher()
+    view = json.loads(publisher.publish(data()).view(query(status='live')).body)
+    assert [game["id"] for game in view["sports"]["football"]["games"]] == ["football-1"]
+    assert view["sports"]["baseball"]["games"] == []
+    assert len(view["fantasy_teams"]) == 2
+
+
+def test_team_status_filters_fantasy_teams():
+    publisher = SnapshotPublisher()
+    view = json.loads(publisher.publish(data()).view(query(team_status='losing')).body)
+    assert [team["id"] for team in view["fantasy_teams"]] == ["2-1"]
+    assert len(view["sports"]["football"]["games"]) == 1
+
+
+def test_view_delta_only_covers_the_view():
+    publisher = SnapshotPublisher()
+    publisher.publish(data())
+    snapshot = publisher.publish(data(points=12.0, team_status="Winning"))
+    delta = json.loads(publisher.delta_since(1, snapshot, query(league='2')))
+    assert delta["fantasy_teams"] == {"changed": [], "removed": []}
+
+    delta = json.loads(publisher.delta_since(1, snapshot, query(league='1', sport='football')))
+    assert [team["points"] for team in delta["fantasy_teams"]["changed"]] == [12.0]
+    assert set(delta["sports"]) <= {"football"}
+
+
+def test_records_leaving_a_view_are_sent_as_removed():
+    publisher = SnapshotPublisher()
+    publisher.publish(data())
+    snapshot = publisher.publish(data(game_status="Final"))
+    delta = json.loads(publisher.delta_since(1, snapshot, query(status='live')))
+    assert delta["sports"]["football"] == {"changed": [], "removed": ["football-1"]}
+
+
+def test_paginated_views_have_no_deltas():
+    publisher = SnapshotPublisher()
+    publisher.publish(data())
+    snapshot = publisher.publish(data(points=12.0))
+    assert publisher.delta_since(1, snapshot, query(limit='1')) is None
+
+
+def test_one_league_id_in_two_sports_and_seasons_stays_apart():
+    teams = [{"id": f"{sport}-7-{year}-1", "team_id": 1, "name": f"{sport} {year}", "status": "Winning",
+              "league_id": 7, "sport": sport, "year": year}
+             for sport, year in (("football", 2025), ("basketball", 2025), ("football", 2024))]
+    snapshot = SnapshotPublisher().publish({"sports": {}, "fantasy_teams": teams})
+
+    def names(**args):
+        return [team["name"] for team in json.loads(snapshot.view(query(**args)).body)["fantasy_teams"]]
+
+    assert names(league='7') == ["football 2025", "basketball 2025", "football 2024"]
+    assert names(league='7:basketball:2025') == ["basketball 2025"]
+    profile = ViewQuery.from_args(MultiDict({'league': '7'}), leagues=['7:football:2024'])
+    assert [team["name"] for team in json.loads(snapshot.view(profile).body)["fantasy_teams"]] == ["football 2024"]
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for matchup win probabilities of Arcade Fantasy Sports Display
+"""
+
+import pytest
+
+from win_probability import WinProbabilityEngine
+
+LEAGUE = (1, 'football', 2025)
+
+
+def probabilities(winner, home, away, simulations=20000):
+    engine = WinProbabilityEngine(simulations=simulations, spread=0.6, seed=0)
+    results = engine.probabilities([(LEAGUE, winner, [(1, home), (2, away)])])
+    return results[(LEAGUE, 1)], results[(LEAGUE, 2)]
+
+
+def test_decided_matchup_is_certain():
+    assert probabilities('HOME', [(80.0, 100.0)], [(90.0, 100.0)]) == (1.0, 0.0)
+    assert probabilities('AWAY', [(90.0, 100.0)], [(80.0, 100.0)]) == (0.0, 1.0)
+    assert probabilities('TIE', [(90.0, 90.0)], [(90.0, 90.0)]) == (0.5, 0.5)
+
+
+def test_equal_projections_are_a_coin_flip():
+    starters = [(0.0, 15.0)] * 9
+    home, away = probabilities('UNDECIDED', starters, starters)
+    assert home == pytest.approx(0.5, abs=0.02)
+
+
+def test_finished_side_keeps_its_current_points():
+    # Nobody left to play on either side: the current score stands
+    assert probabilities('UNDECIDED', [(100.0, 95.0)], [(90.0, 90.0)]) == (1.0, 0.0)
+    # Home is done at 100; away needs its last starter to score over twice its
+    # remaining projection of 5, i.e. a draw above 1 + 0.6 * 1.67 standard deviations
+    home, _ = probabilities('UNDECIDED', [(100.0, 95.0)], [(90.0, 95.0)])
+    assert home == pytest.approx(0.952, abs=0.01)
+
+
+def test_probabilities_of_both_sides_sum_to_one():
+    home, away = probabilities('UNDECIDED', [(10.0, 20.0), (0.0, 12.0)], [(5.0, 25.0), (3.0, 9.0)])
+    assert 0.0 < home < 1.0
+    assert home + away == pytest.approx(1.0)
+
+
+def test_same_seed_gives_the_same_result():
+    matchup = ('UNDECIDED', [(10.0, 20.0)], [(12.0, 18.0)])
+    assert probabilities(*matchup) == probabilities(*matchup)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP transport for ESPN traffic in Arcade Fantasy Sports Display
+One pooled keep-alive session with bounded, jittered retries and response-size accounting
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from espn_api.requests.espn_requests import EspnFantasyRequests, ESPNAccessDenied, ESPNInvalidLeague, ESPNUnknownError
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class EspnTransport:
+    """Pooled requests session shared by every ESPN call
+
+    Connections are kept alive and reused across leagues and endpoints, so a
+    refresh cycle pays the TCP/TLS handshake once per pooled connection
+    rather than once per request.
+
+    With `base_url` set (e.g. http://127.0.0.1:8765 for the replay server in
+    replay.py) every request keeps its path and query but goes to that host
+    instead of ESPN.
+    """
+
+    def __init__(self, pool_size=16, max_retries=2, backoff=0.5, max_backoff=8.0, timeout=10.0, base_url=None):
+        self.base_url = urlsplit(base_url) if base_url else None
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'errors': 0, 'bytes': 0}
+
+    def _count(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                self.stats[name] += value
+
+    def _wait(self, attempt):
+        # Full jitter: spread retries so concurrent leagues do not retry in lockstep
+        time.sleep(random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt))))
+
+    def resolve(self, url):
+        """The URL a request for `url` is actually sent to"""
+        if self.base_url is None:
+            return url
+        parts = urlsplit(url)
+        return urlunsplit((self.base_url.scheme, self.base_url.netloc,
+                           self.base_url.path.rstrip('/') + parts.path, parts.query, ''))
+
+    def get(self, url, params=None, headers=None, cookies=None, timeout=None):
+        """GET with retries on connection errors, timeouts, 429 and 5xx responses"""
+        url = self.resolve(url)
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.get(url, params=params, headers=headers, cookies=cookies,
+                                            timeout=timeout or self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    self._count(requests=1, errors=1)
+                    raise
+                self._count(requests=1, retries=1)
+                self._wait(attempt)
+                continue
+
+            self._count(requests=1, bytes=len(response.content))
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                self._count(retries=1)
+                self._wait(attempt)
+                continue
+            return response
+
+    def snapshot_stats(self):
+        with self._lock:
+            return dict(self.stats)
+
+
+class PooledEspnRequests(EspnFantasyRequests):
+    """espn_api request helper that sends everything through an EspnTransport"""
+
+    @classmethod
+    def wrap(cls, espn_request, transport):
+        pooled = cls.__new__(cls)
+        pooled.__dict__.update(espn_request.__dict__)
+        pooled.transport = transport
+        return pooled
+
+    def checkRequestStatus(self, status, extend="", params=None, headers=None):
+        '''Handles ESPN API response status codes and endpoint format switching'''
+        if status == 401:
+            # Switch between the /leagueHistory/ and /seasons/ endpoint formats
+            if "/leagueHistory/" in self.LEAGUE_ENDPOINT:
+                base_endpoint = self.LEAGUE_ENDPOINT.split("/leagueHistory/")[0]
+                self.LEAGUE_ENDPOINT = f"{base_endpoint}/seasons/{self.year}/segments/0/leagues/{self.league_id}"
+            else:
+                base_endpoint = self.LEAGUE_ENDPOINT.split("/seasons/")[0]
+                self.LEAGUE_ENDPOINT = f"{base_endpoint}/leagueHistory/{self.league_id}?seasonId={self.year}"
+
+            r = self.transport.get(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, cookies=self.cookies)
+            if r.status_code == 200:
+                return r.json()
+
+            cookies = self.cookies or {}
+            raise ESPNAccessDenied(f"League {self.league_id} cannot be accessed with espn_s2={cookies.get('espn_s2')} and swid={cookies.get('SWID')}")
+
+        elif status == 404:
+            raise ESPNInvalidLeague(f"League {self.league_id} does not exist")
+
+        elif status != 200:
+            raise ESPNUnknownError(f"ESPN returned an HTTP {status}")
+
+        return None
+
+    def league_get(self, params=None, headers=None, extend=''):
+        endpoint = self.LEAGUE_ENDPOINT + extend
+        r = self.transport.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        alternate_response = self.checkRequestStatus(r.status_code, extend=extend, params=params, headers=headers)
+        response = alternate_response if alternate_response else r.json()
+
+        if self.logger:
+            self.logger.log_request(endpoint=self.LEAGUE_ENDPOINT + extend, params=params, headers=headers, response=response)
+        return response[0] if isinstance(response, list) else response
+
+    def get(self, params=None, headers=None, extend=''):
+        endpoint = self.ENDPOINT + extend
+        r = self.transport.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        self.checkRequestStatus(r.status_code)
+        response = r.json()
+
+        if self.logger:
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
+
+    def news_get(self, params=None, headers=None, extend=''):
+        endpoint = self.NEWS_ENDPOINT + extend
+        r = self.transport.get(endpoint, params=params, headers=headers, cookies=self.cookies)
+        response = r.json()
+
+        if self.logger:
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=response)
+        return response
+
+
+def build_pooled_league(league_class, transport, league_id, year, espn_s2=None, swid=None):
+    """Construct an espn_api League whose requests all go through `transport`"""
+    league = league_class(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid, fetch_league=False)
+    league.espn_request = PooledEspnRequests.wrap(league.espn_request, transport)
+    league.fetch_league()
+    return league
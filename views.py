@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Filtered views of sports data snapshots for Arcade Fantasy Sports Display
+Each snapshot is indexed once by league, sport and status; filtered payloads are
+assembled from the indexed record fragments and cached per query
+"""
+
+import json
+
+from records import encode_json
+
+
+def _csv(value):
+    """Lower-cased, de-duplicated values of a comma-separated query parameter
+
+    Returns None when the parameter is absent (no filter).
+    """
+    if not value:
+        return None
+    return tuple(sorted({part.strip().lower() for part in value.split(',') if part.strip()}))
+
+
+def league_token(league_id, sport, year):
+    """Filter value naming one sport and season of a league id ("123:football:2025")"""
+    return f"{league_id}:{sport}:{year}".lower()
+
+
+def league_tokens(league_id, sport, year):
+    """Values a league= filter can match a team or league status by
+
+    The bare league id matches every sport and season tracked under it;
+    league_token() picks one of them.
+    """
+    if league_id is None:
+        return ()
+    return (str(league_id).lower(), league_token(league_id, sport, year))
+
+
+class ViewQuery:
+    """Normalized filter and page parameters of an /api/sports-data request
+
+    `statuses` filters games (live, final, scheduled) and `team_statuses`
+    fantasy teams (winning, losing, tied, bye). A filter of None matches
+    everything; an empty tuple matches nothing.
+    """
+
+    __slots__ = ('leagues', 'sports', 'statuses', 'team_statuses', 'page', 'limit')
+
+    def __init__(self, leagues=None, sports=None, statuses=None, page=1, limit=None, team_statuses=None):
+        self.leagues = leagues
+        self.sports = sports
+        self.statuses = statuses
+        self.team_statuses = team_statuses
+        self.limit = limit if limit and limit > 0 else None
+        self.page = max(1, page or 1) if self.limit else 1
+
+    @classmethod
+    def from_args(cls, args, leagues=None):
+        """Parse request args; returns None when the request has no filters
+
+        `leagues` restricts the view to those league_token()s (a display
+        profile); a league= parameter can only narrow it further.
+        """
+        requested = _csv(args.get('league'))
+        if leagues is not None:
+            allowed = {str(league).lower() for league in leagues}
+            if requested is not None:
+                allowed = {token for token in allowed if token in requested or token.split(':')[0] in requested}
+            requested = tuple(sorted(allowed))
+        query = cls(requested, _csv(args.get('sport')), _csv(args.get('status')),
+                    args.get('page', type=int), args.get('limit', type=int), _csv(args.get('team_status')))
+        filters = (query.leagues, query.sports, query.statuses, query.team_statuses)
+        if all(value is None for value in filters) and query.limit is None:
+            return None
+        return query
+
+    @property
+    def key(self):
+        return (self.leagues, self.sports, self.statuses, self.team_statuses, self.page, self.limit)
+
+    def to_dict(self):
+        return {
+            "league": self.leagues,
+            "sport": self.sports,
+            "status": self.statuses,
+            "team_status": self.team_statuses,
+            "page": self.page,
+            "limit": self.limit
+        }
+
+    @staticmethod
+    def _allows(values, value):
+        return values is None or (value is not None and str(value).lower() in values)
+
+    def matches_game(self, sport, game):
+        return self._allows(self.sports, sport) and self._allows(self.statuses, game.get("status"))
+
+    def _allows_league(self, record):
+        tokens = league_tokens(record.get("league_id"), record.get("sport"), record.get("year"))
+        return self.leagues is None or any(token in self.leagues for token in tokens)
+
+    def team_in_scope(self, team):
+        """Whether a team's league and sport, which never change, belong to the view"""
+        return self._allows_league(team) and self._allows(self.sports, team.get("sport"))
+
+    def matches_team(self, team):
+        return self.team_in_scope(team) and self._allows(self.team_statuses, team.get("status"))
+
+    def filter_meta(self, meta):
+        """Snapshot metadata with the league status list narrowed to the view's leagues"""
+        if self.leagues is None or "leagues" not in meta or meta["leagues"] is None:
+            return meta
+        return dict(meta, leagues=[league for league in meta["leagues"] if self._allows_league(league)])
+
+    def paginate(self, positions):
+        if self.limit is None:
+            return positions
+        start = (self.page - 1) * self.limit
+        return positions[start:start + self.limit]
+
+
+class SnapshotIndex:
+    """Positions of a snapshot's games and teams grouped by league, sport and status
+
+    Games are (sport, status, fragment) and teams (league_tokens(), sport,
+    status, fragment) in snapshot order; the index maps each value to the sorted
+    positions that have it, so a filter only touches matching records.
+    """
+
+    def __init__(self, sports, games, teams):
+        self.sports = sports
+        self.games = games
+        self.teams = teams
+        self.games_by_sport = self._group(games, 0)
+        self.games_by_status = self._group(games, 1)
+        self.teams_by_league = {}
+        for position, team in enumerate(teams):
+            for token in team[0]:
+                self.teams_by_league.setdefault(token, []).append(position)
+        self.teams_by_sport = self._group(teams, 1)
+        self.teams_by_status = self._group(teams, 2)
+
+    @staticmethod
+    def _group(rows, column):
+        groups = {}
+        for position, row in enumerate(rows):
+            if row[column] is not None:
+                groups.setdefault(row[column], []).append(position)
+        return groups
+
+    @staticmethod
+    def _key(value):
+        return str(value).lower() if value is not None else None
+
+    @classmethod
+    def from_store(cls, store):
+        """Index the records of a SportsDataStore using their cached fragments"""
+        sports = sorted(store.games)
+        games = [(sport, cls._key(game.status), game.fragment)
+                 for sport in sports for game in store.games[sport]]
+        teams = [(league_tokens(team.league_id, team.sport, team.year), cls._key(team.sport),
+                  cls._key(team.status), team.fragment)
+                 for team in store.teams]
+        return cls(sports, games, teams)
+
+    @classmethod
+    def from_body(cls, body):
+        """Index an encoded snapshot body (one installed from disk or a shared store)"""
+        data = json.loads(body)
+        sports = sorted(data.get("sports", {}))
+        games = [(sport, cls._key(game.get("status")), encode_json(game))
+                 for sport in sports for game in data["sports"][sport].get("games", [])]
+        teams = [(league_tokens(team.get("league_id"), team.get("sport"), team.get("year")),
+                  cls._key(team.get("sport")), cls._key(team.get("status")), encode_json(team))
+                 for team in data.get("fantasy_teams", [])]
+        return cls(sports, games, teams)
+
+    @staticmethod
+    def _match(total, groups):
+        """Positions present in every (index, values) group; all positions if no groups"""
+        selected = None
+        for index, values in groups:
+            positions = set()
+            for value in values:
+                positions.update(index.get(value, ()))
+            selected = positions if selected is None else selected & positions
+        return list(range(total)) if selected is None else sorted(selected)
+
+    def select(self, query):
+        """Matching game and team positions for a query, before pagination"""
+        game_filters = []
+        team_filters = []
+        if query.sports is not None:
+            game_filters.append((self.games_by_sport, query.sports))
+            team_filters.append((self.teams_by_sport, query.sports))
+        if query.statuses is not None:
+            game_filters.append((self.games_by_status, query.statuses))
+        if query.team_statuses is not None:
+            team_filters.append((self.teams_by_status, query.team_statuses))
+        if query.leagues is not None:
+            team_filters.append((self.teams_by_league, query.leagues))
+        return self._match(len(self.games), game_filters), self._match(len(self.teams), team_filters)
+
+    def encode(self, query, meta):
+        """Filtered document as compact JSON with sorted keys"""
+        game_positions, team_positions = self.select(query)
+        meta = dict(query.filter_meta(meta), filter=query.to_dict(), total_games=len(game_positions),
+                    total_teams=len(team_positions))
+
+        games_by_sport = {sport: [] for sport in self.sports if query.sports is None or sport in query.sports}
+        for position in query.paginate(game_positions):
+            sport, _, fragment = self.games[position]
+            games_by_sport[sport].append(fragment)
+
+        parts = []
+        for key in sorted(set(meta) | {"sports", "fantasy_teams"}):
+            if key == "sports":
+                value = b'{' + b','.join(
+                    encode_json(sport) + b':{"games":[' + b','.join(fragments) + b']}'
+                    for sport, fragments in sorted(games_by_sport.items())
+                ) + b'}'
+            elif key == "fantasy_teams":
+                value = b'[' + b','.join(self.teams[position][3]
+                                         for position in query.paginate(team_positions)) + b']'
+            else:
+                value = encode_json(meta[key])
+            parts.append(encode_json(key) + b':' + value)
+        return b'{' + b','.join(parts) + b'}'
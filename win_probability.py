@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Win probabilities for Arcade Fantasy Sports Display
+Monte Carlo simulation of the starters' remaining points for every live matchup
+of every league at once, as one batched NumPy matrix product
+"""
+
+import numpy as np
+
+# Default cap on simulated margins held at once (float32: 4M values = 16 MB)
+CHUNK_VALUES = 4_000_000
+
+
+class WinProbabilityEngine:
+    """Win probability of each side of every current matchup
+
+    Each starter still expected to score (projection above current points)
+    adds a remaining score drawn from a normal distribution around the rest
+    of its projection, with a standard deviation of `spread` times that
+    remainder, clipped at zero. A starter at or above its projection is
+    treated as finished. A side wins a simulation when its current points
+    plus simulated remaining points are higher; ties count half.
+
+    Because every player's deviation is the same fraction of its mean, a
+    remaining score is the player's mean times one draw of
+    max(1 + spread * Z, 0). One (players, simulations) block of such draws
+    is shared by all matchups: row i is the i-th player of each matchup, so
+    players within a matchup stay independent. The simulated margins of all
+    matchups are then one matrix product of signed player means with that
+    block, computed in chunks of matchups so memory stays bounded. Results
+    are cached until the inputs' revision changes, and a fixed seed keeps
+    repeated runs on the same inputs identical.
+    """
+
+    def __init__(self, simulations=10000, spread=0.6, seed=0, chunk_values=CHUNK_VALUES):
+        self.simulations = max(1, int(simulations))
+        self.spread = spread
+        self.seed = seed
+        self.chunk_values = chunk_values
+        self._revision = None
+        self._results = {}
+
+    def probabilities(self, matchups, revision=None):
+        """{(league, team_id): win probability} for (league, winner, sides) matchups
+
+        `league` is any key naming the league (the app uses its config key,
+        which tells apart sports and seasons of one league id). `sides` lists (team_id, [(points, projected_points), ...]) for each
+        team's starters. Decided matchups get 1, 0 or 0.5 without
+        simulating, as do matchups where no starter has points left to
+        score; byes get no probability. With a `revision`, results for
+        the same revision are returned from cache.
+        """
+        if revision is not None and revision == self._revision:
+            return self._results
+
+        results = {}
+        live = []
+        for league, winner, sides in matchups:
+            if len(sides) != 2:
+                continue
+            (home_id, home), (away_id, away) = sides
+            remaining = [[projected - points for points, projected in starters
+                          if projected is not None and projected > points] for starters in (home, away)]
+            margin = sum(points for points, _ in home) - sum(points for points, _ in away)
+            if winner not in ('HOME', 'AWAY', 'TIE') and (remaining[0] or remaining[1]):
+                live.append((league, home_id, away_id, margin, remaining[0], remaining[1]))
+                continue
+            if winner in ('HOME', 'AWAY', 'TIE'):
+                home_probability = 0.5 if winner == 'TIE' else float(winner == 'HOME')
+            else:
+                # Nothing left to play: the current score stands
+                home_probability = 0.5 if margin == 0 else float(margin > 0)
+            results[(league, home_id)] = home_probability
+            results[(league, away_id)] = 1.0 - home_probability
+
+        if live:
+            results.update(self._simulate(live))
+
+        self._revision = revision
+        self._results = results
+        return results
+
+    def _simulate(self, live):
+        # Signed remaining means: home players positive, away players negative
+        width = max(len(home) + len(away) for _, _, _, _, home, away in live)
+        means = np.zeros((len(live), width), dtype=np.float32)
+        margins = np.empty(len(live), dtype=np.float32)
+        for row, (_, _, _, margin, home, away) in enumerate(live):
+            means[row, :len(home)] = home
+            means[row, len(home):len(home) + len(away)] = [-value for value in away]
+            margins[row] = margin
+
+        rng = np.random.default_rng(self.seed)
+        outcomes = rng.standard_normal((width, self.simulations), dtype=np.float32)
+        outcomes *= np.float32(self.spread)
+        outcomes += np.float32(1.0)
+        np.maximum(outcomes, 0.0, out=outcomes)
+
+        wins = np.empty(len(live))
+        chunk = max(1, self.chunk_values // self.simulations)
+        for first in range(0, len(live), chunk):
+            last = min(first + chunk, len(live))
+            simulated = means[first:last] @ outcomes
+            simulated += margins[first:last, None]
+            wins[first:last] = (np.count_nonzero(simulated > 0, axis=1)
+                                + 0.5 * np.count_nonzero(simulated == 0, axis=1)) / self.simulations
+
+        results = {}
+        for (league, home_id, away_id, _, _, _), home_probability in zip(live, wins):
+            results[(league, home_id)] = float(home_probability)
+            results[(league, away_id)] = 1.0 - float(home_probability)
+        return results
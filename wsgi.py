@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for Arcade Fantasy Sports Display
+Run under a multi-process server with SHARED_STORE_PATH set, e.g.
+    SHARED_STORE_PATH=/tmp/arcade.db gunicorn -w 4 --threads 128 wsgi:app
+Every open /api/stream holds a thread, so workers x threads caps the number
+of connected displays; see "Multiple Worker Processes" in the README.
+Do not use --preload: each worker must start its own updater thread.
+"""
+
+from app import create_app, start_background_updater
+
+app = create_app()
+start_background_updater()